@@ -12,16 +12,19 @@ from rbnics.backends.abstract.copy import copy
 from rbnics.backends.abstract.eigen_solver import EigenSolver
 from rbnics.backends.abstract.evaluate import evaluate
 from rbnics.backends.abstract.export import export
+from rbnics.backends.abstract.factorized_linear_solver import FactorizedLinearSolver
 from rbnics.backends.abstract.function import Function
 from rbnics.backends.abstract.functions_list import FunctionsList
 from rbnics.backends.abstract.gram_schmidt import GramSchmidt
 from rbnics.backends.abstract.high_order_proper_orthogonal_decomposition import HighOrderProperOrthogonalDecomposition
 from rbnics.backends.abstract.import_ import import_
+from rbnics.backends.abstract.kkt_linear_solver import KKTLinearSolver
 from rbnics.backends.abstract.linear_program_solver import LinearProgramSolver
 from rbnics.backends.abstract.linear_solver import LinearProblemWrapper, LinearSolver
 from rbnics.backends.abstract.matrix import Matrix
 from rbnics.backends.abstract.max import max
 from rbnics.backends.abstract.mesh_motion import MeshMotion
+from rbnics.backends.abstract.nested_linear_solver import NestedLinearSolver
 from rbnics.backends.abstract.non_affine_expansion_storage import NonAffineExpansionStorage
 from rbnics.backends.abstract.nonlinear_solver import NonlinearProblemWrapper, NonlinearSolver
 from rbnics.backends.abstract.parametrized_expression_factory import ParametrizedExpressionFactory
@@ -52,17 +55,20 @@ __all__ = [
     "EigenSolver",
     "evaluate",
     "export",
+    "FactorizedLinearSolver",
     "Function",
     "FunctionsList",
     "GramSchmidt",
     "HighOrderProperOrthogonalDecomposition",
     "import_",
+    "KKTLinearSolver",
     "LinearProblemWrapper",
     "LinearProgramSolver",
     "LinearSolver",
     "Matrix",
     "max",
     "MeshMotion",
+    "NestedLinearSolver",
     "NonAffineExpansionStorage",
     "NonlinearProblemWrapper",
     "NonlinearSolver",
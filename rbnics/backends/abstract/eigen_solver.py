@@ -16,6 +16,10 @@ class EigenSolver(object, metaclass=ABCMeta):
     def set_parameters(self, parameters):
         pass
 
+    @abstractmethod
+    def set_initial_space(self, initial_space):
+        pass
+
     @abstractmethod
     def solve(self, n_eigs=None):
         pass
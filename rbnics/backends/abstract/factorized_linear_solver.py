@@ -0,0 +1,21 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from rbnics.utils.decorators import ABCMeta, AbstractBackend, abstractmethod
+
+
+@AbstractBackend
+class FactorizedLinearSolver(object, metaclass=ABCMeta):
+    def __init__(self, lhs, bcs=None):
+        pass
+
+    @abstractmethod
+    def set_parameters(self, parameters):
+        pass
+
+    @abstractmethod
+    def solve(self, solution, rhs, bcs=None):
+        pass
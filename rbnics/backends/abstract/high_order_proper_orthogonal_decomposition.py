@@ -31,6 +31,13 @@ class HighOrderProperOrthogonalDecomposition(object, metaclass=ABCMeta):
     def apply(self, Nmax, tol):
         pass
 
+    # Compute the full eigendecomposition of the snapshots correlation matrix, without truncation.
+    # Output argument is an object which provides POD modes (and operators projected on them)
+    # for any number of POD modes
+    @abstractmethod
+    def decompose(self):
+        pass
+
     @abstractmethod
     def print_eigenvalues(self, N=None):
         pass
@@ -0,0 +1,22 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from rbnics.utils.decorators import ABCMeta, AbstractBackend, abstractmethod
+
+
+@AbstractBackend
+class KKTLinearSolver(object, metaclass=ABCMeta):
+    def __init__(self, problem_wrapper, solution, state_components=None, control_components=None,
+                 adjoint_components=None, factorizations=None):
+        pass
+
+    @abstractmethod
+    def set_parameters(self, parameters):
+        pass
+
+    @abstractmethod
+    def solve(self):
+        pass
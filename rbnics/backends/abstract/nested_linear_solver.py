@@ -0,0 +1,25 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from rbnics.utils.decorators import ABCMeta, AbstractBackend, abstractmethod
+
+
+@AbstractBackend
+class NestedLinearSolver(object, metaclass=ABCMeta):
+    def __init__(self, problem_wrapper, solution):
+        pass
+
+    @abstractmethod
+    def set_parameters(self, parameters):
+        pass
+
+    @abstractmethod
+    def solve(self):
+        pass
+
+    @abstractmethod
+    def solve_nested(self, solution):
+        pass
@@ -12,6 +12,14 @@ class ParametrizedExpressionFactory(object, metaclass=ABCMeta):
     def __init__(self, expression):
         pass
 
+    @abstractmethod
+    def auxiliary_problems_and_components(self):
+        """
+        Return the set of (problem, component) whose solutions are involved in the expression,
+        or None if there are no such problems.
+        """
+        pass
+
     @abstractmethod
     def create_interpolation_locations_container(self):
         pass
@@ -32,6 +40,22 @@ class ParametrizedExpressionFactory(object, metaclass=ABCMeta):
     def create_POD_container(self):
         pass
 
+    def evaluate_for_parameters(self, mus, times=None):
+        """
+        Evaluate the expression for all parameters in mus (and, possibly, the corresponding times) at once,
+        returning a list of snapshots. Return None if such a block evaluation is not available, in which case
+        the expression has to be evaluated one parameter at a time.
+        """
+        return None
+
+    def evaluate_for_parameters_at(self, mus, at, times=None):
+        """
+        Evaluate the expression for all parameters in mus (and, possibly, the corresponding times) at once,
+        only at the interpolation locations at, returning a 2D array with a row for each location and a column
+        for each parameter. Return None if such a block evaluation is not available.
+        """
+        return None
+
     def interpolation_method_name(self):
         return "EIM"
 
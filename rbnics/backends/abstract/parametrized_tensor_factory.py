@@ -12,6 +12,14 @@ class ParametrizedTensorFactory(object, metaclass=ABCMeta):
     def __init__(self, tensor):
         pass
 
+    @abstractmethod
+    def auxiliary_problems_and_components(self):
+        """
+        Return the set of (problem, component) whose solutions are involved in the tensor,
+        or None if there are no such problems.
+        """
+        pass
+
     @abstractmethod
     def create_interpolation_locations_container(self):
         pass
@@ -32,6 +40,14 @@ class ParametrizedTensorFactory(object, metaclass=ABCMeta):
     def create_POD_container(self):
         pass
 
+    def evaluate_for_parameters(self, mus, times=None):
+        """
+        Assemble the tensor for all parameters in mus (and, possibly, the corresponding times) at once, returning
+        a list of snapshots. Return None if such a block evaluation is not available, in which case the tensor
+        has to be assembled one parameter at a time.
+        """
+        return None
+
     def interpolation_method_name(self):
         return "DEIM"
 
@@ -12,6 +12,14 @@ class TimeQuadrature(object, metaclass=ABCMeta):
     def __init__(self, time_interval, function_over_time):
         pass
 
+    @abstractmethod
+    def set_parameters(self, parameters):
+        pass
+
     @abstractmethod
     def integrate(self):
         pass
+
+    @abstractmethod
+    def integrate_inner_product(self, inner_product):
+        pass
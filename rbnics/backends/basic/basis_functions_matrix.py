@@ -179,7 +179,8 @@ def BasisFunctionsMatrix(backend, wrapping, online_backend, online_wrapping):
                 # only once at the end
                 assert hasattr(functions_list, "enrich_patch")
                 functions_list.enrich_patch.unpatch()
-                # Load each component
+                # Load each component. Only the number of basis functions is read here, while basis functions
+                # are read from file when first required (e.g. to reconstruct a truth solution)
                 return_value_component = functions_list.load(directory, filename_and_component(component_name))
                 return_value = return_value and return_value_component
                 # Populate component length
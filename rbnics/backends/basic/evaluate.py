@@ -51,6 +51,10 @@ def evaluate(backend, wrapping, online_backend, online_wrapping):
         def __call__(self, tensors_list, at):
             out_size = len(at.get_dofs_list())
             out = online_backend.OnlineMatrix(out_size, out_size)
+            if tensors_list._values is not None:
+                # Read entries directly from the stored values, rather than creating a copy of each tensor
+                out[:, :] = tensors_list._values.evaluate_at_dofs(at.get_dofs_list())
+                return out
             for (j, tensor_j) in enumerate(tensors_list):
                 evaluate_tensor_j = self.__call__(tensor_j, at)
                 for (i, out_ij) in enumerate(evaluate_tensor_j):
@@ -5,12 +5,16 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 import os
+from itertools import count
 from numbers import Number
 from rbnics.backends.abstract import FunctionsList as AbstractFunctionsList
 from rbnics.utils.cache import Cache
 from rbnics.utils.decorators import dict_of, list_of, overload, ThetaType, tuple_of
 from rbnics.utils.mpi import parallel_io
 
+# Versions are unique among all functions lists, so that a version never identifies two different contents
+_versions = count()
+
 
 def FunctionsList(backend, wrapping, online_backend, online_wrapping,
                   AdditionalIsFunction=None, ConvertAdditionalFunctionTypes=None):
@@ -25,6 +29,27 @@ def FunctionsList(backend, wrapping, online_backend, online_wrapping,
             raise NotImplementedError("Please implement conversion of additional function types")
         ConvertAdditionalFunctionTypes = _ConvertAdditionalFunctionTypes
 
+    class _LazyFunction(object):
+        """
+        Placeholder for a function stored in a file, which is only read the first time it is required.
+        Reading the file may be collective over the communicator of the function space (e.g. with dolfin):
+        in parallel, every process must thus access lazily loaded functions in the same order, as otherwise
+        processes would wait indefinitely for each other.
+        """
+
+        def __init__(self, space, directory, filename):
+            self.space = space
+            self.directory = directory
+            self.filename = filename
+            self._function = None
+
+        def __call__(self):
+            if self._function is None:
+                function = backend.Function(self.space)
+                wrapping.function_load(function, self.directory, self.filename)
+                self._function = function
+            return self._function
+
     class _FunctionsList(AbstractFunctionsList):
         def __init__(self, space, component):
             if component is None:
@@ -32,12 +57,14 @@ def FunctionsList(backend, wrapping, online_backend, online_wrapping,
             else:
                 self.space = wrapping.get_function_subspace(space, component)
             self.mpi_comm = wrapping.get_mpi_comm(space)
-            self._list = list()  # of functions
+            self._list = list()  # of functions, or of _LazyFunction if they have not been read from file yet
             self._precomputed_slices = Cache()  # from tuple to FunctionsList
+            self._version = next(_versions)  # updated every time the stored functions change
 
         def enrich(self, functions, component=None, weights=None, copy=True):
             # Append to storage
             self._enrich(functions, component, weights, copy)
+            self._version = next(_versions)
             # Reset precomputed slices
             self._precomputed_slices = Cache()
             # Prepare trivial precomputed slice
@@ -95,28 +122,38 @@ def FunctionsList(backend, wrapping, online_backend, online_wrapping,
 
         def clear(self):
             self._list = list()
+            self._version = next(_versions)
             # Reset precomputed slices
             self._precomputed_slices.clear()
 
         def save(self, directory, filename):
-            self._save_Nmax(directory, filename)
-            for (index, function) in enumerate(self._list):
+            # The length file is written last, so that an interrupted save never advertises missing functions
+            for (index, function) in enumerate(self):
                 wrapping.function_save(function, directory, filename + "_" + str(index))
+            self._save_Nmax(directory, filename)
 
         def _save_Nmax(self, directory, filename):
             def save_Nmax_task():
-                with open(os.path.join(str(directory), filename + ".length"), "w") as length:
+                length_filename = os.path.join(str(directory), filename + ".length")
+                with open(length_filename + ".tmp", "w") as length:
                     length.write(str(len(self._list)))
+                os.replace(length_filename + ".tmp", length_filename)
             parallel_io(save_Nmax_task, self.mpi_comm)
 
         def load(self, directory, filename):
             if len(self._list) > 0:  # avoid loading multiple times
                 return False
             Nmax = self._load_Nmax(directory, filename)
-            for index in range(Nmax):
-                function = backend.Function(self.space)
-                wrapping.function_load(function, directory, filename + "_" + str(index))
-                self.enrich(function)
+            # Functions are only read from file when they are first accessed, since most online computations
+            # never require them. Files are however required to exist already now, so that missing files are
+            # reported here rather than at a later (possibly collective) access
+            self._check_files(directory, filename, Nmax)
+            self._list = [_LazyFunction(self.space, directory, filename + "_" + str(index)) for index in range(Nmax)]
+            self._version = next(_versions)
+            # Reset precomputed slices
+            self._precomputed_slices = Cache()
+            # Prepare trivial precomputed slice
+            self._precomputed_slices[0, len(self._list)] = self
             return True
 
         def _load_Nmax(self, directory, filename):
@@ -125,6 +162,20 @@ def FunctionsList(backend, wrapping, online_backend, online_wrapping,
                     return int(length.readline())
             return parallel_io(load_Nmax_task, self.mpi_comm)
 
+        def _check_files(self, directory, filename, Nmax):
+            def missing_indices_task():
+                # Files of the index-th function are named filename_index, followed by either an extension
+                # or a further suffix (e.g. for components)
+                available_indices = set()
+                for file_ in os.listdir(str(directory)):
+                    if file_.startswith(filename + "_"):
+                        available_indices.add(file_[len(filename) + 1:].split(".")[0].split("_")[0])
+                return [index for index in range(Nmax) if str(index) not in available_indices]
+            missing_indices = parallel_io(missing_indices_task, self.mpi_comm)
+            if len(missing_indices) > 0:
+                raise OSError("Missing files for functions " + str(missing_indices) + " of "
+                              + os.path.join(str(directory), filename))
+
         @overload(online_backend.OnlineMatrix.Type(), )
         def __mul__(self, other):
             return wrapping.functions_list_mul_online_matrix(self, other, type(self))
@@ -142,7 +193,11 @@ def FunctionsList(backend, wrapping, online_backend, online_wrapping,
 
         @overload(int)
         def __getitem__(self, key):
-            return self._list[key]
+            function = self._list[key]
+            if isinstance(function, _LazyFunction):
+                function = function()
+                self._list[key] = function
+            return function
 
         @overload(slice)  # e.g. key = :N, return the first N functions
         def __getitem__(self, key):
@@ -176,16 +231,18 @@ def FunctionsList(backend, wrapping, online_backend, online_wrapping,
         @overload(int, backend.Function.Type())
         def __setitem__(self, key, item):
             self._list[key] = item
+            self._version = next(_versions)
 
         @overload(int, object)
         def __setitem__(self, key, item):
             if AdditionalIsFunction(item):
                 item = ConvertAdditionalFunctionTypes(item)
                 self._list[key] = item
+                self._version = next(_versions)
             else:
                 raise RuntimeError("Invalid function provided to FunctionsList.__setitem__()")
 
         def __iter__(self):
-            return self._list.__iter__()
+            return (self[index] for index in range(len(self._list)))
 
     return _FunctionsList
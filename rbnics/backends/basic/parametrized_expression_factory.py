@@ -28,8 +28,7 @@ def ParametrizedExpressionFactory(backend, wrapping):
         def __hash__(self):
             return hash((self._expression, self._space, self._inner_product))
 
-        def create_interpolation_locations_container(self):
-            # Populate auxiliary_problems_and_components
+        def auxiliary_problems_and_components(self):
             visited = set()
             auxiliary_problems_and_components = set()  # of (problem, component)
             for node in wrapping.expression_iterator(self._expression):
@@ -57,6 +56,10 @@ def ParametrizedExpressionFactory(backend, wrapping):
                         visited.add(parent_node)
             if len(auxiliary_problems_and_components) == 0:
                 auxiliary_problems_and_components = None
+            return auxiliary_problems_and_components
+
+        def create_interpolation_locations_container(self):
+            auxiliary_problems_and_components = self.auxiliary_problems_and_components()
             # Create reduced vertices container
             return backend.ReducedVertices(
                 self._space, auxiliary_problems_and_components=auxiliary_problems_and_components)
@@ -32,8 +32,7 @@ def ParametrizedTensorFactory(backend, wrapping):
         def __hash__(self):
             return hash((self._form, self._spaces))
 
-        def create_interpolation_locations_container(self, **kwargs):
-            # Populate auxiliary_problems_and_components
+        def auxiliary_problems_and_components(self):
             visited = set()
             auxiliary_problems_and_components = set()  # of (problem, component)
             for node in wrapping.form_iterator(self._form, "nodes"):
@@ -61,6 +60,10 @@ def ParametrizedTensorFactory(backend, wrapping):
                         visited.add(parent_node)
             if len(auxiliary_problems_and_components) == 0:
                 auxiliary_problems_and_components = None
+            return auxiliary_problems_and_components
+
+        def create_interpolation_locations_container(self, **kwargs):
+            auxiliary_problems_and_components = self.auxiliary_problems_and_components()
             # Create reduced mesh
             assert "auxiliary_problems_and_components" not in kwargs
             kwargs["auxiliary_problems_and_components"] = auxiliary_problems_and_components
@@ -37,6 +37,16 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
         # the tensor one.
 
         def apply(self, Nmax, tol):
+            result = self.decompose()
+            N = result.number_of_modes(Nmax, tol)
+            return (self.eigenvalues[:N], result.eigenvectors(N), result.modes(N), N)
+
+        def decompose(self):
+            """
+            Compute the full eigendecomposition of the correlation matrix of the snapshots, and return it
+            wrapped in an object which provides POD modes (and operators projected on them) for any number of
+            modes, so that several truncations can be compared without repeating the eigendecomposition.
+            """
             inner_product = self.inner_product
             snapshots_matrix = self.snapshots_matrix
             transpose = backend.transpose
@@ -46,9 +56,7 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
             else:
                 correlation = transpose(snapshots_matrix) * snapshots_matrix
 
-            basis_functions = BasisContainerType(self.space, *self.args)
-
-            eigensolver = online_backend.OnlineEigenSolver(basis_functions, correlation)
+            eigensolver = online_backend.OnlineEigenSolver(BasisContainerType(self.space, *self.args), correlation)
             parameters = {
                 "problem_type": "hermitian",
                 "spectrum": "largest real"
@@ -57,8 +65,7 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
             eigensolver.solve()
 
             Neigs = len(self.snapshots_matrix)
-            Nmax = min(Nmax, Neigs)
-            assert len(self.eigenvalues) == 0
+            self.eigenvalues = ExportableList("text")
             for i in range(Neigs):
                 (eig_i_real, eig_i_complex) = eigensolver.get_eigenvalue(i)
                 assert isclose(eig_i_complex, 0.)
@@ -66,30 +73,14 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
 
             total_energy = compute_total_energy([abs(e) for e in self.eigenvalues])
             retained_energy = compute_retained_energy([abs(e) for e in self.eigenvalues])
-            assert len(self.retained_energy) == 0
+            self.retained_energy = ExportableList("text")
             if total_energy > 0.:
                 self.retained_energy.extend([retained_energy_i / total_energy
                                              for retained_energy_i in retained_energy])
             else:
                 self.retained_energy.extend([1. for _ in range(Neigs)])  # trivial case, all snapshots are zero
 
-            eigenvectors = list()
-            for N in range(Nmax):
-                (eigvector, _) = eigensolver.get_eigenvector(N)
-                eigenvectors.append(eigvector)
-                b = self.snapshots_matrix * eigvector
-                if inner_product is not None:
-                    norm_b = sqrt(transpose(b) * inner_product * b)
-                else:
-                    norm_b = sqrt(transpose(b) * b)
-                if norm_b != 0.:
-                    b /= norm_b
-                basis_functions.enrich(b)
-                if tol > 0. and self.retained_energy[N] > 1. - tol:
-                    break
-            N += 1
-
-            return (self.eigenvalues[:N], eigenvectors, basis_functions, N)
+            return _ProperOrthogonalDecompositionResult(self, eigensolver)
 
         def print_eigenvalues(self, N=None):
             if N is None:
@@ -103,4 +94,98 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
         def save_retained_energy_file(self, output_directory, retained_energy_file):
             self.retained_energy.save(output_directory, retained_energy_file)
 
+    class _ProperOrthogonalDecompositionResult(object):
+        """
+        Eigendecomposition of the correlation matrix of the snapshots stored in a POD object. POD modes are
+        computed only when first required, and then reused for every truncation. Results are valid as long as
+        the snapshots stored in the POD object are not changed.
+        """
+
+        def __init__(self, POD, eigensolver):
+            self.POD = POD
+            self.eigenvalues = POD.eigenvalues
+            self.retained_energy = POD.retained_energy
+            self._eigensolver = eigensolver
+            self._eigenvectors = list()
+            self._modes = list()
+            self._projected_operators = dict()  # from ids of the operators to a tuple (operators, N, projections)
+
+        def number_of_modes(self, Nmax, tol):
+            """
+            Return the number of modes which is required to retain a fraction 1 - tol of the energy,
+            but not larger than Nmax. A non positive tolerance only enforces the bound on Nmax.
+            """
+            Nmax = min(Nmax, len(self.eigenvalues))
+            if tol > 0.:
+                for N in range(Nmax):
+                    if self.retained_energy[N] > 1. - tol:
+                        return N + 1
+            return Nmax
+
+        def eigenvectors(self, N):
+            """
+            Return a list of the first N eigenvectors.
+            """
+            self._compute_modes(N)
+            return self._eigenvectors[:N]
+
+        def modes(self, N):
+            """
+            Return a new basis container storing the first N POD modes.
+            """
+            self._compute_modes(N)
+            modes = BasisContainerType(self.POD.space, *self.POD.args)
+            for mode in self._modes[:N]:
+                modes.enrich(mode)
+            return modes
+
+        def project(self, operators, N):
+            """
+            Return the projection of the terms of an affine expansion (a tuple of either matrices or vectors) on
+            the first N POD modes, as an online affine expansion storage. The projection is carried out only if
+            a projection on at least N modes was not computed already, and is sliced otherwise.
+            """
+            operators = tuple(operators)
+            assert len(operators) > 0
+            if isinstance(operators[0], backend.Matrix.Type()):
+                assert all(isinstance(operator, backend.Matrix.Type()) for operator in operators)
+                slice_ = (slice(None, N), slice(None, N))
+            else:
+                assert all(isinstance(operator, backend.Vector.Type()) for operator in operators)
+                slice_ = slice(None, N)
+            key = tuple(id(operator) for operator in operators)
+            if key in self._projected_operators:
+                (_, projected_N, projected_operators) = self._projected_operators[key]
+                if projected_N >= N:
+                    return projected_operators[slice_]
+            modes = self.modes(N)
+            transpose = backend.transpose
+            projected_operators = online_backend.OnlineAffineExpansionStorage(len(operators))
+            for (q, operator) in enumerate(operators):
+                if isinstance(operator, backend.Matrix.Type()):
+                    projected_operators[q] = transpose(modes) * operator * modes
+                else:
+                    projected_operators[q] = transpose(modes) * operator
+            # Store operators as well, so that their ids are not reused as long as the projection is stored
+            self._projected_operators[key] = (operators, N, projected_operators)
+            return projected_operators
+
+        def _compute_modes(self, N):
+            inner_product = self.POD.inner_product
+            snapshots_matrix = self.POD.snapshots_matrix
+            transpose = backend.transpose
+
+            assert N <= len(self.eigenvalues)
+            for n in range(len(self._modes), N):
+                (eigvector, _) = self._eigensolver.get_eigenvector(n)
+                self._eigenvectors.append(eigvector)
+                b = snapshots_matrix * eigvector
+                if inner_product is not None:
+                    norm_b = sqrt(transpose(b) * inner_product * b)
+                else:
+                    norm_b = sqrt(transpose(b) * b)
+                if norm_b != 0.:
+                    b /= norm_b
+                self._modes.append(b)
+
     return _ProperOrthogonalDecompositionBase
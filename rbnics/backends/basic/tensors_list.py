@@ -19,43 +19,63 @@ def TensorsList(backend, wrapping, online_backend, online_wrapping):
             self.empty_tensor = empty_tensor
             self.mpi_comm = wrapping.get_mpi_comm(space)
             self._list = list()  # of tensors
+            self._values = None  # shared sparsity pattern storage, used in place of self._list if available
+            self._init_values()
             self._precomputed_slices = Cache()  # from tuple to TensorsList
 
+        def _init_values(self):
+            # Backends may store tensors which share the same sparsity pattern as a dense array of their values
+            if hasattr(wrapping, "TensorValuesArray"):
+                self._values = wrapping.TensorValuesArray(self.mpi_comm)
+            else:
+                self._values = None
+
         def enrich(self, tensors):
             # Append to storage
             self._enrich(tensors)
             # Reset precomputed slices
             self._precomputed_slices.clear()
             # Prepare trivial precomputed slice
-            self._precomputed_slices[0, len(self._list)] = self
+            self._precomputed_slices[0, len(self)] = self
 
         @overload((backend.Matrix.Type(), backend.Vector.Type()), )
         def _enrich(self, tensors):
-            self._list.append(wrapping.tensor_copy(tensors))
+            self._enrich_tensor(tensors)
 
         @overload(lambda cls: cls, )
         def _enrich(self, tensors):
             for tensor in tensors:
-                self._list.append(wrapping.tensor_copy(tensor))
+                self._enrich_tensor(tensor)
+
+        def _enrich_tensor(self, tensor):
+            if self._values is not None:
+                if self._values.append(tensor):
+                    return
+                else:
+                    # Sparsity pattern is not shared: fall back to storing a list of tensors
+                    self._list = [self._values[index] for index in range(len(self._values))]
+                    self._values = None
+            self._list.append(wrapping.tensor_copy(tensor))
 
         def clear(self):
             self._list = list()
+            self._init_values()
             # Reset precomputed slices
             self._precomputed_slices.clear()
 
         def save(self, directory, filename):
             self._save_Nmax(directory, filename)
-            for (index, tensor) in enumerate(self._list):
+            for (index, tensor) in enumerate(self):
                 wrapping.tensor_save(tensor, directory, filename + "_" + str(index))
 
         def _save_Nmax(self, directory, filename):
             def save_Nmax_task():
                 with open(os.path.join(str(directory), filename + ".length"), "w") as length:
-                    length.write(str(len(self._list)))
+                    length.write(str(len(self)))
             parallel_io(save_Nmax_task, self.mpi_comm)
 
         def load(self, directory, filename):
-            if len(self._list) > 0:  # avoid loading multiple times
+            if len(self) > 0:  # avoid loading multiple times
                 return False
             Nmax = self._load_Nmax(directory, filename)
             for index in range(Nmax):
@@ -72,39 +92,55 @@ def TensorsList(backend, wrapping, online_backend, online_wrapping):
 
         @overload(online_backend.OnlineFunction.Type(), )
         def __mul__(self, other):
-            return wrapping.tensors_list_mul_online_function(self, other)
+            if self._values is not None:
+                return self._values * other
+            else:
+                return wrapping.tensors_list_mul_online_function(self, other)
 
         def __len__(self):
-            return len(self._list)
+            if self._values is not None:
+                return len(self._values)
+            else:
+                return len(self._list)
 
         @overload(int)
         def __getitem__(self, key):
-            return self._list[key]
+            if self._values is not None:
+                return self._values[key]
+            else:
+                return self._list[key]
 
         @overload(slice)  # e.g. key = :N, return the first N tensors
         def __getitem__(self, key):
             if key.start is not None:
                 start = key.start
                 assert start >= 0
-                assert start < len(self._list)
+                assert start < len(self)
             else:
                 start = 0
             assert key.step is None
             if key.stop is not None:
                 stop = key.stop
                 assert stop > 0
-                assert stop <= len(self._list)
+                assert stop <= len(self)
             else:
-                stop = len(self._list)
+                stop = len(self)
 
             if (start, stop) not in self._precomputed_slices:
                 output = _TensorsList.__new__(type(self), self.space, self.empty_tensor)
                 output.__init__(self.space, self.empty_tensor)
-                output._list = self._list[key]
+                if self._values is not None:
+                    output._values = self._values[key]
+                else:
+                    output._list = self._list[key]
+                    output._values = None
                 self._precomputed_slices[start, stop] = output
             return self._precomputed_slices[start, stop]
 
         def __iter__(self):
-            return self._list.__iter__()
+            if self._values is not None:
+                return (self._values[index] for index in range(len(self._values)))
+            else:
+                return self._list.__iter__()
 
     return _TensorsList
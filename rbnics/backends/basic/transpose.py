@@ -564,9 +564,16 @@ def TensorsList_Transpose(backend, wrapping, online_backend, online_wrapping,
             assert len(self.tensors_list) == len(other_tensors_list)
             dim = len(self.tensors_list)
             output = online_backend.OnlineMatrix(dim, dim)
-            for i in range(dim):
-                for j in range(dim):
-                    output[i, j] = self._transpose(self.tensors_list[i]) * other_tensors_list[j]
+            if self.tensors_list._values is not None and other_tensors_list._values is not None:
+                # Compute all inner products at once from the values of tensors sharing their sparsity pattern
+                inner = self.tensors_list._values.inner(other_tensors_list._values)
+                for i in range(dim):
+                    for j in range(dim):
+                        output[i, j] = inner[i, j]
+            else:
+                for i in range(dim):
+                    for j in range(dim):
+                        output[i, j] = self._transpose(self.tensors_list[i]) * other_tensors_list[j]
             logger.log(DEBUG, "End T^T S")
             return output
 
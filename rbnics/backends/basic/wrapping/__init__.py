@@ -43,6 +43,7 @@ from rbnics.backends.basic.wrapping.tensor_copy import tensor_copy
 from rbnics.backends.basic.wrapping.tensor_load import tensor_load
 from rbnics.backends.basic.wrapping.tensor_save import tensor_save
 from rbnics.backends.basic.wrapping.tensors_list_mul import tensors_list_mul_online_function
+from rbnics.backends.basic.wrapping.time_quadrature_weights import time_quadrature_weights
 from rbnics.backends.basic.wrapping.vector_mul import vector_mul_vector
 
 __all__ = [
@@ -84,6 +85,7 @@ __all__ = [
     "tensor_load",
     "tensor_save",
     "tensors_list_mul_online_function",
+    "time_quadrature_weights",
     "vector_mul_vector",
     "vectorized_matrix_inner_vectorized_matrix"
 ]
@@ -0,0 +1,55 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import arange, full, zeros
+from scipy.integrate import newton_cotes
+try:
+    from scipy.integrate import simpson as simps
+except ImportError:
+    from scipy.integrate import simps
+from rbnics.utils.cache import Cache
+
+
+def time_quadrature_weights(n_times, time_step_size, rule):
+    """
+    Return the weights w such that the integral over time of a quantity sampled at n_times equispaced times
+    is approximated by the sum over k of w[k] times the k-th sample. Available rules are "trapezoidal",
+    "simpson" (as in scipy, also for an even number of samples) and "boole" (composite Newton-Cotes of order
+    four, which requires n_times - 1 to be a multiple of four).
+    """
+    assert n_times > 1
+    key = (n_times, time_step_size, rule)
+    try:
+        return _time_quadrature_weights_cache[key]
+    except KeyError:
+        if rule == "trapezoidal":
+            weights = full(n_times, time_step_size)
+            weights[0] /= 2.
+            weights[-1] /= 2.
+        elif rule == "simpson":
+            # Weights are obtained by integrating each sample separately, since the rule is linear in the samples.
+            # Columns of the identity are processed in chunks, not to allocate a (n_times x n_times) array
+            weights = zeros(n_times)
+            for start in range(0, n_times, _chunk_size):
+                stop = min(start + _chunk_size, n_times)
+                samples = zeros((n_times, stop - start))
+                samples[arange(start, stop), arange(stop - start)] = 1.
+                weights[start:stop] = simps(samples, dx=time_step_size, axis=0)
+        elif rule == "boole":
+            if (n_times - 1) % 4 != 0:
+                raise ValueError("Boole rule requires the number of time intervals to be a multiple of four")
+            (newton_cotes_weights, _) = newton_cotes(4, 1)
+            weights = zeros(n_times)
+            for start in range(0, n_times - 1, 4):
+                weights[start:start + 5] += newton_cotes_weights * time_step_size
+        else:
+            raise ValueError("Invalid time quadrature rule")
+        _time_quadrature_weights_cache[key] = weights
+        return weights
+
+
+_chunk_size = 256
+_time_quadrature_weights_cache = Cache()
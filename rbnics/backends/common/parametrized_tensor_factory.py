@@ -14,6 +14,9 @@ class ParametrizedTensorFactory(AbstractParametrizedTensorFactory):
     def __init__(self, scalar):
         AbstractParametrizedTensorFactory.__init__(self, scalar)
 
+    def auxiliary_problems_and_components(self):
+        return None
+
     def create_interpolation_locations_container(self):
         raise RuntimeError("This method should have never been called.")
 
@@ -5,28 +5,65 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from numbers import Number
-try:
-    from scipy.integrate import simpson as simps
-except ImportError:
-    from scipy.integrate import simps
+from numpy import asarray, einsum, ndarray as array
 from rbnics.backends.abstract import TimeQuadrature as AbstractTimeQuadrature
+from rbnics.backends.basic.wrapping import time_quadrature_weights
 from rbnics.backends.common.time_series import TimeSeries
 from rbnics.utils.decorators import backend_for, list_of, tuple_of, overload
 
 
-@backend_for("common", inputs=(tuple_of(Number), (list_of(Number), TimeSeries)))
+@backend_for("common", inputs=(tuple_of(Number), (list_of(Number), TimeSeries, array)))
 def TimeQuadrature(time_interval, function_over_time):
     return _TimeQuadrature(time_interval, function_over_time)
 
 
-class TimeQuadrature_Numbers(AbstractTimeQuadrature):
+class _TimeQuadrature_Base(AbstractTimeQuadrature):
     def __init__(self, time_interval, function_over_time):
-        assert len(function_over_time) > 1
-        self._time_step_size = (time_interval[1] - time_interval[0]) / (len(function_over_time) - 1)
+        self._time_step_size = (time_interval[1] - time_interval[0]) / (function_over_time.shape[-1] - 1)
         self._function_over_time = function_over_time
+        self._rule = "simpson"
+
+    def set_parameters(self, parameters):
+        for (key, value) in parameters.items():
+            if key == "rule":
+                self._rule = value
+            else:
+                raise ValueError("Invalid paramater passed to TimeQuadrature object.")
+
+    def integrate(self):
+        return self._function_over_time.dot(self._get_weights())
+
+    def _get_weights(self):
+        return time_quadrature_weights(self._function_over_time.shape[-1], self._time_step_size, self._rule)
+
+
+class TimeQuadrature_Numbers(_TimeQuadrature_Base):
+    def __init__(self, time_interval, function_over_time):
+        assert len(function_over_time) > 1
+        _TimeQuadrature_Base.__init__(self, time_interval, asarray(function_over_time, dtype=float))
 
     def integrate(self):
-        return simps(self._function_over_time, dx=self._time_step_size)
+        return float(_TimeQuadrature_Base.integrate(self))
+
+    def integrate_inner_product(self, inner_product):
+        assert isinstance(inner_product, Number)
+        return float((inner_product * self._function_over_time**2).dot(self._get_weights()))
+
+
+class TimeQuadrature_Array(_TimeQuadrature_Base):
+    """
+    Quadrature of a stacked array, either of truth or of reduced dofs, with one column per time.
+    """
+
+    def __init__(self, time_interval, function_over_time):
+        assert len(function_over_time.shape) == 2
+        assert function_over_time.shape[1] > 1
+        _TimeQuadrature_Base.__init__(self, time_interval, function_over_time)
+
+    def integrate_inner_product(self, inner_product):
+        norms_squared_over_time = einsum(
+            "ij,ij->j", self._function_over_time, asarray(inner_product).dot(self._function_over_time))
+        return float(norms_squared_over_time.dot(self._get_weights()))
 
 
 @overload
@@ -34,6 +71,11 @@ def _TimeQuadrature(time_interval: tuple_of(Number), function_over_time: list_of
     return TimeQuadrature_Numbers(time_interval, function_over_time)
 
 
+@overload
+def _TimeQuadrature(time_interval: tuple_of(Number), function_over_time: array):
+    return TimeQuadrature_Array(time_interval, function_over_time)
+
+
 @overload
 def _TimeQuadrature(time_interval: tuple_of(Number), time_series: TimeSeries):
     from rbnics.backends import TimeQuadrature
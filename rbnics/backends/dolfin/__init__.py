@@ -13,6 +13,7 @@ from rbnics.backends.dolfin.copy import copy
 from rbnics.backends.dolfin.eigen_solver import EigenSolver
 from rbnics.backends.dolfin.evaluate import evaluate
 from rbnics.backends.dolfin.export import export
+from rbnics.backends.dolfin.factorized_linear_solver import FactorizedLinearSolver
 from rbnics.backends.dolfin.function import Function
 from rbnics.backends.dolfin.functions_list import FunctionsList
 from rbnics.backends.dolfin.gram_schmidt import GramSchmidt
@@ -58,6 +59,7 @@ __all__ = [
     "EigenSolver",
     "evaluate",
     "export",
+    "FactorizedLinearSolver",
     "Function",
     "FunctionsList",
     "GramSchmidt",
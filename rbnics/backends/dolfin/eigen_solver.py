@@ -9,16 +9,85 @@ try:
     from ufl_legacy import Form
 except ImportError:
     from ufl import Form
-from dolfin import (__version__ as dolfin_version, as_backend_type, assemble, compile_cpp_code, DirichletBC,
-                    Function, FunctionSpace, PETScMatrix, PETScVector, SLEPcEigenSolver)
+from dolfin import (__version__ as dolfin_version, as_backend_type, assemble, DirichletBC, Function, FunctionSpace,
+                    PETScMatrix, PETScVector, SLEPcEigenSolver)
 from rbnics.backends.dolfin.evaluate import evaluate
 from rbnics.backends.dolfin.matrix import Matrix
 from rbnics.backends.dolfin.parametrized_tensor_factory import ParametrizedTensorFactory
+from rbnics.backends.dolfin.wrapping.compile_cpp_code import compile_cpp_code, register_cpp_code
 from rbnics.backends.dolfin.wrapping.dirichlet_bc import ProductOutputDirichletBC
 from rbnics.backends.abstract import EigenSolver as AbstractEigenSolver
 from rbnics.utils.decorators import BackendFor, dict_of, list_of, overload
 
 
+_set_linear_solver_cpp_code = register_cpp_code("""
+    #include <pybind11/pybind11.h>
+    #include <dolfin/la/PETScLUSolver.h> // defines PCFactorSetMatSolverType macro for PETSc <= 3.8
+    #include <dolfin/la/SLEPcEigenSolver.h>
+
+    void throw_error(PetscErrorCode ierr, std::string reason);
+
+    void set_linear_solver(std::shared_ptr<dolfin::SLEPcEigenSolver> eigen_solver, std::string lu_method)
+    {
+        ST st;
+        KSP ksp;
+        PC pc;
+        PetscErrorCode ierr;
+
+        ierr = EPSGetST(eigen_solver->eps(), &st);
+        if (ierr != 0) throw_error(ierr, "EPSGetST");
+        ierr = STGetKSP(st, &ksp);
+        if (ierr != 0) throw_error(ierr, "STGetKSP");
+        ierr = KSPGetPC(ksp, &pc);
+        if (ierr != 0) throw_error(ierr, "KSPGetPC");
+
+        ierr = STSetType(st, STSINVERT);
+        if (ierr != 0) throw_error(ierr, "STSetType");
+        ierr = KSPSetType(ksp, KSPPREONLY);
+        if (ierr != 0) throw_error(ierr, "KSPSetType");
+        ierr = PCSetType(pc, PCLU);
+        if (ierr != 0) throw_error(ierr, "PCSetType");
+
+        ierr = PCFactorSetMatSolverType(pc, lu_method.c_str());
+        if (ierr != 0) throw_error(ierr, "PCFactorSetMatSolverType");
+    }
+
+    void throw_error(PetscErrorCode ierr, std::string reason)
+    {
+        throw std::runtime_error("Error in set_linear_solver: reason " + reason
+                                 + ",error code " + std::to_string(ierr));
+    }
+
+    PYBIND11_MODULE(SIGNATURE, m)
+    {
+        m.def("set_linear_solver", &set_linear_solver);
+    }
+""")
+
+_get_eigen_pair_cpp_code = register_cpp_code("""
+    #include <pybind11/pybind11.h>
+    #include <dolfin/la/PETScVector.h>
+    #include <dolfin/la/SLEPcEigenSolver.h>
+
+    void get_eigen_pair(std::shared_ptr<dolfin::SLEPcEigenSolver> eigen_solver,
+                        std::shared_ptr<dolfin::PETScVector> condensed_real_vector,
+                        std::shared_ptr<dolfin::PETScVector> condensed_imag_vector,
+                        std::size_t i)
+    {
+        const PetscInt ii = static_cast<PetscInt>(i);
+        double real_value;
+        double imag_value;
+        EPSGetEigenpair(eigen_solver->eps(), ii, &real_value, &imag_value, condensed_real_vector->vec(),
+                        condensed_imag_vector->vec());
+    }
+
+    PYBIND11_MODULE(SIGNATURE, m)
+    {
+        m.def("get_eigen_pair", &get_eigen_pair);
+    }
+""")
+
+
 @BackendFor("dolfin", inputs=(FunctionSpace, (Form, Matrix.Type(), ParametrizedTensorFactory),
                               (Form, Matrix.Type(), ParametrizedTensorFactory, None),
                               (list_of(DirichletBC), ProductOutputDirichletBC, dict_of(str, list_of(DirichletBC)),
@@ -100,52 +169,7 @@ class EigenSolver(AbstractEigenSolver):
         return mat, PETScMatrix(condensed_mat)
 
     def set_parameters(self, parameters):
-        # Helper functions
-        cpp_code = """
-            #include <pybind11/pybind11.h>
-            #include <dolfin/la/PETScLUSolver.h> // defines PCFactorSetMatSolverType macro for PETSc <= 3.8
-            #include <dolfin/la/SLEPcEigenSolver.h>
-
-            void throw_error(PetscErrorCode ierr, std::string reason);
-
-            void set_linear_solver(std::shared_ptr<dolfin::SLEPcEigenSolver> eigen_solver, std::string lu_method)
-            {
-                ST st;
-                KSP ksp;
-                PC pc;
-                PetscErrorCode ierr;
-
-                ierr = EPSGetST(eigen_solver->eps(), &st);
-                if (ierr != 0) throw_error(ierr, "EPSGetST");
-                ierr = STGetKSP(st, &ksp);
-                if (ierr != 0) throw_error(ierr, "STGetKSP");
-                ierr = KSPGetPC(ksp, &pc);
-                if (ierr != 0) throw_error(ierr, "KSPGetPC");
-
-                ierr = STSetType(st, STSINVERT);
-                if (ierr != 0) throw_error(ierr, "STSetType");
-                ierr = KSPSetType(ksp, KSPPREONLY);
-                if (ierr != 0) throw_error(ierr, "KSPSetType");
-                ierr = PCSetType(pc, PCLU);
-                if (ierr != 0) throw_error(ierr, "PCSetType");
-
-                ierr = PCFactorSetMatSolverType(pc, lu_method.c_str());
-                if (ierr != 0) throw_error(ierr, "PCFactorSetMatSolverType");
-            }
-
-            void throw_error(PetscErrorCode ierr, std::string reason)
-            {
-                throw std::runtime_error("Error in set_linear_solver: reason " + reason
-                                         + ",error code " + std::to_string(ierr));
-            }
-
-            PYBIND11_MODULE(SIGNATURE, m)
-            {
-                m.def("set_linear_solver", &set_linear_solver);
-            }
-        """
-
-        cpp_module = compile_cpp_code(cpp_code)
+        cpp_module = compile_cpp_code(_set_linear_solver_cpp_code)
         set_linear_solver = cpp_module.set_linear_solver
 
         if "spectral_transform" in parameters and parameters["spectral_transform"] == "shift-and-invert":
@@ -155,6 +179,20 @@ class EigenSolver(AbstractEigenSolver):
                 parameters.pop("linear_solver")
         self.eigen_solver.parameters.update(parameters)
 
+    def set_initial_space(self, initial_space):
+        # Condense the vectors spanning the initial space, so that they are compatible with condensed operators
+        condensed_initial_space = list()
+        for function in initial_space:
+            vector = as_backend_type(function.vector()).vec()
+            if hasattr(self, "_is"):  # there were Dirichlet BCs
+                condensed_vector = vector.getSubVector(self._is)
+                condensed_initial_space.append(condensed_vector.copy())
+                vector.restoreSubVector(self._is, condensed_vector)
+            else:
+                condensed_initial_space.append(vector.copy())
+        # Pass them to SLEPc, which will use them as initial guess for the next solve
+        self.eigen_solver.eps().setInitialSpace(condensed_initial_space)
+
     def solve(self, n_eigs=None):
         assert n_eigs is not None
         self.eigen_solver.solve(n_eigs)
@@ -183,31 +221,7 @@ class EigenSolver(AbstractEigenSolver):
 
         # Get eigenpairs
         if dolfin_version.startswith("2018.1"):  # TODO remove when 2018.2.0 is released
-            # Helper functions
-            cpp_code = """
-                #include <pybind11/pybind11.h>
-                #include <dolfin/la/PETScVector.h>
-                #include <dolfin/la/SLEPcEigenSolver.h>
-
-                void get_eigen_pair(std::shared_ptr<dolfin::SLEPcEigenSolver> eigen_solver,
-                                    std::shared_ptr<dolfin::PETScVector> condensed_real_vector,
-                                    std::shared_ptr<dolfin::PETScVector> condensed_imag_vector,
-                                    std::size_t i)
-                {
-                    const PetscInt ii = static_cast<PetscInt>(i);
-                    double real_value;
-                    double imag_value;
-                    EPSGetEigenpair(eigen_solver->eps(), ii, &real_value, &imag_value, condensed_real_vector->vec(),
-                                    condensed_imag_vector->vec());
-                }
-
-                PYBIND11_MODULE(SIGNATURE, m)
-                {
-                    m.def("get_eigen_pair", &get_eigen_pair);
-                }
-            """
-
-            get_eigen_pair = compile_cpp_code(cpp_code).get_eigen_pair
+            get_eigen_pair = compile_cpp_code(_get_eigen_pair_cpp_code).get_eigen_pair
             get_eigen_pair(self.eigen_solver, condensed_real_vector, condensed_imag_vector, i)
         else:
             self.eigen_solver.get_eigenpair(condensed_real_vector, condensed_imag_vector, i)
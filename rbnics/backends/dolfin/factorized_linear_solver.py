@@ -0,0 +1,71 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from dolfin import as_backend_type, DirichletBC, PETScLUSolver
+from rbnics.backends.abstract import FactorizedLinearSolver as AbstractFactorizedLinearSolver
+from rbnics.backends.dolfin.matrix import Matrix
+from rbnics.backends.dolfin.vector import Vector
+from rbnics.backends.dolfin.wrapping.dirichlet_bc import ProductOutputDirichletBC
+from rbnics.utils.decorators import BackendFor, dict_of, list_of, overload
+
+
+@BackendFor("dolfin", inputs=(Matrix.Type(), (list_of(DirichletBC), ProductOutputDirichletBC,
+                                              dict_of(str, list_of(DirichletBC)),
+                                              dict_of(str, ProductOutputDirichletBC), None)))
+class FactorizedLinearSolver(AbstractFactorizedLinearSolver):
+    # The left-hand side is factorized on the first solve, and the factorization is then reused
+    # for every subsequent right-hand side. Boundary conditions provided to the constructor only
+    # determine which rows of the left-hand side are constrained, so that their values may change
+    # from one solve to the next.
+
+    def __init__(self, lhs, bcs=None):
+        self._init_lhs(lhs, bcs)
+        self._linear_solver = "default"
+        self._solver = None
+
+    @overload(Matrix.Type(), None)
+    def _init_lhs(self, lhs, bcs):
+        self.lhs = lhs
+
+    @overload(Matrix.Type(), (list_of(DirichletBC), ProductOutputDirichletBC, dict_of(str, list_of(DirichletBC)),
+                              dict_of(str, ProductOutputDirichletBC)))
+    def _init_lhs(self, lhs, bcs):
+        # Create a copy of lhs, in order not to change
+        # the original references when applying bcs
+        self.lhs = lhs.copy()
+        _apply_bcs(self.lhs, bcs)
+
+    def set_parameters(self, parameters):
+        assert len(parameters) in (0, 1)
+        if len(parameters) == 1:
+            assert "linear_solver" in parameters
+        linear_solver = parameters.get("linear_solver", "default")
+        if linear_solver != self._linear_solver:
+            self._linear_solver = linear_solver
+            self._solver = None
+
+    def solve(self, solution, rhs, bcs=None):
+        if self._solver is None:
+            self._solver = PETScLUSolver(as_backend_type(self.lhs), self._linear_solver)
+        if bcs is not None:
+            # Create a copy of rhs, in order not to change
+            # the original references when applying bcs
+            rhs = rhs.copy()
+            _apply_bcs(rhs, bcs)
+        self._solver.solve(solution.vector(), rhs)
+
+
+@overload((Matrix.Type(), Vector.Type()), (list_of(DirichletBC), ProductOutputDirichletBC))
+def _apply_bcs(tensor, bcs):
+    for bc in bcs:
+        bc.apply(tensor)
+
+
+@overload((Matrix.Type(), Vector.Type()), (dict_of(str, list_of(DirichletBC)), dict_of(str, ProductOutputDirichletBC)))
+def _apply_bcs(tensor, bcs):
+    for key in bcs:
+        for bc in bcs[key]:
+            bc.apply(tensor)
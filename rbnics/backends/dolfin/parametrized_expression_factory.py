@@ -21,7 +21,8 @@ from rbnics.backends.dolfin.functions_list import FunctionsList
 from rbnics.backends.dolfin.proper_orthogonal_decomposition import ProperOrthogonalDecomposition
 from rbnics.backends.dolfin.reduced_vertices import ReducedVertices
 from rbnics.backends.dolfin.snapshots_matrix import SnapshotsMatrix
-from rbnics.backends.dolfin.wrapping import (expression_description, expression_iterator, expression_name,
+from rbnics.backends.dolfin.wrapping import (evaluate_parametrized_expression_at_dofs, expression_description,
+                                             expression_iterator, expression_name,
                                              get_auxiliary_problem_for_non_parametrized_function, is_parametrized,
                                              is_problem_solution, is_problem_solution_dot, is_problem_solution_type,
                                              is_time_dependent, solution_dot_identify_component,
@@ -50,6 +51,24 @@ class ParametrizedExpressionFactory(ParametrizedExpressionFactory_Base):
         # Call Parent
         ParametrizedExpressionFactory_Base.__init__(self, expression, space, inner_product)
 
+    def evaluate_for_parameters(self, mus, times=None):
+        # Analytical expressions are evaluated at the coordinates of all dofs for the whole block of parameters,
+        # rather than being interpolated on the mesh once for each parameter
+        values = evaluate_parametrized_expression_at_dofs(self._expression, self._space, mus, times)
+        if values is None:
+            return None
+        snapshots = list()
+        for j in range(values.shape[1]):
+            snapshot = backend.Function(self._space)
+            snapshot.vector().set_local(values[:, j])
+            snapshot.vector().apply("insert")
+            snapshots.append(snapshot)
+        return snapshots
+
+    def evaluate_for_parameters_at(self, mus, at, times=None):
+        # Analytical expressions are evaluated at the coordinates of the interpolation locations only
+        return evaluate_parametrized_expression_at_dofs(self._expression, self._space, mus, times, at.get_dofs_list())
+
 
 # Space generation for BaseExpression
 @overload
@@ -14,8 +14,9 @@ from rbnics.backends.basic import ProperOrthogonalDecompositionBase as BasicProp
 from rbnics.backends.dolfin.functions_list import FunctionsList
 from rbnics.backends.dolfin.matrix import Matrix
 from rbnics.backends.dolfin.snapshots_matrix import SnapshotsMatrix
+from rbnics.backends.dolfin.vector import Vector
 from rbnics.backends.dolfin.wrapping import get_mpi_comm
-from rbnics.backends.online import OnlineEigenSolver
+from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineEigenSolver
 from rbnics.utils.decorators import BackendFor, ModuleWrapper
 
 
@@ -25,9 +26,10 @@ def transpose(arg):
     return backend_transpose(arg)
 
 
-backend = ModuleWrapper(transpose)
+backend = ModuleWrapper(Matrix, transpose, Vector)
 wrapping = ModuleWrapper(get_mpi_comm)
-online_backend = ModuleWrapper(OnlineEigenSolver=OnlineEigenSolver)
+online_backend = ModuleWrapper(OnlineAffineExpansionStorage=OnlineAffineExpansionStorage,
+                               OnlineEigenSolver=OnlineEigenSolver)
 online_wrapping = ModuleWrapper()
 ProperOrthogonalDecomposition_Base = BasicProperOrthogonalDecomposition(
     backend, wrapping, online_backend, online_wrapping, AbstractProperOrthogonalDecomposition,
@@ -15,7 +15,8 @@ from rbnics.backends.dolfin.wrapping import (build_dof_map_reader_mapping, build
                                              convert_functionspace_to_submesh,
                                              evaluate_basis_functions_matrix_at_dofs,
                                              evaluate_sparse_function_at_dofs, FunctionSpace,
-                                             map_functionspaces_between_mesh_and_submesh)
+                                             map_functionspaces_between_mesh_and_submesh,
+                                             SparseFunctionAtDofsInterpolator)
 from rbnics.backends.dolfin.wrapping.function_extend_or_restrict import _sub_from_tuple
 from rbnics.backends.dolfin.wrapping.get_auxiliary_problem_for_non_parametrized_function import (
     AuxiliaryProblemForNonParametrizedFunction)
@@ -359,8 +360,8 @@ def BasicReducedMesh(backend, wrapping):
                        + ", " + str(component) + ", " + str(index))
             assert index not in self._auxiliary_function_interpolator[key]
             auxiliary_reduced_V = self.get_auxiliary_reduced_function_space(auxiliary_problem, component, index)
-            self._auxiliary_function_interpolator[key][index] = lambda fun: wrapping.evaluate_sparse_function_at_dofs(
-                fun, self._auxiliary_dofs_to_reduced_dofs[key][index].keys(),
+            self._auxiliary_function_interpolator[key][index] = wrapping.SparseFunctionAtDofsInterpolator(
+                self._auxiliary_dofs_to_reduced_dofs[key][index].keys(),
                 auxiliary_reduced_V, self._auxiliary_dofs_to_reduced_dofs[key][index].values()
             )
 
@@ -891,7 +892,7 @@ backend = ModuleWrapper(BasisFunctionsMatrix)
 wrapping = ModuleWrapper(AuxiliaryProblemForNonParametrizedFunction, build_dof_map_reader_mapping,
                          build_dof_map_writer_mapping, create_submesh, convert_meshfunctions_to_submesh,
                          convert_functionspace_to_submesh, evaluate_sparse_function_at_dofs,
-                         map_functionspaces_between_mesh_and_submesh,
+                         map_functionspaces_between_mesh_and_submesh, SparseFunctionAtDofsInterpolator,
                          evaluate_basis_functions_matrix_at_dofs=evaluate_basis_functions_matrix_at_dofs)
 ReducedMesh_Base = BasicReducedMesh(backend, wrapping)
 
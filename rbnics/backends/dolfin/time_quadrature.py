@@ -5,13 +5,14 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from numbers import Number
-try:
-    from scipy.integrate import simpson as simps
-except ImportError:
-    from scipy.integrate import simps
+from mpi4py.MPI import SUM
+from numpy import column_stack, einsum
+from petsc4py import PETSc
 from rbnics.backends.abstract import TimeQuadrature as AbstractTimeQuadrature
+from rbnics.backends.basic.wrapping import time_quadrature_weights
 from rbnics.backends.dolfin.function import Function
-from rbnics.backends.dolfin.wrapping import function_copy
+from rbnics.backends.dolfin.matrix import Matrix
+from rbnics.backends.dolfin.wrapping import function_copy, to_petsc4py
 from rbnics.utils.decorators import BackendFor, list_of, tuple_of
 
 
@@ -21,14 +22,44 @@ class TimeQuadrature(AbstractTimeQuadrature):
         assert len(function_over_time) > 1
         self._time_step_size = (time_interval[1] - time_interval[0]) / (len(function_over_time) - 1)
         self._function_over_time = function_over_time
+        self._rule = "simpson"
+        self._content = None  # 2D array of local dofs, one column per time, computed only when required
+
+    def set_parameters(self, parameters):
+        for (key, value) in parameters.items():
+            if key == "rule":
+                self._rule = value
+            else:
+                raise ValueError("Invalid paramater passed to TimeQuadrature object.")
 
     def integrate(self):
-        vector_over_time = list()
-        for function in self._function_over_time:
-            vector_over_time.append(function.vector().get_local())
-        integrated_vector = simps(vector_over_time, dx=self._time_step_size, axis=0)
+        integrated_vector = self._get_content().dot(self._get_weights())
         integrated_function = function_copy(self._function_over_time[0])
         integrated_function.vector().zero()
         integrated_function.vector().set_local(integrated_vector)
         integrated_function.vector().apply("insert")
         return integrated_function
+
+    def integrate_inner_product(self, inner_product):
+        assert isinstance(inner_product, Matrix.Type())
+        # Compute the action of the inner product on all times at once, as a product with a dense matrix
+        inner_product = to_petsc4py(inner_product)
+        content = self._get_content()
+        (local_size, global_size) = (content.shape[0], inner_product.getSize()[1])
+        content_mat = PETSc.Mat().createDense(
+            ((local_size, global_size), (PETSc.DECIDE, content.shape[1])), array=content.copy(order="F"),
+            comm=inner_product.getComm())
+        action_mat = inner_product.matMult(content_mat)
+        norms_squared_over_time = einsum("ij,ij->j", content, action_mat.getDenseArray())
+        norms_squared_over_time = inner_product.getComm().tompi4py().allreduce(norms_squared_over_time, op=SUM)
+        content_mat.destroy()
+        action_mat.destroy()
+        return norms_squared_over_time.dot(self._get_weights())
+
+    def _get_content(self):
+        if self._content is None:
+            self._content = column_stack([function.vector().get_local() for function in self._function_over_time])
+        return self._content
+
+    def _get_weights(self):
+        return time_quadrature_weights(len(self._function_over_time), self._time_step_size, self._rule)
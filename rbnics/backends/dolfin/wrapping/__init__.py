@@ -13,6 +13,7 @@ from rbnics.backends.dolfin.wrapping.assemble_operator_for_stability_factor impo
 from rbnics.backends.dolfin.wrapping.assemble_operator_for_supremizers import assemble_operator_for_supremizers
 from rbnics.backends.dolfin.wrapping.basis_functions_matrix_mul import (
     basis_functions_matrix_mul_online_matrix, basis_functions_matrix_mul_online_vector)
+from rbnics.backends.dolfin.wrapping.compile_cpp_code import precompile_cpp_code
 from rbnics.backends.dolfin.wrapping.compute_theta_for_derivative import compute_theta_for_derivative
 from rbnics.backends.dolfin.wrapping.compute_theta_for_derivatives import compute_theta_for_derivatives
 from rbnics.backends.dolfin.wrapping.compute_theta_for_restriction import compute_theta_for_restriction
@@ -30,7 +31,10 @@ from rbnics.backends.dolfin.wrapping.evaluate_and_vectorize_sparse_matrix_at_dof
 from rbnics.backends.dolfin.wrapping.evaluate_basis_functions_matrix_at_dofs import (
     evaluate_basis_functions_matrix_at_dofs)
 from rbnics.backends.dolfin.wrapping.evaluate_expression import evaluate_expression
-from rbnics.backends.dolfin.wrapping.evaluate_sparse_function_at_dofs import evaluate_sparse_function_at_dofs
+from rbnics.backends.dolfin.wrapping.evaluate_parametrized_expression_at_dofs import (
+    evaluate_parametrized_expression_at_dofs)
+from rbnics.backends.dolfin.wrapping.evaluate_sparse_function_at_dofs import (
+    evaluate_sparse_function_at_dofs, SparseFunctionAtDofsInterpolator)
 from rbnics.backends.dolfin.wrapping.evaluate_sparse_vector_at_dofs import evaluate_sparse_vector_at_dofs
 from rbnics.backends.dolfin.wrapping.expand_sum_product import expand_sum_product
 from rbnics.backends.dolfin.wrapping.expression_description import expression_description
@@ -86,6 +90,7 @@ from rbnics.backends.dolfin.wrapping.solution_dot_identify_component import solu
 from rbnics.backends.dolfin.wrapping.solution_identify_component import solution_identify_component
 from rbnics.backends.dolfin.wrapping.solution_iterator import solution_iterator
 from rbnics.backends.dolfin.wrapping.tensor_copy import tensor_copy
+from rbnics.backends.dolfin.wrapping.tensor_values_array import TensorValuesArray
 from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
 from rbnics.backends.dolfin.wrapping.vector_mul import vector_mul_vector
 
@@ -113,6 +118,7 @@ __all__ = [
     "evaluate_and_vectorize_sparse_matrix_at_dofs",
     "evaluate_basis_functions_matrix_at_dofs",
     "evaluate_expression",
+    "evaluate_parametrized_expression_at_dofs",
     "evaluate_sparse_function_at_dofs",
     "evaluate_sparse_vector_at_dofs",
     "expand_sum_product",
@@ -161,6 +167,7 @@ __all__ = [
     "parametrized_constant_to_float",
     "ParametrizedExpression",
     "plot",
+    "precompile_cpp_code",
     "PullBackFormsToReferenceDomain",
     "PushForwardToDeformedDomain",
     "remove_complex_nodes",
@@ -168,7 +175,9 @@ __all__ = [
     "solution_dot_identify_component",
     "solution_identify_component",
     "solution_iterator",
+    "SparseFunctionAtDofsInterpolator",
     "tensor_copy",
+    "TensorValuesArray",
     "to_petsc4py",
     "vector_mul_vector",
     "vectorized_matrix_inner_vectorized_matrix"
@@ -185,6 +194,7 @@ __overridden__ = {
         "generate_function_space_for_stability_factor",
         "ParametrizedExpression",
         "plot",
+        "precompile_cpp_code",
         "PullBackFormsToReferenceDomain",
         "PushForwardToDeformedDomain"
     ],
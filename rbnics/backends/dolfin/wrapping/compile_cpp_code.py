@@ -0,0 +1,49 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import hashlib
+from dolfin import compile_cpp_code as dolfin_compile_cpp_code
+
+# Sources of all C++ helpers known to RBniCS, indexed by their hash
+_cpp_codes = dict()
+# Compiled modules, indexed by the hash of their source
+_cpp_modules = dict()
+
+
+def _cpp_code_hash(cpp_code):
+    return hashlib.sha1(cpp_code.encode("utf-8")).hexdigest()
+
+
+def register_cpp_code(cpp_code):
+    """
+    Register a C++ helper, so that it is compiled by precompile_cpp_code. Returns the source unchanged.
+    """
+    _cpp_codes[_cpp_code_hash(cpp_code)] = cpp_code
+    return cpp_code
+
+
+def compile_cpp_code(cpp_code):
+    """
+    Compile a C++ helper at most once per process. Later calls with the same source return the
+    already imported module, without hashing the source through dijitso again.
+    """
+    cpp_code_hash = _cpp_code_hash(cpp_code)
+    try:
+        return _cpp_modules[cpp_code_hash]
+    except KeyError:
+        _cpp_codes[cpp_code_hash] = cpp_code
+        _cpp_modules[cpp_code_hash] = dolfin_compile_cpp_code(cpp_code)
+        return _cpp_modules[cpp_code_hash]
+
+
+def precompile_cpp_code():
+    """
+    Compile all registered C++ helpers, so that the dijitso disk cache is populated. Returns the number
+    of compiled helpers.
+    """
+    for cpp_code in list(_cpp_codes.values()):
+        compile_cpp_code(cpp_code)
+    return len(_cpp_codes)
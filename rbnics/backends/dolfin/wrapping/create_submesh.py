@@ -8,12 +8,52 @@ from logging import DEBUG, getLogger
 from numpy import array, uintp, unique, where
 from scipy.spatial import cKDTree as KDTree
 from mpi4py.MPI import SUM
-from dolfin import (Cell, cells, compile_cpp_code, Facet, facets, FunctionSpace, Mesh, MeshEditor, MeshFunction,
-                    Vertex, vertices)
+from dolfin import Cell, cells, Facet, facets, FunctionSpace, Mesh, MeshEditor, MeshFunction, Vertex, vertices
 from dolfin.cpp.mesh import MeshFunctionBool
+from rbnics.backends.dolfin.wrapping.compile_cpp_code import compile_cpp_code, register_cpp_code
 
 logger = getLogger("rbnics/backends/dolfin/wrapping/create_submesh.py")
 
+# Wrapper to DistributedMeshTools::number_entities
+_initialize_global_indices_cpp_code = register_cpp_code("""
+    #include <pybind11/pybind11.h>
+    #include <dolfin/mesh/DistributedMeshTools.h>
+    #include <dolfin/mesh/Mesh.h>
+
+    void initialize_global_indices(std::shared_ptr<dolfin::Mesh> mesh, std::size_t dim)
+    {
+        dolfin::DistributedMeshTools::number_entities(*mesh, dim);
+    }
+
+    PYBIND11_MODULE(SIGNATURE, m)
+    {
+        m.def("initialize_global_indices", &initialize_global_indices);
+    }
+""")
+
+_set_shared_entities_cpp_code = register_cpp_code("""
+    #include <Eigen/Core>
+    #include <pybind11/pybind11.h>
+    #include <pybind11/eigen.h>
+    #include <dolfin/mesh/Mesh.h>
+
+    using OtherProcesses = Eigen::Ref<const Eigen::Matrix<std::size_t, Eigen::Dynamic, 1>>;
+
+    void set_shared_entities(std::shared_ptr<dolfin::Mesh> submesh, std::size_t idx,
+                             const OtherProcesses other_processes, std::size_t dim)
+    {
+        std::set<unsigned int> set_other_processes;
+        for (std::size_t i(0); i < other_processes.size(); i++)
+            set_other_processes.insert(other_processes[i]);
+        submesh->topology().shared_entities(dim)[idx] = set_other_processes;
+    }
+
+    PYBIND11_MODULE(SIGNATURE, m)
+    {
+        m.def("set_shared_entities", &set_shared_entities);
+    }
+""")
+
 
 # Implement an extended version of cbcpost create_submesh that:
 # a) as cbcpost version (and in contrast to standard dolfin) also works in parallel
@@ -209,22 +249,7 @@ def create_submesh(mesh, markers):
         submesh.submesh_to_mesh_facet_local_indices.append(submesh_to_mesh_facets_local_indices[submesh_facet_index])
     # == 3bis. Prepare (temporary) global indices of facets == #
     # Wrapper to DistributedMeshTools::number_entities
-    cpp_code = """
-        #include <pybind11/pybind11.h>
-        #include <dolfin/mesh/DistributedMeshTools.h>
-        #include <dolfin/mesh/Mesh.h>
-
-        void initialize_global_indices(std::shared_ptr<dolfin::Mesh> mesh, std::size_t dim)
-        {
-            dolfin::DistributedMeshTools::number_entities(*mesh, dim);
-        }
-
-        PYBIND11_MODULE(SIGNATURE, m)
-        {
-            m.def("initialize_global_indices", &initialize_global_indices);
-        }
-    """
-    initialize_global_indices = compile_cpp_code(cpp_code).initialize_global_indices
+    initialize_global_indices = compile_cpp_code(_initialize_global_indices_cpp_code).initialize_global_indices
     initialize_global_indices(mesh, mesh.topology().dim() - 1)
     # Prepare global indices of facets
     mesh_facets_local_to_global_indices = dict()
@@ -327,29 +352,7 @@ def create_submesh(mesh, markers):
 
             # Need an extension module to populate shared_entities because in python each call to shared_entities
             # returns a temporary.
-            cpp_code = """
-                #include <Eigen/Core>
-                #include <pybind11/pybind11.h>
-                #include <pybind11/eigen.h>
-                #include <dolfin/mesh/Mesh.h>
-
-                using OtherProcesses = Eigen::Ref<const Eigen::Matrix<std::size_t, Eigen::Dynamic, 1>>;
-
-                void set_shared_entities(std::shared_ptr<dolfin::Mesh> submesh, std::size_t idx,
-                                         const OtherProcesses other_processes, std::size_t dim)
-                {
-                    std::set<unsigned int> set_other_processes;
-                    for (std::size_t i(0); i < other_processes.size(); i++)
-                        set_other_processes.insert(other_processes[i]);
-                    submesh->topology().shared_entities(dim)[idx] = set_other_processes;
-                }
-
-                PYBIND11_MODULE(SIGNATURE, m)
-                {
-                    m.def("set_shared_entities", &set_shared_entities);
-                }
-            """
-            set_shared_entities = compile_cpp_code(cpp_code).set_shared_entities
+            set_shared_entities = compile_cpp_code(_set_shared_entities_cpp_code).set_shared_entities
             for (submesh_entity_local_index, other_processors) in submesh_shared_entities.items():
                 set_shared_entities(submesh, submesh_entity_local_index, other_processors, dim)
 
@@ -4,7 +4,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from rbnics.backends.dolfin.wrapping.evaluate_sparse_function_at_dofs import evaluate_sparse_function_at_dofs
+from rbnics.backends.dolfin.wrapping.evaluate_sparse_function_at_dofs import SparseFunctionAtDofsInterpolator
 from rbnics.utils.decorators import ModuleWrapper
 
 
@@ -14,18 +14,18 @@ def basic_evaluate_basis_functions_matrix_at_dofs(backend, wrapping):
                                                        output_basis_functions_matrix, reduced_dofs_list):
         components = output_basis_functions_matrix._components_name
         reduced_space = output_basis_functions_matrix.space
+        # The same interpolator is applied to every basis function
+        interpolator = wrapping.SparseFunctionAtDofsInterpolator(dofs_list, reduced_space, reduced_dofs_list)
         if len(components) > 1:
             for component in components:
                 input_functions_list = input_basis_functions_matrix._components[component]
                 for basis_function in input_functions_list:
-                    reduced_basis_function = wrapping.evaluate_sparse_function_at_dofs(
-                        basis_function, dofs_list, reduced_space, reduced_dofs_list)
+                    reduced_basis_function = interpolator(basis_function)
                     output_basis_functions_matrix.enrich(reduced_basis_function, component=component)
         else:
             input_functions_list = input_basis_functions_matrix._components[components[0]]
             for basis_function in input_functions_list:
-                reduced_basis_function = wrapping.evaluate_sparse_function_at_dofs(
-                    basis_function, dofs_list, reduced_space, reduced_dofs_list)
+                reduced_basis_function = interpolator(basis_function)
                 output_basis_functions_matrix.enrich(reduced_basis_function)
         return output_basis_functions_matrix
 
@@ -33,5 +33,5 @@ def basic_evaluate_basis_functions_matrix_at_dofs(backend, wrapping):
 
 
 backend = ModuleWrapper()
-wrapping = ModuleWrapper(evaluate_sparse_function_at_dofs)
+wrapping = ModuleWrapper(SparseFunctionAtDofsInterpolator)
 evaluate_basis_functions_matrix_at_dofs = basic_evaluate_basis_functions_matrix_at_dofs(backend, wrapping)
@@ -4,23 +4,61 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numpy import empty
 try:
     from ufl_legacy.core.operator import Operator
 except ImportError:
     from ufl.core.operator import Operator
 from dolfin import assign, Function, LagrangeInterpolator, project
 from dolfin.function.expression import BaseExpression
+from rbnics.backends.dolfin.wrapping.get_global_dof_coordinates import _get_local_dof_to_coordinates_map
+from rbnics.backends.dolfin.wrapping.get_global_dof_to_local_dof_map import get_global_dof_to_local_dof_map
+from rbnics.backends.dolfin.wrapping.get_local_dof_to_component_map import get_local_dof_to_component_map
 
 
-def evaluate_expression(expression, function, replaced_expression=None):
+def evaluate_expression(expression, function, replaced_expression=None, dofs_list=None):
+    """
+    Evaluate expression (or its replaced version) into function. If dofs_list is provided, only the values
+    at such dofs are required: in that case, expressions which are interpolated on a Lagrange space are only
+    evaluated at the coordinates of dofs_list, while all other values of function are left untouched.
+    """
     if replaced_expression is None:
         replaced_expression = expression
     assert isinstance(expression, (BaseExpression, Function, Operator))
     if isinstance(expression, BaseExpression):
-        LagrangeInterpolator.interpolate(function, replaced_expression)
+        if dofs_list is not None and _is_lagrange(function.function_space().ufl_element()):
+            # Interpolation on a Lagrange space is a pointwise evaluation at the coordinates of each dof
+            _evaluate_expression_at_dofs(replaced_expression, function, dofs_list)
+        else:
+            LagrangeInterpolator.interpolate(function, replaced_expression)
     elif isinstance(expression, Function):
         assign(function, replaced_expression)
     elif isinstance(expression, Operator):
         project(replaced_expression, function.function_space(), function=function)
     else:
         raise ValueError("Invalid expression")
+
+
+def _evaluate_expression_at_dofs(expression, function, dofs_list):
+    V = function.function_space()
+    global_to_local = get_global_dof_to_local_dof_map(V, V.dofmap())
+    local_dof_to_coordinates = _get_local_dof_to_coordinates_map(V)
+    local_dof_to_component = get_local_dof_to_component_map(V)
+    function_content = function.vector().get_local()
+    values = empty(V.ufl_element().value_size())
+    for dofs in dofs_list:
+        assert len(dofs) == 1
+        if dofs[0] in global_to_local:  # owned by the current processor
+            local_dof = global_to_local[dofs[0]]
+            expression._cpp_object.eval(values, local_dof_to_coordinates[local_dof])
+            function_content[local_dof] = values[max(local_dof_to_component[local_dof], 0)]
+    function.vector().set_local(function_content)
+    function.vector().apply("insert")
+
+
+def _is_lagrange(element):
+    sub_elements = element.sub_elements()
+    if len(sub_elements) > 0:
+        return all(_is_lagrange(sub_element) for sub_element in sub_elements)
+    else:
+        return element.family() in ("Lagrange", "Q", "Discontinuous Lagrange", "DQ")
@@ -0,0 +1,161 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import re
+import numpy
+from mpi4py.MPI import SUM
+from numpy import arange, asarray, broadcast_to, empty, fromiter, zeros
+from rbnics.backends.dolfin.wrapping.get_global_dof_coordinates import _get_local_dof_to_coordinates_map
+from rbnics.backends.dolfin.wrapping.get_global_dof_to_local_dof_map import get_global_dof_to_local_dof_map
+from rbnics.backends.dolfin.wrapping.get_local_dof_to_component_map import get_local_dof_to_component_map
+from rbnics.utils.cache import Cache
+
+
+def evaluate_parametrized_expression_at_dofs(expression, V, mus, times=None, dofs_list=None):
+    """
+    Evaluate a ParametrizedExpression at the coordinates of the dofs owned by the Lagrange space V, for all
+    parameters in mus (and, possibly, the corresponding times). Return an array with a row for each owned dof and
+    a column for each parameter, or None if the expression code cannot be evaluated in a vectorized way.
+    If dofs_list (a list of (global dof, )) is provided, the returned array has instead a row for each dof in
+    dofs_list, and is the same on all processors.
+    """
+    if not hasattr(expression, "_parametrized_expression_code"):
+        return None
+    # Compile the code of each (flattened) component of the expression
+    codes = _flatten_code(expression._parametrized_expression_code)
+    parameters = expression._parametrized_expression_parameters
+    vectorized_codes = list()
+    for code in codes:
+        if code not in _vectorized_codes:
+            _vectorized_codes[code] = _vectorize_code(code, parameters)
+        if _vectorized_codes[code] is None:
+            return None
+        vectorized_codes.append(_vectorized_codes[code])
+    # Prepare parameters, so that they broadcast along columns
+    mus = asarray([mu[:len(expression._mu)] for mu in mus], dtype=float).reshape(len(mus), len(expression._mu))
+    namespace = dict(_vectorized_functions)
+    for name in parameters:
+        if name.startswith("mu_"):
+            namespace[name] = mus[:, int(name[3:])].reshape(1, -1)
+        elif name == "t" and times is not None:
+            namespace[name] = asarray(times, dtype=float).reshape(1, -1)
+        else:
+            namespace[name] = getattr(expression, name)
+    # Evaluate each component at the coordinates of the corresponding owned dofs
+    if dofs_list is None:
+        (local_dof_begin, local_dof_end) = V.dofmap().ownership_range()
+        local_dofs = arange(local_dof_end - local_dof_begin)
+    else:
+        global_to_local = get_global_dof_to_local_dof_map(V, V.dofmap())
+        owned_rows = [row for (row, dofs) in enumerate(dofs_list) if dofs[0] in global_to_local]
+        local_dofs = fromiter((global_to_local[dofs_list[row][0]] for row in owned_rows), dtype=int,
+                              count=len(owned_rows))
+    coordinates = _get_local_dof_to_coordinates_map(V)[local_dofs]
+    output = empty((len(local_dofs), len(mus)))
+    if len(vectorized_codes) == 1:
+        component_dofs = [slice(None)]
+    else:
+        local_dof_to_component = get_local_dof_to_component_map(V)
+        components = fromiter((local_dof_to_component[dof] for dof in local_dofs), dtype=int, count=len(local_dofs))
+        component_dofs = [(components == c).nonzero()[0] for c in range(len(vectorized_codes))]
+    for (vectorized_code, dofs) in zip(vectorized_codes, component_dofs):
+        component_coordinates = coordinates[dofs]
+        namespace["x"] = [component_coordinates[:, i].reshape(-1, 1) for i in range(component_coordinates.shape[1])]
+        output[dofs] = broadcast_to(eval(vectorized_code, {"__builtins__": {}}, namespace),
+                                    (component_coordinates.shape[0], len(mus)))
+    if dofs_list is None:
+        return output
+    else:
+        # Each dof is evaluated by the processor owning it
+        output_at_dofs_list = zeros((len(dofs_list), len(mus)))
+        output_at_dofs_list[owned_rows] = output
+        return V.mesh().mpi_comm().allreduce(output_at_dofs_list, op=SUM)
+
+
+def _flatten_code(code):
+    if isinstance(code, str):
+        return (code, )
+    else:
+        assert isinstance(code, tuple)
+        flattened_code = list()
+        for item in code:
+            flattened_code.extend(_flatten_code(item))
+        return tuple(flattened_code)
+
+
+def _vectorize_code(code, parameters):
+    # Convert a C++ expression into an equivalent numpy one, if it only contains arithmetic operations, calls
+    # to mathematical functions, coordinates, constants and scalar parameters. Return None otherwise.
+    tokens = list()
+    position = 0
+    code = code.strip()
+    while position < len(code):
+        match = _token_regex.match(code, position)
+        if match is None:
+            return None
+        tokens.append((match.lastgroup, match.group(match.lastgroup)))
+        position = match.end()
+    vectorized_tokens = list()
+    for (i, (kind, token)) in enumerate(tokens):
+        if kind == "name":
+            if token.startswith("std::"):
+                token = token[5:]
+            if token in _vectorized_constants:
+                token = repr(_vectorized_constants[token])
+            elif token in _vectorized_functions_names:
+                token = _vectorized_functions_names[token]
+            elif token != "x" and token not in parameters:
+                return None
+        elif kind == "operator" and token == "/":
+            # Division between integer literals is truncated in C++
+            if (0 < i < len(tokens) - 1 and _is_integer_literal(*tokens[i - 1])
+                    and _is_integer_literal(*tokens[i + 1])):
+                return None
+        vectorized_tokens.append(token)
+    try:
+        return compile(" ".join(vectorized_tokens), "<" + code + ">", "eval")
+    except SyntaxError:
+        return None
+
+
+def _is_integer_literal(kind, token):
+    return kind == "number" and token.isdigit()
+
+
+_token_regex = re.compile(r"\s*(?:(?P<number>(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?)"
+                          r"|(?P<name>[A-Za-z_]\w*(?:::[A-Za-z_]\w*)?)"
+                          r"|(?P<operator>[-+*/(),\[\]]))\s*")
+_vectorized_constants = {
+    "pi": numpy.pi,
+    "M_PI": numpy.pi,
+    "DOLFIN_PI": numpy.pi,
+    "DOLFIN_EPS": 3.0e-16
+}
+_vectorized_functions_names = {
+    "abs": "absolute",
+    "acos": "arccos",
+    "asin": "arcsin",
+    "atan": "arctan",
+    "atan2": "arctan2",
+    "ceil": "ceil",
+    "cos": "cos",
+    "cosh": "cosh",
+    "exp": "exp",
+    "fabs": "absolute",
+    "floor": "floor",
+    "fmax": "fmax",
+    "fmin": "fmin",
+    "log": "log",
+    "log10": "log10",
+    "pow": "float_power",
+    "sin": "sin",
+    "sinh": "sinh",
+    "sqrt": "sqrt",
+    "tan": "tan",
+    "tanh": "tanh"
+}
+_vectorized_functions = {name: getattr(numpy, name) for name in set(_vectorized_functions_names.values())}
+_vectorized_codes = Cache()
@@ -49,3 +49,39 @@ def _evaluate_sparse_function_at_dofs(vec, dofs_list, out, reduced_dofs_list):
             out.setValues(reduced_i, out_index, addv=PETSc.InsertMode.INSERT)
     out.assemble()
     out.ghostUpdate()
+
+
+# Interpolator from functions on a space to functions on output_V, which copies the values at dofs_list into
+# the values at reduced_dofs_list. The corresponding PETSc scatter is built only once, at the first application,
+# so that any later application is a single parallel copy rather than a loop of collective operations over dofs.
+class SparseFunctionAtDofsInterpolator(object):
+    def __init__(self, dofs_list, output_V, reduced_dofs_list):
+        self.dofs_list = list(dofs_list)
+        self.output_V = output_V
+        self.reduced_dofs_list = list(reduced_dofs_list)
+        assert len(self.dofs_list) == len(self.reduced_dofs_list)
+        self._scatter = dict()  # from ownership range of the input vector to PETSc scatter
+
+    def __call__(self, input_function):
+        vec = to_petsc4py(input_function.vector())
+        output_function = Function(self.output_V)
+        out = to_petsc4py(output_function.vector())
+        self._get_scatter(vec, out).scatter(vec, out, addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
+        out.ghostUpdate()
+        return output_function
+
+    def _get_scatter(self, vec, out):
+        ownership_range = vec.getOwnershipRange()
+        if ownership_range not in self._scatter:
+            # Each processor is in charge of the reduced dofs it owns
+            out_row_start, out_row_end = out.getOwnershipRange()
+            local_dofs = list()
+            local_reduced_dofs = list()
+            for (i, reduced_i) in zip(self.dofs_list, self.reduced_dofs_list):
+                if reduced_i >= out_row_start and reduced_i < out_row_end:
+                    local_dofs.append(i)
+                    local_reduced_dofs.append(reduced_i)
+            from_is = PETSc.IS().createGeneral(local_dofs, comm=vec.comm)
+            to_is = PETSc.IS().createGeneral(local_reduced_dofs, comm=out.comm)
+            self._scatter[ownership_range] = PETSc.Scatter().create(vec, from_is, out, to_is)
+        return self._scatter[ownership_range]
@@ -5,6 +5,7 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from logging import DEBUG, getLogger
+from numpy import asarray, empty, zeros
 try:
     from ufl_legacy.geometry import GeometricQuantity
 except ImportError:
@@ -208,7 +209,8 @@ def basic_expression_on_reduced_mesh(backend, wrapping, online_backend, online_w
                         # Get reduced problem basis functions on reduced mesh
                         assert reduced_problem not in reduced_problem_to_reduced_basis_functions[0]
                         reduced_problem_to_reduced_basis_functions[0][reduced_problem] = [
-                            at.get_auxiliary_basis_functions_matrix(truth_problem, component)
+                            _DenseReducedBasisFunctions(
+                                at.get_auxiliary_basis_functions_matrix(truth_problem, component))
                             for component in reduced_problem_to_components[0][reduced_problem]]
                     # Store the replacement for solution_dot
                     if (reduced_problem not in reduced_problem_to_reduced_mesh_solution_dot
@@ -223,7 +225,8 @@ def basic_expression_on_reduced_mesh(backend, wrapping, online_backend, online_w
                         # Get reduced problem basis functions on reduced mesh
                         assert reduced_problem not in reduced_problem_to_reduced_basis_functions[1]
                         reduced_problem_to_reduced_basis_functions[1][reduced_problem] = [
-                            at.get_auxiliary_basis_functions_matrix(truth_problem, component)
+                            _DenseReducedBasisFunctions(
+                                at.get_auxiliary_basis_functions_matrix(truth_problem, component))
                             for component in reduced_problem_to_components[1][reduced_problem]]
                     # Append to list of required reduced problems
                     required_reduced_problems.append((reduced_problem, reduced_problem_is_solving))
@@ -373,15 +376,14 @@ def basic_expression_on_reduced_mesh(backend, wrapping, online_backend, online_w
                     solution_to = reduced_mesh_solution
                     solution_from_N = OnlineSizeDict()
                     for c, v in reduced_problem._solution.N.items():
-                        if c in reduced_basis_functions._components_name:
+                        if c in reduced_basis_functions.components_name:
                             solution_from_N[c] = v
                     solution_from = online_backend.OnlineFunction(solution_from_N)
                     if t is None or is_solving:
                         online_backend.online_assign(solution_from, reduced_problem._solution)
                     else:
                         online_backend.online_assign(solution_from, reduced_problem._solution_over_time.at(t))
-                    solution_from = reduced_basis_functions[:solution_from_N] * solution_from
-                    backend.assign(solution_to, solution_from)
+                    reduced_basis_functions.mul_online_function(solution_from, solution_to)
             # Assign to reduced_mesh_solution_dot
             if reduced_problem in reduced_problem_to_reduced_mesh_solution_dot:
                 for (reduced_mesh_solution_dot, reduced_basis_functions) in zip(
@@ -390,7 +392,7 @@ def basic_expression_on_reduced_mesh(backend, wrapping, online_backend, online_w
                     solution_dot_to = reduced_mesh_solution_dot
                     solution_dot_from_N = OnlineSizeDict()
                     for c, v in reduced_problem._solution_dot.N.items():
-                        if c in reduced_basis_functions._components_name:
+                        if c in reduced_basis_functions.components_name:
                             solution_dot_from_N[c] = v
                     solution_dot_from = online_backend.OnlineFunction(solution_dot_from_N)
                     assert t is not None
@@ -398,12 +400,14 @@ def basic_expression_on_reduced_mesh(backend, wrapping, online_backend, online_w
                         online_backend.online_assign(solution_dot_from, reduced_problem._solution_dot)
                     else:
                         online_backend.online_assign(solution_dot_from, reduced_problem._solution_dot_over_time.at(t))
-                    solution_dot_from = reduced_basis_functions[:solution_dot_from_N] * solution_dot_from
-                    backend.assign(solution_dot_to, solution_dot_from)
+                    reduced_basis_functions.mul_online_function(solution_dot_from, solution_dot_to)
 
         # Evaluate and return
-        reduced_function = backend.Function(reduced_space)
-        wrapping.evaluate_expression(expression, reduced_function, replaced_expression)
+        if (expression_name, reduced_mesh) not in reduced_function_cache:
+            reduced_function_cache[(expression_name, reduced_mesh)] = backend.Function(reduced_space)
+        reduced_function = reduced_function_cache[(expression_name, reduced_mesh)]
+        # Only values at reduced dofs are then evaluated, so there is no need to interpolate on the whole reduced mesh
+        wrapping.evaluate_expression(expression, reduced_function, replaced_expression, at.get_reduced_dofs_list())
         return reduced_function
 
     expression_cache = Cache()
@@ -417,9 +421,50 @@ def basic_expression_on_reduced_mesh(backend, wrapping, online_backend, online_w
     reduced_problem_to_reduced_mesh_solution_cache = Cache()
     reduced_problem_to_reduced_mesh_solution_dot_cache = Cache()
     reduced_problem_to_reduced_basis_functions_cache = Cache()
+    reduced_function_cache = Cache()
 
     return _basic_expression_on_reduced_mesh
 
+
+# Reduced basis functions on the reduced mesh, stored as a dense array of their local dofs for each component,
+# so that the reduced solution is assigned to the reduced mesh by matrix-vector products rather than by
+# allocating a new Function from the linear combination of the basis functions
+class _DenseReducedBasisFunctions(object):
+    def __init__(self, basis_functions_matrix):
+        self.basis_functions_matrix = basis_functions_matrix
+        self.components_name = basis_functions_matrix._components_name
+        self._content = dict()  # from component name to array with a column for each basis function
+        self._content_version = dict()  # from component name to version of the stored functions list
+
+    def _get_content(self, component_name, N, local_size):
+        functions_list = self.basis_functions_matrix._components[component_name]
+        # The basis functions matrix may be enriched during the offline stage of other reduced problems
+        if self._content_version.get(component_name) != functions_list._version:
+            self._content[component_name] = zeros((local_size, 0), order="F")
+            self._content_version[component_name] = functions_list._version
+        content = self._content[component_name]
+        # Only read the basis functions which are actually required, since they may not have been loaded yet
+        if content.shape[1] < N:
+            enriched_content = empty((local_size, N), order="F")
+            enriched_content[:, :content.shape[1]] = content
+            for n in range(content.shape[1], N):
+                enriched_content[:, n] = functions_list[n].vector().get_local()
+            self._content[component_name] = content = enriched_content
+        return content[:, :N]
+
+    def mul_online_function(self, online_function, output):
+        local_size = output.vector().local_size()
+        online_vector = asarray(online_function.vector())
+        output_content = zeros(local_size)
+        offset = 0
+        for (component_name, component_N) in online_function.N.items():
+            output_content += self._get_content(component_name, component_N, local_size).dot(
+                online_vector[offset:offset + component_N])
+            offset += component_N
+        output.vector().set_local(output_content)
+        output.vector().apply("insert")
+
+
 # No explicit instantiation for backend = rbnics.backends.dolfin to avoid
 # circular dependencies. The concrete instatiation will be carried out in
 # rbnics.backends.function.evaluate
@@ -4,7 +4,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from dolfin import compile_cpp_code
+from rbnics.backends.dolfin.wrapping.compile_cpp_code import compile_cpp_code
 
 
 def matrix_mul_vector(matrix, vector):
@@ -10,7 +10,7 @@ from dolfin import Expression
 from rbnics.backends.dolfin.wrapping.parametrized_constant import (
     is_parametrized_constant, parametrized_constant_to_float)
 from rbnics.utils.cache import Cache
-from rbnics.utils.decorators.sync_setters import _original_setters
+from rbnics.utils.decorators.sync_setters import _original_setters, sync_setters__eager
 from rbnics.utils.test import AttachInstanceMethod, PatchInstanceMethod
 
 
@@ -74,6 +74,11 @@ def ParametrizedExpression(truth_problem, parametrized_expression_code=None, *ar
     expression = Expression(parametrized_expression_code, *args, **kwargs)
     expression._mu = mu  # to avoid repeated assignments
 
+    # Store code and names of scalar parameters, to allow a vectorized evaluation for several parameters at once
+    expression._parametrized_expression_code = parametrized_expression_code
+    expression._parametrized_expression_parameters = tuple(
+        name for (name, value) in kwargs.items() if name not in _reserved_kwargs and isinstance(value, Number))
+
     # Store mesh
     expression._mesh = mesh
 
@@ -106,6 +111,8 @@ def ParametrizedExpression(truth_problem, parametrized_expression_code=None, *ar
             standard_set_mu = truth_problem.set_mu
             overridden_set_mu = generate_overridden_set_mu(standard_set_mu)
             PatchInstanceMethod(truth_problem, "set_mu", overridden_set_mu).patch()
+        # Expressions must be updated as soon as mu is changed by any synced setter
+        sync_setters__eager(truth_problem, "set_mu")
 
     def expression_set_mu(self, mu):
         assert isinstance(mu, tuple)
@@ -152,8 +159,11 @@ def ParametrizedExpression(truth_problem, parametrized_expression_code=None, *ar
                 standard_set_time = truth_problem.set_time
                 overridden_set_time = generate_overridden_set_time(standard_set_time)
                 PatchInstanceMethod(truth_problem, "set_time", overridden_set_time).patch()
+            # Expressions must be updated as soon as t is changed by any synced setter
+            sync_setters__eager(truth_problem, "set_time")
 
     return expression
 
 
 _truth_problem_to_parametrized_expressions = Cache()
+_reserved_kwargs = ("cell", "degree", "domain", "element", "label", "mpi_comm", "name")
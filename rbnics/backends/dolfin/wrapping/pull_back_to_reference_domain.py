@@ -41,11 +41,12 @@ except ImportError:
     from ufl.corealg.map_dag import map_expr_dag
     from ufl.corealg.traversal import pre_traversal, traverse_unique_terminals
     from ufl.indexed import Indexed
-from dolfin import assemble, cells, compile_cpp_code, CompiledExpression, Constant, Expression, facets
+from dolfin import assemble, cells, CompiledExpression, Constant, Expression, facets
 from dolfin.cpp.la import GenericMatrix, GenericVector
 from dolfin.function.expression import BaseExpression
 from rbnics.backends.dolfin.wrapping.assemble_operator_for_stability_factor import (
     assemble_operator_for_stability_factor)
+from rbnics.backends.dolfin.wrapping.compile_cpp_code import compile_cpp_code, register_cpp_code
 from rbnics.backends.dolfin.wrapping.compute_theta_for_stability_factor import compute_theta_for_stability_factor
 from rbnics.backends.dolfin.wrapping.expand_sum_product import expand_sum_product
 from rbnics.backends.dolfin.wrapping.form_description import form_description
@@ -60,6 +61,23 @@ from rbnics.utils.test import PatchInstanceMethod
 
 logger = getLogger("rbnics/backends/dolfin/wrapping/pull_back_to_reference_domain.py")
 
+# Auxiliary pybind11 wrapper to get the local index of a facet in a cell
+_local_facet_index_cpp_code = register_cpp_code("""
+    #include <pybind11/pybind11.h>
+    #include <dolfin/mesh/MeshEntity.h>
+
+    std::size_t local_facet_index(std::shared_ptr<dolfin::MeshEntity> cell,
+                                  std::shared_ptr<dolfin::MeshEntity> facet)
+    {
+        return cell->index(*facet);
+    }
+
+    PYBIND11_MODULE(SIGNATURE, m)
+    {
+        m.def("local_facet_index", &local_facet_index);
+    }
+""")
+
 
 # ===== Helper function for sympy/ufl conversion ===== #
 @overload
@@ -498,18 +516,29 @@ def pull_back_expression_code(pull_back_expression_name, expression_constructor)
             "EXPRESSION_CONSTRUCTOR", expression_constructor)
 
 
-def PullBackExpression(shape_parametrization_expression_on_subdomain, f, problem):
-    shape_parametrization_expression_on_subdomain = ShapeParametrizationMap(
-        shape_parametrization_expression_on_subdomain, problem).ufl
-    assert len(f.ufl_shape) in (0, 1)
-    if len(f.ufl_shape) == 0:
+def pull_back_expression_name_and_constructor(shape):
+    assert len(shape) in (0, 1)
+    if len(shape) == 0:
         pull_back_expression_name = "PullBackExpressionScalar"
         expression_constructor = "Expression()"
-    elif len(f.ufl_shape) == 1:
-        pull_back_expression_name = "PullBackExpressionVector" + str(f.ufl_shape[0])
-        expression_constructor = "Expression(" + str(f.ufl_shape[0]) + ")"
+    elif len(shape) == 1:
+        pull_back_expression_name = "PullBackExpressionVector" + str(shape[0])
+        expression_constructor = "Expression(" + str(shape[0]) + ")"
     else:
         raise ValueError("Invalid shape")
+    return (pull_back_expression_name, expression_constructor)
+
+
+# Register pull back of scalar and vector expressions in two and three dimensions
+for shape in ((), (2, ), (3, )):
+    register_cpp_code(pull_back_expression_code(*pull_back_expression_name_and_constructor(shape)))
+del shape
+
+
+def PullBackExpression(shape_parametrization_expression_on_subdomain, f, problem):
+    shape_parametrization_expression_on_subdomain = ShapeParametrizationMap(
+        shape_parametrization_expression_on_subdomain, problem).ufl
+    (pull_back_expression_name, expression_constructor) = pull_back_expression_name_and_constructor(f.ufl_shape)
     PullBackExpression = getattr(compile_cpp_code(pull_back_expression_code(
         pull_back_expression_name, expression_constructor)), pull_back_expression_name)
     pulled_back_f_cpp = PullBackExpression(f._cpp_object, shape_parametrization_expression_on_subdomain._cpp_object)
@@ -935,22 +964,7 @@ def PullBackFormsToReferenceDomainDecoratedProblem(**decorator_kwargs):
 
             def _map_facet_id_to_normal_direction_if_straight(self, **kwargs):
                 # Auxiliary pybind11 wrapper
-                cpp_code = """
-                    #include <pybind11/pybind11.h>
-                    #include <dolfin/mesh/MeshEntity.h>
-
-                    std::size_t local_facet_index(std::shared_ptr<dolfin::MeshEntity> cell,
-                                                  std::shared_ptr<dolfin::MeshEntity> facet)
-                    {
-                        return cell->index(*facet);
-                    }
-
-                    PYBIND11_MODULE(SIGNATURE, m)
-                    {
-                        m.def("local_facet_index", &local_facet_index);
-                    }
-                """
-                local_facet_index = compile_cpp_code(cpp_code).local_facet_index
+                local_facet_index = compile_cpp_code(_local_facet_index_cpp_code).local_facet_index
                 # Process input arguments
                 mesh = self.V.mesh()
                 dim = mesh.topology().dim()
@@ -0,0 +1,157 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from mpi4py.MPI import SUM
+from numpy import array_equal, empty, searchsorted, zeros
+from dolfin.cpp.la import GenericMatrix, GenericVector
+from rbnics.backends.dolfin.wrapping.tensor_copy import tensor_copy
+from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
+from rbnics.utils.decorators import overload
+
+
+# Storage for tensors sharing the same sparsity pattern (e.g. all the assembled snapshots of a parametrized form),
+# which keeps a single copy of the pattern and a dense array of the local nonzero values, one column per tensor.
+class TensorValuesArray(object):
+    def __init__(self, mpi_comm):
+        self.mpi_comm = mpi_comm
+        self._template = None  # copy of the first tensor, used to create tensors from their values
+        self._sparsity_pattern = None  # local row pointers and column indices (or local size, for vectors)
+        self._row_start = None  # first row owned by the current processor
+        self._content = zeros((0, 0), order="F")  # 2D array, of which only the first self._length columns are used
+        self._length = 0
+
+    def append(self, tensor):
+        """
+        Append the values of tensor, and return True, if tensor shares the sparsity pattern of the stored ones.
+        Otherwise, leave the storage unchanged and return False.
+        """
+        (sparsity_pattern, values) = _get_sparsity_pattern_and_values(tensor)
+        if self._template is None:
+            self._template = tensor_copy(tensor)
+            self._sparsity_pattern = sparsity_pattern
+            (self._row_start, _) = to_petsc4py(tensor).getOwnershipRange()
+        elif not _sparsity_patterns_are_equal(sparsity_pattern, self._sparsity_pattern):
+            return False
+        # Capacity is doubled when exhausted, so that appending does not copy the stored values every time
+        if self._length == self._content.shape[1]:
+            content = empty((values.size, max(2 * self._length, 1)), order="F")
+            content[:, :self._length] = self._content[:, :self._length]
+            self._content = content
+        self._content[:, self._length] = values
+        self._length += 1
+        return True
+
+    def __len__(self):
+        return self._length
+
+    @overload(int)
+    def __getitem__(self, key):
+        return self._tensor_from_values(self._get_content()[:, key])
+
+    @overload(slice)
+    def __getitem__(self, key):
+        output = TensorValuesArray(self.mpi_comm)
+        output._template = self._template
+        output._sparsity_pattern = self._sparsity_pattern
+        output._row_start = self._row_start
+        output._content = self._get_content()[:, key]  # a view, since values are never changed after append
+        output._length = output._content.shape[1]
+        return output
+
+    def __mul__(self, online_function):
+        # Linear combination of the stored tensors, with coefficients provided by online_function
+        online_vector = online_function.vector()
+        coefficients = [online_vector[i] for i in range(self._length)]
+        return self._tensor_from_values(self._get_content().dot(coefficients))
+
+    def inner(self, other):
+        """
+        Return the matrix of (vectorized) inner products between each stored tensor and each tensor in other.
+        """
+        assert _sparsity_patterns_are_equal(self._sparsity_pattern, other._sparsity_pattern)
+        return self.mpi_comm.allreduce(self._get_content().T.dot(other._get_content()), op=SUM)
+
+    def evaluate_at_dofs(self, dofs_list):
+        """
+        Return a 2D array with the entries at dofs_list (a list of (i, ) for vectors, or of (i, j) for matrices)
+        of each stored tensor, one column per tensor, read directly from the stored values.
+        """
+        content = self._get_content()
+        output = zeros((len(dofs_list), self._length))
+        for (index, dofs) in enumerate(dofs_list):
+            position = _get_local_position(self._sparsity_pattern, self._row_start, dofs)
+            if position is not None:
+                output[index] = content[position]
+        return self.mpi_comm.allreduce(output, op=SUM)
+
+    def _get_content(self):
+        return self._content[:, :self._length]
+
+    def _tensor_from_values(self, values):
+        output = tensor_copy(self._template)
+        _set_values(output, self._sparsity_pattern, values)
+        return output
+
+
+@overload
+def _get_sparsity_pattern_and_values(matrix: GenericMatrix):
+    (row_pointers, column_indices, values) = to_petsc4py(matrix).getValuesCSR()
+    return ((row_pointers, column_indices), values.copy())
+
+
+@overload
+def _get_sparsity_pattern_and_values(vector: GenericVector):
+    values = vector.get_local()
+    return (values.size, values)
+
+
+def _sparsity_patterns_are_equal(sparsity_pattern, other_sparsity_pattern):
+    if isinstance(sparsity_pattern, tuple) and isinstance(other_sparsity_pattern, tuple):
+        return all(array_equal(array_1, array_2) for (array_1, array_2) in zip(
+            sparsity_pattern, other_sparsity_pattern))
+    else:
+        return sparsity_pattern == other_sparsity_pattern
+
+
+@overload
+def _set_values(matrix: GenericMatrix, sparsity_pattern: tuple, values: object):
+    mat = to_petsc4py(matrix)
+    (row_pointers, column_indices) = sparsity_pattern
+    mat.setValuesCSR(row_pointers, column_indices, values)
+    mat.assemble()
+
+
+@overload
+def _set_values(vector: GenericVector, sparsity_pattern: int, values: object):
+    vector.set_local(values)
+    vector.apply("insert")
+
+
+# Return the position in the local values of the entry at the given (global) dofs, or None if such entry is
+# not owned by the current processor or it is not part of the sparsity pattern
+@overload
+def _get_local_position(sparsity_pattern: tuple, row_start: int, dofs: object):
+    assert len(dofs) == 2
+    (row_pointers, column_indices) = sparsity_pattern
+    local_row = dofs[0] - row_start
+    if local_row < 0 or local_row >= len(row_pointers) - 1:
+        return None
+    (begin, end) = (row_pointers[local_row], row_pointers[local_row + 1])
+    position = begin + searchsorted(column_indices[begin:end], dofs[1])
+    if position < end and column_indices[position] == dofs[1]:
+        return position
+    else:
+        return None
+
+
+@overload
+def _get_local_position(sparsity_pattern: int, row_start: int, dofs: object):
+    assert len(dofs) == 1
+    local_row = dofs[0] - row_start
+    if local_row < 0 or local_row >= sparsity_pattern:
+        return None
+    else:
+        return local_row
@@ -5,8 +5,9 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from numbers import Number
-from rbnics.backends.online.basic.wrapping import slice_to_array, slice_to_size
-from rbnics.utils.io import ComponentNameToBasisComponentIndexDict, OnlineSizeDict
+from rbnics.backends.online.basic.wrapping import (component_layout, layouts_are_equal, slice_to_array,
+                                                   slice_to_size)
+from rbnics.utils.io import OnlineSizeDict
 
 
 def Matrix(backend, wrapping, MatrixBaseType):
@@ -28,37 +29,19 @@ def Matrix(backend, wrapping, MatrixBaseType):
                 self.content = MatrixBaseType(M_sum, N_sum)
             else:
                 self.content = content
-            # Auxiliary attributes related to basis functions matrix
+            # Auxiliary attributes related to basis functions matrix, shared with all matrices with the same layout
             if isinstance(M, dict):
-                if len(M) > 1:
-                    # ordering (stored by OnlineSizeDict, which inherits from OrderedDict) is important
-                    # in the definition of attributes
-                    assert isinstance(M, OnlineSizeDict)
-                else:
-                    self.M = M = OnlineSizeDict(M)
-                if len(N) > 1:
-                    # ordering (stored by OnlineSizeDict, which inherits from OrderedDict) is important
-                    # in the definition of attributes
-                    assert isinstance(N, OnlineSizeDict)
-                else:
-                    self.N = N = OnlineSizeDict(N)
-                component_name_to_basis_component_index_0 = ComponentNameToBasisComponentIndexDict()
-                component_name_to_basis_component_length_0 = OnlineSizeDict()
-                for (component_index, (component_name, component_length)) in enumerate(M.items()):
-                    component_name_to_basis_component_index_0[component_name] = component_index
-                    component_name_to_basis_component_length_0[component_name] = component_length
-                component_name_to_basis_component_index_1 = ComponentNameToBasisComponentIndexDict()
-                component_name_to_basis_component_length_1 = OnlineSizeDict()
-                for (component_index, (component_name, component_length)) in enumerate(N.items()):
-                    component_name_to_basis_component_index_1[component_name] = component_index
-                    component_name_to_basis_component_length_1[component_name] = component_length
+                layout_0 = component_layout(M)
+                layout_1 = component_layout(N)
+                self.M = layout_0.component_name_to_basis_component_length
+                self.N = layout_1.component_name_to_basis_component_length
                 self._component_name_to_basis_component_index = (
-                    component_name_to_basis_component_index_0,
-                    component_name_to_basis_component_index_1
+                    layout_0.component_name_to_basis_component_index,
+                    layout_1.component_name_to_basis_component_index
                 )
                 self._component_name_to_basis_component_length = (
-                    component_name_to_basis_component_length_0,
-                    component_name_to_basis_component_length_1
+                    layout_0.component_name_to_basis_component_length,
+                    layout_1.component_name_to_basis_component_length
                 )
             else:
                 self._component_name_to_basis_component_index = (None, None)
@@ -283,18 +266,18 @@ def Matrix(backend, wrapping, MatrixBaseType):
         def _arithmetic_operations_assert_attributes(self, other, other_order=2):
             assert other_order in (0, 1, 2)
             if other_order == 2:
-                assert self.M == other.M
-                assert self.N == other.N
-                assert (self._component_name_to_basis_component_index
-                        == other._component_name_to_basis_component_index)
-                assert (self._component_name_to_basis_component_length
-                        == other._component_name_to_basis_component_length)
+                assert layouts_are_equal(self.M, other.M)
+                assert layouts_are_equal(self.N, other.N)
+                assert layouts_are_equal(self._component_name_to_basis_component_index,
+                                         other._component_name_to_basis_component_index)
+                assert layouts_are_equal(self._component_name_to_basis_component_length,
+                                         other._component_name_to_basis_component_length)
             elif other_order == 1:
-                assert self.N == other.N
-                assert (self._component_name_to_basis_component_index[1]
-                        == other._component_name_to_basis_component_index)
-                assert (self._component_name_to_basis_component_length[1]
-                        == other._component_name_to_basis_component_length)
+                assert layouts_are_equal(self.N, other.N)
+                assert layouts_are_equal(self._component_name_to_basis_component_index[1],
+                                         other._component_name_to_basis_component_index)
+                assert layouts_are_equal(self._component_name_to_basis_component_length[1],
+                                         other._component_name_to_basis_component_length)
 
         def _arithmetic_operations_preserve_attributes(self, output, other_order=2):
             assert other_order in (0, 1, 2)
@@ -5,8 +5,9 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from numbers import Number
-from rbnics.backends.online.basic.wrapping import slice_to_array, slice_to_size
-from rbnics.utils.io import ComponentNameToBasisComponentIndexDict, OnlineSizeDict
+from rbnics.backends.online.basic.wrapping import (component_layout, layouts_are_equal, slice_to_array,
+                                                   slice_to_size)
+from rbnics.utils.io import OnlineSizeDict
 
 
 def Vector(backend, wrapping, VectorBaseType):
@@ -23,19 +24,12 @@ def Vector(backend, wrapping, VectorBaseType):
                 self.content = VectorBaseType(N_sum)
             else:
                 self.content = content
-            # Auxiliary attributes related to basis functions matrix
+            # Auxiliary attributes related to basis functions matrix, shared with all vectors with the same layout
             if isinstance(N, dict):
-                if len(N) > 1:
-                    # ordering (stored by OnlineSizeDict, which inherits from OrderedDict) is important
-                    # in the definition of attributes
-                    assert isinstance(N, OnlineSizeDict)
-                else:
-                    self.N = N = OnlineSizeDict(N)
-                self._component_name_to_basis_component_index = ComponentNameToBasisComponentIndexDict()
-                self._component_name_to_basis_component_length = OnlineSizeDict()
-                for (component_index, (component_name, component_length)) in enumerate(N.items()):
-                    self._component_name_to_basis_component_index[component_name] = component_index
-                    self._component_name_to_basis_component_length[component_name] = component_length
+                layout = component_layout(N)
+                self.N = layout.component_name_to_basis_component_length
+                self._component_name_to_basis_component_index = layout.component_name_to_basis_component_index
+                self._component_name_to_basis_component_length = layout.component_name_to_basis_component_length
             else:
                 self._component_name_to_basis_component_index = None
                 self._component_name_to_basis_component_length = None
@@ -216,9 +210,11 @@ def Vector(backend, wrapping, VectorBaseType):
         def _arithmetic_operations_assert_attributes(self, other, other_order=1):
             assert other_order in (0, 1)
             if other_order == 1:
-                assert self.N == other.N
-                assert self._component_name_to_basis_component_index == other._component_name_to_basis_component_index
-                assert self._component_name_to_basis_component_length == other._component_name_to_basis_component_length
+                assert layouts_are_equal(self.N, other.N)
+                assert layouts_are_equal(self._component_name_to_basis_component_index,
+                                         other._component_name_to_basis_component_index)
+                assert layouts_are_equal(self._component_name_to_basis_component_length,
+                                         other._component_name_to_basis_component_length)
 
         def _arithmetic_operations_preserve_attributes(self, output, other_order=1):
             assert other_order in (0, 1)
@@ -4,6 +4,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from rbnics.backends.online.basic.wrapping.component_layout import component_layout, ComponentLayout, layouts_are_equal
 from rbnics.backends.online.basic.wrapping.delayed_transpose_with_arithmetic import DelayedTransposeWithArithmetic
 from rbnics.backends.online.basic.wrapping.DirichletBC import DirichletBC
 from rbnics.backends.online.basic.wrapping.function_to_vector import function_to_vector
@@ -12,9 +13,12 @@ from rbnics.backends.online.basic.wrapping.slice_to_array import slice_to_array
 from rbnics.backends.online.basic.wrapping.slice_to_size import slice_to_size
 
 __all__ = [
+    "component_layout",
+    "ComponentLayout",
     "DelayedTransposeWithArithmetic",
     "DirichletBC",
     "function_to_vector",
+    "layouts_are_equal",
     "preserve_solution_attributes",
     "slice_to_array",
     "slice_to_size"
@@ -0,0 +1,74 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from rbnics.utils.io import ComponentNameToBasisComponentIndexDict, OnlineSizeDict
+
+
+# Component layout of (one dimension of) an online tensor, i.e. the ordered sizes of each component
+# and the index of each component. Layouts are interned, so that online tensors with the same layout
+# share the same (immutable) dictionaries, and compatibility checks reduce to identity comparisons.
+class ComponentLayout(object):
+    __slots__ = ("component_name_to_basis_component_index", "component_name_to_basis_component_length")
+
+    def __init__(self, items):
+        self.component_name_to_basis_component_index = _FrozenComponentNameToBasisComponentIndexDict(
+            (component_name, component_index) for (component_index, (component_name, _)) in enumerate(items))
+        self.component_name_to_basis_component_length = _FrozenOnlineSizeDict(items)
+        self.component_name_to_basis_component_length._layout = self
+
+
+def component_layout(N):
+    assert isinstance(N, dict)
+    if isinstance(N, _FrozenOnlineSizeDict):
+        return N._layout
+    # ordering (stored by OnlineSizeDict, which inherits from OrderedDict) is important
+    # in the definition of the layout
+    assert len(N) == 1 or isinstance(N, OnlineSizeDict)
+    key = tuple(N.items())
+    try:
+        return _component_layouts[key]
+    except KeyError:
+        layout = ComponentLayout(key)
+        _component_layouts[key] = layout
+        return layout
+
+
+def layouts_are_equal(layout, other_layout):
+    # Interned layouts are compared by identity, falling back to a comparison by value only for
+    # attributes which are not interned (e.g., integer sizes of sliced tensors)
+    return layout is other_layout or layout == other_layout
+
+
+_component_layouts = dict()  # from tuple of (component name, size) pairs to ComponentLayout
+
+
+def _raise_frozen_error(self, *args, **kwargs):
+    raise TypeError("Component layouts of online tensors cannot be modified")
+
+
+class _FrozenOnlineSizeDict(OnlineSizeDict):
+    __slots__ = ("_layout", )
+
+    def __init__(self, items):
+        for (key, value) in items:
+            OnlineSizeDict.__setitem__(self, key, value)
+        self._layout = None
+
+    def __reduce__(self):
+        return (OnlineSizeDict, (list(self.items()), ))
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _raise_frozen_error
+
+
+class _FrozenComponentNameToBasisComponentIndexDict(ComponentNameToBasisComponentIndexDict):
+    def __init__(self, items):
+        for (key, value) in items:
+            ComponentNameToBasisComponentIndexDict.__setitem__(self, key, value)
+
+    def __reduce__(self):
+        return (ComponentNameToBasisComponentIndexDict, (list(self.items()), ))
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _raise_frozen_error
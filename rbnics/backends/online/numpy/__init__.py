@@ -18,9 +18,11 @@ from rbnics.backends.online.numpy.gram_schmidt import GramSchmidt
 from rbnics.backends.online.numpy.high_order_proper_orthogonal_decomposition import (
     HighOrderProperOrthogonalDecomposition)
 from rbnics.backends.online.numpy.import_ import import_
+from rbnics.backends.online.numpy.kkt_linear_solver import KKTLinearSolver
 from rbnics.backends.online.numpy.linear_solver import LinearSolver
 from rbnics.backends.online.numpy.matrix import Matrix
 from rbnics.backends.online.numpy.max import max
+from rbnics.backends.online.numpy.nested_linear_solver import NestedLinearSolver
 from rbnics.backends.online.numpy.non_affine_expansion_storage import NonAffineExpansionStorage
 from rbnics.backends.online.numpy.nonlinear_solver import NonlinearSolver
 from rbnics.backends.online.numpy.product import product
@@ -49,9 +51,11 @@ __all__ = [
     "GramSchmidt",
     "HighOrderProperOrthogonalDecomposition",
     "import_",
+    "KKTLinearSolver",
     "LinearSolver",
     "Matrix",
     "max",
+    "NestedLinearSolver",
     "NonAffineExpansionStorage",
     "NonlinearSolver",
     "product",
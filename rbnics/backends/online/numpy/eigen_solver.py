@@ -33,6 +33,9 @@ class EigenSolver(AbstractEigenSolver):
     def set_parameters(self, parameters):
         self.parameters.update(parameters)
 
+    def set_initial_space(self, initial_space):
+        pass  # dense eigen solvers do not make use of an initial guess
+
     def solve(self, n_eigs=None):
         assert "problem_type" in self.parameters
         if self.parameters["problem_type"] in ("hermitian", "gen_hermitian"):
@@ -0,0 +1,145 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from warnings import catch_warnings, simplefilter
+from numpy import allclose, arange, array_equal, asarray, concatenate, finfo, inf, ix_, sqrt, zeros
+from numpy.linalg import LinAlgError, norm, solve
+from scipy.linalg import LinAlgWarning, lu_factor, lu_solve
+from rbnics.backends.abstract import KKTLinearSolver as AbstractKKTLinearSolver, LinearProblemWrapper
+from rbnics.backends.online.numpy.function import Function
+from rbnics.backends.online.numpy.linear_solver import LinearSolver
+from rbnics.utils.decorators import BackendFor
+
+
+@BackendFor("numpy", inputs=(LinearProblemWrapper, Function.Type()))
+class KKTLinearSolver(AbstractKKTLinearSolver):
+    # The optimality system
+    #     [K_yy    0   K_yp] [y]   [g_y]
+    #     [  0   K_uu  K_up] [u] = [g_u]
+    #     [K_py  K_pu    0 ] [p]   [g_p]
+    # is solved by eliminating the state y and the adjoint p, so that the only system to be solved is
+    # the Schur complement on the control u. The factorizations of the state block K_py and of the adjoint
+    # block K_yp (which is not factorized if it is the transpose of the state block) are stored in
+    # factorizations, and reused by later solves as long as the blocks do not change.
+    # If the system does not have such a structure (e.g. because of non-homogeneous boundary conditions),
+    # if the state or adjoint block is singular (e.g. because of rows associated to boundary conditions),
+    # or if the relative residual of the solution by elimination is not small, the system is solved
+    # monolithically.
+
+    def __init__(self, problem_wrapper, solution, state_components=None, control_components=None,
+                 adjoint_components=None, factorizations=None):
+        assert state_components is not None
+        assert control_components is not None
+        assert adjoint_components is not None
+        # Assemble operators and apply boundary conditions as in the standard linear solver
+        self._linear_solver = LinearSolver(problem_wrapper, solution)
+        self.solution = solution
+        self.monitor = self._linear_solver.monitor
+        self.lhs = asarray(self._linear_solver.lhs)
+        self.rhs = asarray(self._linear_solver.rhs)
+        # Indices of each block
+        component_name_to_basis_component_index = self._linear_solver.lhs._component_name_to_basis_component_index[0]
+        sizes = self._linear_solver.lhs.M
+        first_index = dict()
+        current_first_index = 0
+        for component_name in component_name_to_basis_component_index.keys():
+            first_index[component_name] = current_first_index
+            current_first_index += sizes[component_name]
+
+        def block_indices(components):
+            return concatenate([arange(first_index[c], first_index[c] + sizes[c]) for c in components]).astype(int)
+
+        self._y = block_indices(state_components)
+        self._u = block_indices(control_components)
+        self._p = block_indices(adjoint_components)
+        # Storage for factorizations
+        if factorizations is None:
+            factorizations = dict()
+        self._factorizations = factorizations
+
+    def set_parameters(self, parameters):
+        self._linear_solver.set_parameters(parameters)
+
+    def solve(self):
+        solution = self._solve_structured()
+        if solution is None:
+            solution = solve(self.lhs, self.rhs)
+        self.solution.vector()[:] = solution
+        if self.monitor is not None:
+            self.monitor(self.solution)
+
+    def _solve_structured(self):
+        (y, u, p) = (self._y, self._u, self._p)
+        lhs = self.lhs
+        if len(y) != len(p) or len(u) == 0:
+            return None
+        if lhs[ix_(y, u)].any() or lhs[ix_(u, y)].any() or lhs[ix_(p, p)].any():
+            return None
+        K_yy = lhs[ix_(y, y)]
+        K_yp = lhs[ix_(y, p)]
+        K_uu = lhs[ix_(u, u)]
+        K_up = lhs[ix_(u, p)]
+        K_py = lhs[ix_(p, y)]
+        K_pu = lhs[ix_(p, u)]
+        (g_y, g_u, g_p) = (self.rhs[y], self.rhs[u], self.rhs[p])
+        # Solvers for the state and adjoint blocks
+        state_lu = self._factorize("state", K_py)
+        if state_lu is None:
+            return None
+
+        def solve_state(rhs):
+            return lu_solve(state_lu, rhs)
+
+        # Entries which vanish up to round-off are compared with a tolerance relative to the norm of the block
+        if allclose(K_yp, K_py.T, rtol=1.e-12, atol=1.e-12 * norm(K_py, inf)):
+            def solve_adjoint(rhs):
+                return lu_solve(state_lu, rhs, trans=1)
+        else:
+            adjoint_lu = self._factorize("adjoint", K_yp)
+            if adjoint_lu is None:
+                return None
+
+            def solve_adjoint(rhs):
+                return lu_solve(adjoint_lu, rhs)
+        # Express state and adjoint as affine functions of the control, i.e.
+        # y = y_0 - Z u and p = p_0 + W u
+        y_0 = solve_state(g_p)
+        Z = solve_state(K_pu)
+        p_0 = solve_adjoint(g_y - K_yy.dot(y_0))
+        W = solve_adjoint(K_yy.dot(Z))
+        # Solve the Schur complement system on the control
+        try:
+            u_solution = solve(K_uu + K_up.dot(W), g_u - K_up.dot(p_0))
+        except LinAlgError:
+            return None
+        solution = zeros(lhs.shape[0])
+        solution[y] = y_0 - Z.dot(u_solution)
+        solution[u] = u_solution
+        solution[p] = p_0 + W.dot(u_solution)
+        # Elimination is unstable when the state block is ill conditioned, even if the whole system is not:
+        # discard the solution if its relative residual is not small (or not finite)
+        residual = lhs.dot(solution) - self.rhs
+        if not norm(residual) <= _residual_tolerance * (norm(lhs) * norm(solution) + norm(self.rhs)):
+            return None
+        return solution
+
+    def _factorize(self, key, block):
+        if key in self._factorizations:
+            (factorized_block, lu) = self._factorizations[key]
+            if factorized_block.shape == block.shape and array_equal(factorized_block, block):
+                return lu
+        with catch_warnings():
+            simplefilter("error", LinAlgWarning)
+            try:
+                lu = lu_factor(block)
+            except (LinAlgWarning, ValueError):
+                # Singular (or non-finite) block: the system will be solved monolithically
+                return None
+        self._factorizations[key] = (block.copy(), lu)
+        return lu
+
+
+_residual_tolerance = sqrt(finfo(float).eps)
@@ -0,0 +1,69 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import asarray, finfo, inf
+from numpy.linalg import cholesky, LinAlgError, norm
+from scipy.linalg import lu_factor, lu_solve, solve_triangular
+from rbnics.backends.abstract import LinearProblemWrapper, NestedLinearSolver as AbstractNestedLinearSolver
+from rbnics.backends.online.numpy.function import Function
+from rbnics.backends.online.numpy.linear_solver import LinearSolver
+from rbnics.utils.decorators import BackendFor
+
+
+@BackendFor("numpy", inputs=(LinearProblemWrapper, Function.Type()))
+class NestedLinearSolver(AbstractNestedLinearSolver):
+    # Symmetric positive definite systems are factorized by Cholesky, without pivoting, so that the factor of each
+    # leading principal block is the leading block of the factor, and every nested solve only costs a backward
+    # substitution. Any other system (e.g. indefinite saddle point systems, or systems with boundary conditions
+    # rows) is solved by a pivoted LU factorization of each leading principal block, still from a single assembly.
+
+    def __init__(self, problem_wrapper, solution):
+        # Assemble operators and apply boundary conditions as in the standard linear solver
+        self._linear_solver = LinearSolver(problem_wrapper, solution)
+        self.solution = solution
+        self.monitor = self._linear_solver.monitor
+        self.lhs = asarray(self._linear_solver.lhs)
+        self.rhs = asarray(self._linear_solver.rhs)
+        # Storage for factorization
+        self._cholesky = None
+        self._forward_substitution = None
+        self._factorized = False
+
+    def set_parameters(self, parameters):
+        self._linear_solver.set_parameters(parameters)
+
+    def solve(self):
+        self._factorize()
+        self._solve(self.solution)
+        if self.monitor is not None:
+            self.monitor(self.solution)
+
+    def solve_nested(self, solution):
+        assert self._factorized, "Please call solve() first"
+        self._solve(solution)
+
+    def _factorize(self):
+        self._cholesky = None
+        self._forward_substitution = None
+        lhs = self.lhs
+        N = lhs.shape[0]
+        if norm(lhs - lhs.T, inf) <= 100 * N * finfo(float).eps * norm(lhs, inf):
+            try:
+                self._cholesky = cholesky(lhs)
+            except LinAlgError:  # symmetric, but not positive definite
+                pass
+            else:
+                self._forward_substitution = solve_triangular(self._cholesky, self.rhs, lower=True)
+        self._factorized = True
+
+    def _solve(self, solution):
+        N = solution.vector().N
+        assert N <= self.lhs.shape[0]
+        if self._cholesky is not None:
+            solution.vector()[:] = solve_triangular(
+                self._cholesky[:N, :N], self._forward_substitution[:N], lower=True, trans="T")
+        else:
+            solution.vector()[:] = lu_solve(lu_factor(self.lhs[:N, :N]), self.rhs[:N])
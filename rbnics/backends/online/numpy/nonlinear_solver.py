@@ -5,9 +5,9 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from mpi4py.MPI import COMM_WORLD
-from numpy import dot
-from numpy.linalg import solve
-from scipy.optimize._nonlin import Jacobian, nonlin_solve
+from numpy import array, finfo, inf, isfinite
+from numpy.linalg import LinAlgError, norm
+from scipy.linalg import lu_factor, lu_solve
 from rbnics.backends.abstract import NonlinearSolver as AbstractNonlinearSolver, NonlinearProblemWrapper
 from rbnics.backends.online.basic.nonlinear_solver import _NonlinearProblem as _BasicNonlinearProblem
 from rbnics.backends.online.numpy.function import Function
@@ -29,9 +29,9 @@ class NonlinearSolver(AbstractNonlinearSolver):
         self.monitor = problem_wrapper.monitor
         # Additional storage which will be setup by set_parameters
         self._absolute_tolerance = None
+        self._jacobian_reuse = 0
         self._line_search = True
         self._maximum_iterations = None
-        self._monitor = None
         self._relative_tolerance = None
         self._report = False
         self._solution_tolerance = None
@@ -40,6 +40,9 @@ class NonlinearSolver(AbstractNonlinearSolver):
         for (key, value) in parameters.items():
             if key == "absolute_tolerance":
                 self._absolute_tolerance = value
+            elif key == "jacobian_reuse":
+                assert isinstance(value, int) and value >= 0
+                self._jacobian_reuse = value
             elif key == "line_search":
                 self._line_search = value
             elif key == "maximum_iterations":
@@ -50,36 +53,101 @@ class NonlinearSolver(AbstractNonlinearSolver):
                 if COMM_WORLD.rank == 0:
                     self._report = value
                 else:
-                    # scipy's nonlin_solve outputs residuals to sys.stdout, which is not filtered in parallel
-                    # by the customization in rbnics.utils.mpi.print
+                    # Online solves are replicated on every process, so report only on the first one
                     self._report = False
             elif key == "solution_tolerance":
                 self._solution_tolerance = value
             else:
-                raise ValueError("Invalid paramater passed to scipy object.")
+                raise ValueError("Invalid paramater passed to numpy object.")
 
     def solve(self):
-        residual = self.problem.residual_vector_eval
-        initial_guess_vector = self.problem.solution.vector()
-        jacobian = _Jacobian(self.problem.jacobian_matrix_eval)
+        # Default tolerances are the same of scipy's nonlin_solve, which was previously employed
+        absolute_tolerance = self._absolute_tolerance
+        if absolute_tolerance is None:
+            absolute_tolerance = finfo(float).eps**(1. / 3.)
+        relative_tolerance = self._relative_tolerance
+        if relative_tolerance is None:
+            relative_tolerance = inf
+        solution_tolerance = self._solution_tolerance
+        if solution_tolerance is None:
+            solution_tolerance = inf
+        solution = array(self.problem.solution.vector())
+        maximum_iterations = self._maximum_iterations
+        if maximum_iterations is None:
+            maximum_iterations = 100 * (solution.size + 1)
+        # Newton iterations: the jacobian is assembled and factorized at most once per iteration, and
+        # possibly reused in the following self._jacobian_reuse iterations (chord method)
+        converged = False
+        iteration = 0
+        jacobian_factors = None
+        jacobian_age = 0
         try:
-            solution_vector, info = nonlin_solve(
-                residual, initial_guess_vector, jacobian=jacobian, verbose=self._report,
-                f_tol=self._absolute_tolerance, f_rtol=self._relative_tolerance,
-                x_rtol=self._solution_tolerance, maxiter=self._maximum_iterations,
-                line_search=self._line_search, callback=self._monitor,
-                full_output=True, raise_exception=False)
+            residual = self._residual_eval(solution)
+            residual_norm = norm(residual, inf)
+            initial_residual_norm = residual_norm
+            converged = (residual_norm == 0.)
+            while not converged and iteration < maximum_iterations:
+                jacobian_is_reused = (jacobian_factors is not None and jacobian_age <= self._jacobian_reuse)
+                if not jacobian_is_reused:
+                    jacobian_factors = lu_factor(array(self.problem.jacobian_matrix_eval(solution)))
+                    jacobian_age = 0
+                increment = - lu_solve(jacobian_factors, residual)
+                jacobian_age += 1
+                if norm(increment, inf) == 0.:
+                    raise FloatingPointError("jacobian inversion yielded zero vector")
+                (step, new_solution, new_residual) = self._line_search_eval(solution, residual, increment)
+                new_residual_norm = norm(new_residual, inf)
+                if jacobian_is_reused and new_residual_norm >= residual_norm:
+                    # The outdated jacobian did not provide a descent direction: discard the step and assemble
+                    # the jacobian at the current solution
+                    jacobian_factors = None
+                    continue
+                iteration += 1
+                if self._report:
+                    print("{}:  |F(x)| = {:g}; step {:g}".format(iteration, new_residual_norm, step))
+                converged = (
+                    new_residual_norm <= absolute_tolerance
+                    and new_residual_norm <= relative_tolerance * initial_residual_norm
+                    and step * norm(increment, inf) <= solution_tolerance * norm(new_solution, inf))
+                (solution, residual, residual_norm) = (new_solution, new_residual, new_residual_norm)
             if self._report:
-                if info["success"]:
-                    print("scipy solver converged in " + str(info["nit"]) + " iterations.")
+                if converged:
+                    print("Newton solver converged in " + str(iteration) + " iterations.")
                 else:
-                    print("scipy solver diverged in " + str(info["nit"]) + " iterations.")
-            self.problem.solution.vector()[:] = solution_vector
-        except ArithmeticError as error:
+                    print("Newton solver diverged in " + str(iteration) + " iterations.")
+        except (ArithmeticError, LinAlgError) as error:
             if self._report:
-                print("scipy solver diverged due to arithmetic error " + str(error))
+                print("Newton solver diverged due to arithmetic error " + str(error))
+        self.problem.solution.vector()[:] = solution
         self.monitor(self.problem.solution)
 
+    def _residual_eval(self, solution):
+        residual = array(self.problem.residual_vector_eval(solution))
+        if not all(isfinite(residual)):
+            raise FloatingPointError("residual is not finite")
+        return residual
+
+    def _line_search_eval(self, solution, residual, increment):
+        # Backtracking line search, based on sufficient decrease of the euclidean norm of the residual
+        step = 1.
+        new_solution = solution + increment
+        if self._line_search:
+            residual_norm = norm(residual)
+            new_residual = array(self.problem.residual_vector_eval(new_solution))
+            while (not norm(new_residual) <= (1. - 1.e-4 * step) * residual_norm
+                   and step > _minimum_line_search_step):
+                step /= 2.
+                new_solution = solution + step * increment
+                new_residual = array(self.problem.residual_vector_eval(new_solution))
+            if not all(isfinite(new_residual)):
+                raise FloatingPointError("residual is not finite")
+        else:
+            new_residual = self._residual_eval(new_solution)
+        return (step, new_solution, new_residual)
+
+
+_minimum_line_search_step = 2.**(-10)
+
 
 class _NonlinearProblem(_NonlinearProblem_Base):
     def residual_vector_eval(self, solution):
@@ -103,32 +171,3 @@ class _NonlinearProblem(_NonlinearProblem_Base):
             self.bcs.apply_to_matrix(jacobian_matrix)
         # Return
         return jacobian_matrix
-
-
-# Adapted from scipy/optimize/nonlin.py, asjacobian method
-class _Jacobian(Jacobian):
-    def __init__(self, jacobian_eval):
-        self.jacobian_eval = jacobian_eval
-
-    def setup(self, x, F, func):
-        Jacobian.setup(self, x, F, func)
-        self.x = x
-
-    def update(self, x, F):
-        self.x = x
-
-    def solve(self, v, tol=0):
-        J = self.jacobian_eval(self.x)
-        return solve(J, v)
-
-    def matvec(self, v):
-        J = self.jacobian_eval(self.x)
-        return dot(J, v)
-
-    def rsolve(self, v, tol=0):
-        J = self.jacobian_eval(self.x)
-        return solve(J.T, v)
-
-    def rmatvec(self, v):
-        J = self.jacobian_eval(self.x)
-        return dot(J.T, v)
@@ -5,12 +5,11 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from numbers import Number
-try:
-    from scipy.integrate import simpson as simps
-except ImportError:
-    from scipy.integrate import simps
+from numpy import asarray, column_stack, einsum
 from rbnics.backends.abstract import TimeQuadrature as AbstractTimeQuadrature
+from rbnics.backends.basic.wrapping import time_quadrature_weights
 from rbnics.backends.online.numpy.function import Function
+from rbnics.backends.online.numpy.matrix import Matrix
 from rbnics.utils.decorators import BackendFor, list_of, tuple_of
 
 
@@ -20,14 +19,34 @@ class TimeQuadrature(AbstractTimeQuadrature):
         assert len(function_over_time) > 1
         self._time_step_size = (time_interval[1] - time_interval[0]) / (len(function_over_time) - 1)
         self._function_over_time = function_over_time
+        self._rule = "simpson"
+        self._content = None  # 2D array of reduced dofs, one column per time, computed only when required
+
+    def set_parameters(self, parameters):
+        for (key, value) in parameters.items():
+            if key == "rule":
+                self._rule = value
+            else:
+                raise ValueError("Invalid paramater passed to TimeQuadrature object.")
 
     def integrate(self):
-        vector_over_time = list()
-        N = self._function_over_time[0].N
-        for function in self._function_over_time:
-            assert function.N == N
-            vector_over_time.append(function.vector())
-        integrated_vector = simps(vector_over_time, dx=self._time_step_size, axis=0)
-        integrated_function = Function(N)
-        integrated_function.vector()[:] = integrated_vector
+        content = self._get_content()
+        integrated_function = Function(content.shape[0])
+        integrated_function.vector()[:] = content.dot(self._get_weights())
         return integrated_function
+
+    def integrate_inner_product(self, inner_product):
+        assert isinstance(inner_product, Matrix.Type())
+        content = self._get_content()
+        norms_squared_over_time = einsum("ij,ij->j", content, asarray(inner_product).dot(content))
+        return norms_squared_over_time.dot(self._get_weights())
+
+    def _get_content(self):
+        if self._content is None:
+            N = self._function_over_time[0].N
+            assert all(function.N == N for function in self._function_over_time)
+            self._content = column_stack([asarray(function.vector()) for function in self._function_over_time])
+        return self._content
+
+    def _get_weights(self):
+        return time_quadrature_weights(len(self._function_over_time), self._time_step_size, self._rule)
@@ -6,6 +6,8 @@
 
 import os
 import hashlib
+from numpy import asarray, zeros
+from scipy.linalg import lu_factor, lu_solve, solve_triangular
 from rbnics.problems.base import ParametrizedProblem
 from rbnics.backends import abs, assign, copy, evaluate, export, import_, max
 from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineFunction, OnlineLinearSolver
@@ -98,6 +100,25 @@ class EIMApproximation(ParametrizedProblem):
             self.snapshot = evaluate(self.parametrized_expression)
             self._snapshot_cache[self.mu] = copy(self.snapshot)
 
+    def evaluate_parametrized_expression_for_parameters(self, mus):
+        """
+        Store in the snapshot cache the evaluation of the parametrized expression for all parameters in mus,
+        computed as a single block. If the parametrized expression does not allow a block evaluation, the cache
+        is left unchanged, and parameters will be evaluated one at a time by evaluate_parametrized_expression().
+        """
+        snapshots = self._evaluate_parametrized_expression_for_parameters(mus)
+        if snapshots is not None:
+            for (mu, snapshot) in zip(mus, snapshots):
+                self.set_mu(mu)
+                try:
+                    self._snapshot_cache[self._cache_key()]
+                except KeyError:
+                    assign(self.snapshot, snapshot)
+                    self._snapshot_cache[self._cache_key()] = snapshot
+
+    def _evaluate_parametrized_expression_for_parameters(self, mus):
+        return self.parametrized_expression.evaluate_for_parameters(mus)
+
     def _cache_key(self):
         return self.mu
 
@@ -150,6 +171,41 @@ class EIMApproximation(ParametrizedProblem):
                 interpolated_theta_list.append(0.0)
         return tuple(interpolated_theta_list)
 
+    # Compute the interpolated thetas for several parameters at once, returning a (n_mu x self.N) array
+    def compute_interpolated_thetas(self, mus, N=None):
+        if N is None:
+            N = self.N
+
+        if self.parametrized_expression.auxiliary_problems_and_components() is not None:
+            raise ValueError(
+                "Interpolated thetas cannot be computed for several parameters at once when the parametrized"
+                + " expression involves solutions of other problems")
+
+        interpolated_thetas = zeros((len(mus), self.N))
+        if N > 0:
+            # Evaluate the parametrized expression at interpolation locations for all parameters, as a single
+            # block if possible, or otherwise by setting the truth problem to each parameter
+            rhs = self.parametrized_expression.evaluate_for_parameters_at(mus, self.interpolation_locations[:N])
+            if rhs is None:
+                mu_bak = self.mu
+                rhs = zeros((N, len(mus)))
+                try:
+                    for (i, mu) in enumerate(mus):
+                        self.set_mu(tuple(mu))
+                        rhs[:, i] = asarray(evaluate(self.parametrized_expression, self.interpolation_locations[:N]))
+                finally:
+                    self.set_mu(mu_bak)
+
+            # Solve the interpolation problem for all right-hand sides at once. The greedy algorithm
+            # generates basis functions which vanish at previously selected locations, so that the
+            # interpolation matrix is lower triangular, while this is not the case for POD basis functions
+            lhs = asarray(self.interpolation_matrix[0][:N, :N])
+            if self.basis_generation == "Greedy":
+                interpolated_thetas[:, :N] = solve_triangular(lhs, rhs, lower=True).T
+            else:
+                interpolated_thetas[:, :N] = lu_solve(lu_factor(lhs), rhs).T
+        return interpolated_thetas
+
     # Compute the interpolation error and/or its maximum location
     def compute_maximum_interpolation_error(self, N=None):
         if N is None:
@@ -105,6 +105,11 @@ class TimeDependentEIMApproximation(EIMApproximation):
             self.snapshot = evaluate(self.parametrized_expression)
             self._snapshot_cache[self.mu, self.t] = copy(self.snapshot)
 
+    def _evaluate_parametrized_expression_for_parameters(self, mus):
+        assert all(isinstance(mu, EnlargedMu) for mu in mus)
+        return self.parametrized_expression.evaluate_for_parameters(
+            [mu["mu"] for mu in mus], [mu["t"] for mu in mus])
+
     def _cache_key(self):
         return (self.mu, self.t)
 
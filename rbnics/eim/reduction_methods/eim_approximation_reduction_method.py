@@ -27,6 +27,8 @@ class EIMApproximationReductionMethod(ReductionMethod):
         # Declare a new container to store the snapshots
         self.snapshots_container = self.EIM_approximation.parametrized_expression.create_snapshots_container()
         self._training_set_parameters_to_snapshots_container_index = dict()
+        # Number of training parameters for which the parametrized expression is evaluated at once
+        self.snapshots_block_size = 100
         # I/O
         self.folder["snapshots"] = os.path.join(self.folder_prefix, "snapshots")
         self.folder["post_processing"] = os.path.join(self.folder_prefix, "post_processing")
@@ -36,6 +38,8 @@ class EIMApproximationReductionMethod(ReductionMethod):
         # By default set a tolerance slightly larger than zero, in order to
         # stop greedy iterations in trivial cases by default
         self.tol = 1e-15
+        # Checkpoint of an interrupted offline stage, if any
+        self._offline_checkpoint = None
 
     def initialize_training_set(self, ntrain, enable_import=True, sampling=None, **kwargs):
         import_successful = ReductionMethod.initialize_training_set(
@@ -76,22 +80,37 @@ class EIMApproximationReductionMethod(ReductionMethod):
         # speedup analysis folder is required only in the speedup analysis
         at_least_one_required_folder_created = required_folders.create()
         at_least_one_optional_folder_created = optional_folders.create()  # noqa: F841
-        if not at_least_one_required_folder_created:
+        checkpoint = self._load_offline_checkpoint()
+        self._offline_checkpoint = None
+        if not at_least_one_required_folder_created and (checkpoint is None or checkpoint["completed"]):
             return False  # offline construction should be skipped, since data are already available
         else:
+            # offline construction should be carried out, resuming it if it was previously interrupted:
+            # expensive evaluations are anyway retrieved from the disk cache
+            if checkpoint is not None and "greedy_selected_parameters" in checkpoint:
+                self._offline_checkpoint = checkpoint
             self.EIM_approximation.init("offline")
-            return True  # offline construction should be carried out
+            return True
 
     @snapshot_links_to_cache
     def _offline(self):
         interpolation_method_name = self.EIM_approximation.parametrized_expression.interpolation_method_name()
         description = self.EIM_approximation.parametrized_expression.description()
 
+        # Mark the offline stage as not completed, until the end of this method is reached
+        if self._offline_checkpoint is None:
+            self._save_offline_checkpoint(completed=False)
+
         # Evaluate the parametrized expression for all parameters in the training set
         print(TextBox(interpolation_method_name + " preprocessing phase begins for" + "\n"
                       + "\n".join(description), fill="="))
         print("")
 
+        # Evaluate blocks of parameters at once, when possible, so that the loop below reads snapshots from cache
+        for block_begin in range(0, len(self.training_set), self.snapshots_block_size):
+            self.EIM_approximation.evaluate_parametrized_expression_for_parameters(
+                self.training_set[block_begin:block_begin + self.snapshots_block_size])
+
         for (mu_index, mu) in enumerate(self.training_set):
             print(TextLine(interpolation_method_name + " " + str(mu_index), fill=":"))
 
@@ -121,10 +140,18 @@ class EIMApproximationReductionMethod(ReductionMethod):
         print("")
 
         if self.EIM_approximation.basis_generation == "Greedy":
-            # Initialize first parameter to be used
-            (error_max, relative_error_max) = self.greedy()
-            print("initial maximum interpolation error =", error_max)
-            print("initial maximum interpolation relative error =", relative_error_max)
+            if self._offline_checkpoint is None:
+                # Initialize first parameter to be used
+                (error_max, relative_error_max) = self.greedy()
+                print("initial maximum interpolation error =", error_max)
+                print("initial maximum interpolation relative error =", relative_error_max)
+                self._save_greedy_checkpoint()
+            else:
+                # Restore the last consistent state of the interrupted offline stage
+                (error_max, relative_error_max) = self._restore_greedy_checkpoint()
+                print("resume from checkpoint with N =", self.EIM_approximation.N)
+                print("maximum interpolation error =", error_max)
+                print("maximum interpolation relative error =", relative_error_max)
 
             print("")
 
@@ -132,25 +159,12 @@ class EIMApproximationReductionMethod(ReductionMethod):
             while self.EIM_approximation.N < self.Nmax and relative_error_max >= self.tol:
                 print(TextLine(interpolation_method_name + " N = " + str(self.EIM_approximation.N), fill=":"))
 
-                self._print_greedy_interpolation_solve_message()
-                self.EIM_approximation.solve()
-
-                print("compute and locate maximum interpolation error")
-                self.EIM_approximation.snapshot = self.load_snapshot()
-                (error, maximum_error, maximum_location) = self.EIM_approximation.compute_maximum_interpolation_error()
-
-                print("update locations with", maximum_location)
-                self.update_interpolation_locations(maximum_location)
-
-                print("update basis")
-                self.update_basis_greedy(error, maximum_error)
-
-                print("update interpolation matrix")
-                self.update_interpolation_matrix()
+                self._update_greedy()
 
                 (error_max, relative_error_max) = self.greedy()
                 print("maximum interpolation error =", error_max)
                 print("maximum interpolation relative error =", relative_error_max)
+                self._save_greedy_checkpoint()
 
                 print("")
         else:
@@ -174,10 +188,57 @@ class EIMApproximationReductionMethod(ReductionMethod):
 
                 print("")
 
+        self._save_offline_checkpoint(completed=True)
+
         print(TextBox(interpolation_method_name + " offline phase ends for" + "\n"
                       + "\n".join(description), fill="="))
         print("")
 
+    # Enrich the interpolation with the parametrized expression evaluated at the current parameter
+    def _update_greedy(self):
+        self._print_greedy_interpolation_solve_message()
+        self.EIM_approximation.solve()
+
+        print("compute and locate maximum interpolation error")
+        self.EIM_approximation.snapshot = self.load_snapshot()
+        (error, maximum_error, maximum_location) = self.EIM_approximation.compute_maximum_interpolation_error()
+
+        print("update locations with", maximum_location)
+        self.update_interpolation_locations(maximum_location)
+
+        print("update basis")
+        self.update_basis_greedy(error, maximum_error)
+
+        print("update interpolation matrix")
+        self.update_interpolation_matrix()
+
+    def _save_greedy_checkpoint(self):
+        # The tolerance is also stored, since it is tweaked by the greedy in trivial cases
+        self._save_offline_checkpoint(
+            completed=False, greedy_selected_parameters=list(self.greedy_selected_parameters),
+            greedy_errors=list(self.greedy_errors), tol=self.tol)
+
+    def _restore_greedy_checkpoint(self):
+        # Replay the interpolation updates of the interrupted run: snapshots are already available, and
+        # only the search of the next parameter over the training set is skipped
+        checkpoint = self._offline_checkpoint
+        for mu in checkpoint["greedy_selected_parameters"][:-1]:
+            self.EIM_approximation.set_mu(mu)
+            self._update_greedy()
+        for mu in checkpoint["greedy_selected_parameters"]:
+            self.greedy_selected_parameters.append(mu)
+        self.greedy_selected_parameters.save(self.folder["post_processing"], "mu_greedy")
+        for error in checkpoint["greedy_errors"]:
+            self.greedy_errors.append(error)
+        self.greedy_errors.save(self.folder["post_processing"], "error_max")
+        self.tol = checkpoint["tol"]
+        self.EIM_approximation.set_mu(self.greedy_selected_parameters[-1])
+        error_max = self.greedy_errors[-1]
+        if abs(self.greedy_errors[0]) > 0.:
+            return (abs(error_max), abs(error_max / self.greedy_errors[0]))
+        else:
+            return (0., 0.)
+
     # Finalize data structures required after the offline phase
     def _finalize_offline(self):
         self.EIM_approximation.init("online")
@@ -315,24 +376,30 @@ class EIMApproximationReductionMethod(ReductionMethod):
         print("")
 
         error_analysis_table = ErrorAnalysisTable(self.testing_set)
+        error_analysis_table.set_flush_location(
+            self.folder["error_analysis"], "error_analysis" if filename is None else filename)
         error_analysis_table.set_Nmax(N_generator_max())
         error_analysis_table.add_column("error", group_name="eim", operations=("mean", "max"))
         error_analysis_table.add_column("relative_error", group_name="eim", operations=("mean", "max"))
 
-        for (mu_index, mu) in enumerate(self.testing_set):
-            print(TextLine(interpolation_method_name + " " + str(mu_index), fill=":"))
+        with self.testing_set.distributed_io():
+            for (mu_index, mu) in self.testing_set.enumerate_local():
+                print(TextLine(interpolation_method_name + " " + str(mu_index), fill=":"))
 
-            self.EIM_approximation.set_mu(mu)
+                self.EIM_approximation.set_mu(mu)
 
-            # Evaluate the exact function on the truth grid
-            self.EIM_approximation.evaluate_parametrized_expression()
+                # Evaluate the exact function on the truth grid
+                self.EIM_approximation.evaluate_parametrized_expression()
+
+                for n in N_generator():
+                    self.EIM_approximation.solve(n)
+                    (_, error, _) = self.EIM_approximation.compute_maximum_interpolation_error(n)
+                    (_, relative_error, _) = self.EIM_approximation.compute_maximum_interpolation_relative_error(n)
+                    error_analysis_table["error", n, mu_index] = abs(error)
+                    error_analysis_table["relative_error", n, mu_index] = abs(relative_error)
 
-            for n in N_generator():
-                self.EIM_approximation.solve(n)
-                (_, error, _) = self.EIM_approximation.compute_maximum_interpolation_error(n)
-                (_, relative_error, _) = self.EIM_approximation.compute_maximum_interpolation_relative_error(n)
-                error_analysis_table["error", n, mu_index] = abs(error)
-                error_analysis_table["relative_error", n, mu_index] = abs(relative_error)
+        # Merge results computed by each group of processes
+        error_analysis_table.merge_partial_tables()
 
         # Print
         print("")
@@ -396,27 +463,33 @@ class EIMApproximationReductionMethod(ReductionMethod):
         print("")
 
         speedup_analysis_table = SpeedupAnalysisTable(self.testing_set)
+        speedup_analysis_table.set_flush_location(
+            self.folder["speedup_analysis"], "speedup_analysis" if filename is None else filename)
         speedup_analysis_table.set_Nmax(N_generator_max())
         speedup_analysis_table.add_column("speedup", group_name="speedup", operations=("min", "mean", "max"))
 
-        evaluate_timer = Timer("parallel")
-        EIM_timer = Timer("serial")
+        evaluate_timer = Timer("parallel", self.testing_set.group_mpi_comm)
+        EIM_timer = Timer("serial", self.testing_set.group_mpi_comm)
 
-        for (mu_index, mu) in enumerate(self.testing_set):
-            print(TextLine(interpolation_method_name + " " + str(mu_index), fill=":"))
+        with self.testing_set.distributed_io():
+            for (mu_index, mu) in self.testing_set.enumerate_local():
+                print(TextLine(interpolation_method_name + " " + str(mu_index), fill=":"))
 
-            self.EIM_approximation.set_mu(mu)
+                self.EIM_approximation.set_mu(mu)
 
-            # Evaluate the exact function on the truth grid
-            evaluate_timer.start()
-            self.EIM_approximation.evaluate_parametrized_expression()
-            elapsed_evaluate = evaluate_timer.stop()
+                # Evaluate the exact function on the truth grid
+                evaluate_timer.start()
+                self.EIM_approximation.evaluate_parametrized_expression()
+                elapsed_evaluate = evaluate_timer.stop()
+
+                for n in N_generator():
+                    EIM_timer.start()
+                    self.EIM_approximation.solve(n)
+                    elapsed_EIM = EIM_timer.stop()
+                    speedup_analysis_table["speedup", n, mu_index] = elapsed_evaluate / elapsed_EIM
 
-            for n in N_generator():
-                EIM_timer.start()
-                self.EIM_approximation.solve(n)
-                elapsed_EIM = EIM_timer.stop()
-                speedup_analysis_table["speedup", n, mu_index] = elapsed_evaluate / elapsed_EIM
+        # Merge results computed by each group of processes
+        speedup_analysis_table.merge_partial_tables()
 
         # Print
         print("")
@@ -4,8 +4,13 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from rbnics.backends import LinearProblemWrapper, LinearSolver
+from numpy import asarray, concatenate, cumsum, stack
+from numpy.linalg import solve
+from rbnics.backends import LinearProblemWrapper, LinearSolver, NestedLinearSolver
+from rbnics.backends.abstract import NonAffineExpansionStorage as AbstractNonAffineExpansionStorage
+from rbnics.backends.online import OnlineFunction
 from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators
+from rbnics.utils.test import PatchInstanceMethod
 
 
 @RequiredBaseDecorators(None)
@@ -22,12 +27,136 @@ def LinearReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             # Nonlinear solver parameters
             self._linear_solver_parameters = dict()
 
+        def freeze(self, N=None, **kwargs):
+            """
+            Freeze the reduced problem at a fixed dimension into a plan object, which stores the reduced operators
+            as contiguous arrays and carries out online solves by a handful of numpy operations.
+            Plans require reduced operators to be affinely decomposed at the current stage, and are thus not
+            available when parametrized functions are evaluated exactly online.
+
+            :param N : Dimension of the reduced problem
+            :type N : integer
+            :return: an object providing a solve(mu=None) method
+            """
+            N, kwargs = self._online_size_from_kwargs(N, **kwargs)
+            N += self.N_bc
+            return OnlineSolvePlan(self, N, **kwargs)
+
         class ProblemSolver(ParametrizedReducedDifferentialProblem_DerivedClass.ProblemSolver, LinearProblemWrapper):
             def solve(self):
                 problem = self.problem
-                solver = LinearSolver(self, problem._solution)
-                solver.set_parameters(problem._linear_solver_parameters)
-                solver.solve()
+                if hasattr(problem, "_nested_N") and len(problem.components) == 1:
+                    # Leading principal blocks of the reduced system are the reduced systems of smaller dimension,
+                    # so that a single assembly and factorization are required
+                    solver = NestedLinearSolver(self, problem._solution)
+                    solver.set_parameters(problem._linear_solver_parameters)
+                    solver.solve()
+                    for N in problem._nested_N:
+                        N += problem.N_bc
+                        if N < self.N:
+                            solution = OnlineFunction(N)
+                            solver.solve_nested(solution)
+                            problem._solution_cache[problem.mu, N, self.kwargs] = solution
+                else:
+                    solver = LinearSolver(self, problem._solution)
+                    solver.set_parameters(problem._linear_solver_parameters)
+                    solver.solve()
 
     # return value (a class) for the decorator
     return LinearReducedProblem_Class
+
+
+# Online solve of a linear reduced problem at a fixed dimension. The left-hand side and right-hand side of the
+# reduced system are linear in the thetas of the terms they are assembled from: such terms are detected while
+# assembling the system once, and the operator multiplying each theta is then extracted by assembling the system
+# with unit thetas. Online solves only require to evaluate thetas and to carry out two matrix-vector products.
+# Non affine reduced operators (e.g. with exact evaluation of parametrized functions online) depend on the
+# parameter at which they are assembled, and are thus rejected.
+class OnlineSolvePlan(object):
+    def __init__(self, problem, N, **kwargs):
+        self.problem = problem
+        self.N = N
+        self._problem_solver = problem.ProblemSolver(problem, N, **kwargs)
+        (self._lhs_terms, lhs, self._lhs_operators) = _linearize(problem, self._problem_solver.matrix_eval)
+        (self._rhs_terms, _, self._rhs_operators) = _linearize(problem, self._problem_solver.vector_eval)
+        self._lhs_shape = _to_array(lhs).shape
+        self._bc_rows = _bc_rows(self._problem_solver.bc_eval(), lhs)
+
+    def solve(self, mu=None):
+        problem = self.problem
+        if mu is not None:
+            mu_backup = problem.mu
+            problem.set_mu(mu)
+        try:
+            lhs = self._lhs_operators.dot(_thetas(problem, self._lhs_terms)).reshape(self._lhs_shape)
+            rhs = self._rhs_operators.dot(_thetas(problem, self._rhs_terms))
+            if len(self._bc_rows) > 0:
+                lhs[self._bc_rows, :] = 0.
+                lhs[self._bc_rows, self._bc_rows] = 1.
+                rhs[self._bc_rows] = _bc_values(self._problem_solver.bc_eval())
+        finally:
+            # Plans do not change the parameter of the reduced problem
+            if mu is not None:
+                problem.set_mu(mu_backup)
+        solution = OnlineFunction(self.N)
+        solution.vector()[:] = solve(lhs, rhs)
+        return solution
+
+
+def _linearize(problem, evaluate):
+    compute_theta = problem.compute_theta
+    terms = dict()  # from term to number of thetas, in the order in which they are required by evaluate
+
+    def recording_compute_theta(self_, term):
+        thetas = compute_theta(term)
+        terms[term] = len(thetas)
+        return thetas
+
+    patch_compute_theta = PatchInstanceMethod(problem, "compute_theta", recording_compute_theta)
+    patch_compute_theta.patch()
+    try:
+        tensor = evaluate()
+        for term in terms:
+            if term in problem.operator and isinstance(problem.operator[term], AbstractNonAffineExpansionStorage):
+                raise ValueError("Online solve plans are not available for non affine operators, as for term " + term)
+        operators = list()
+        for (term, Q) in terms.items():
+            for q in range(Q):
+                def unit_compute_theta(self_, term_, term=term, q=q):
+                    return tuple(1. if (term_ == term and q_ == q) else 0. for q_ in range(terms[term_]))
+
+                PatchInstanceMethod(problem, "compute_theta", unit_compute_theta).patch()
+                operators.append(_to_array(evaluate()).ravel())
+    finally:
+        patch_compute_theta.unpatch()
+    return (tuple(terms.keys()), tensor, stack(operators, axis=-1))
+
+
+def _to_array(tensor):
+    return asarray(tensor, dtype=float)
+
+
+def _thetas(problem, terms):
+    return concatenate([problem.compute_theta(term) for term in terms])
+
+
+def _bc_rows(bcs, lhs):
+    if bcs is None:
+        return list()
+    elif isinstance(bcs, dict):
+        # Rows are ordered as in DirichletBC, i.e. starting from the first row of the block of each component
+        component_name_to_basis_component_index = lhs._component_name_to_basis_component_index[0]
+        component_names = list(component_name_to_basis_component_index.keys())
+        sizes = [lhs.M[component_name] for component_name in component_names]
+        base_index = dict(zip(component_names, cumsum([0] + sizes[:-1])))
+        return [int(base_index[component_name]) + i
+                for (component_name, component_bcs) in bcs.items() for i in range(len(component_bcs))]
+    else:
+        return list(range(len(bcs)))
+
+
+def _bc_values(bcs):
+    if isinstance(bcs, dict):
+        return [bc_i for component_bcs in bcs.values() for bc_i in component_bcs]
+    else:
+        return list(bcs)
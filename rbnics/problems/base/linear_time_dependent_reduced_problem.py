@@ -20,5 +20,8 @@ def LinearTimeDependentReducedProblem(ParametrizedReducedDifferentialProblem_Der
             # Set the problem type in time stepping parameters
             self._time_stepping_parameters["problem_type"] = "linear"
 
+        def freeze(self, N=None, **kwargs):
+            raise NotImplementedError("Online solve plans are not available for time dependent problems")
+
     # return value (a class) for the decorator
     return LinearTimeDependentReducedProblem_Class
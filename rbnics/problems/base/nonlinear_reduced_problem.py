@@ -4,7 +4,10 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from rbnics.backends import NonlinearProblemWrapper, NonlinearSolver
+from numpy import asarray, einsum, ix_, outer, stack, zeros
+from rbnics.backends import assign, copy, evaluate, NonlinearProblemWrapper, NonlinearSolver, transpose
+from rbnics.backends.abstract import ParametrizedTensorFactory as AbstractParametrizedTensorFactory
+from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineMatrix, OnlineVector
 from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators
 
 
@@ -22,6 +25,123 @@ def NonlinearReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass)
             # Nonlinear solver parameters
             self._nonlinear_solver_parameters = dict()
 
+            # Terms which are quadratic in the solution (e.g. the convective term of Navier-Stokes equations).
+            # For each of them, the derivative "d" + term is reduced offline for every basis function, so that
+            # the online residual and jacobian are obtained by contraction with the reduced solution, rather than
+            # by an assembly at each nonlinear iteration. This requires that the thetas of "d" + term do not
+            # depend on the solution.
+            self.quadratic_terms = list()
+            self.quadratic_operator = dict()  # from string to OnlineAffineExpansionStorage
+            # Dense copy of each quadratic operator, indexed by (row, column, basis function, theta), and its
+            # restrictions to the basis functions retained at a given reduced dimension
+            self._quadratic_tensor = dict()  # from string to array
+            self._quadratic_tensor_restrictions = dict()  # from (string, reduced dimension) to array
+            # Truth operators of the derivative of each quadratic term assembled at each basis function, stored
+            # offline to avoid assembling them again when the basis is enriched
+            self._quadratic_truth_operators = dict()  # from string to dict from id to pair
+
+        def init(self, current_stage="online"):
+            ParametrizedReducedDifferentialProblem_DerivedClass.init(self, current_stage)
+            self._init_quadratic_operators(current_stage)
+
+        def _init_quadratic_operators(self, current_stage="online"):
+            assert current_stage in ("online", "offline")
+            if current_stage == "online":
+                for term in self.quadratic_terms:
+                    if term not in self.quadratic_operator:  # init was not called already
+                        self.quadratic_operator[term] = OnlineAffineExpansionStorage(
+                            self._quadratic_operator_size(), self.truth_problem.Q["d" + term])
+                        self.quadratic_operator[term].load(
+                            self.folder["reduced_operators"], "quadratic_operator_" + term)
+                        self._build_quadratic_tensor(term)
+            elif current_stage == "offline":
+                pass  # Nothing else to be done
+            else:
+                raise ValueError("Invalid stage in _init_quadratic_operators().")
+
+        def _quadratic_operator_size(self):
+            size = 0
+            for component in self.components:
+                size += len(self.basis_functions[component])
+            return size
+
+        def build_reduced_operators(self, current_stage="offline"):
+            ParametrizedReducedDifferentialProblem_DerivedClass.build_reduced_operators(self, current_stage)
+            self._build_quadratic_operators(current_stage)
+
+        def _build_quadratic_operators(self, current_stage="offline"):
+            assert current_stage == "offline"
+            if len(self.quadratic_terms) == 0:
+                return
+            # Collect all basis functions, in the same order of the rows of reduced operators
+            basis_functions = list()
+            for component in self.components:
+                basis_functions.extend(self.basis_functions[component])
+            # Evaluate the derivative of each quadratic term at every basis function. Building the reduced
+            # quadratic operators requires N x Q truth assemblies, each followed by a projection costing N truth
+            # matrix-vector products: since this is repeated at each greedy iteration, truth operators assembled
+            # at a basis function are stored (requiring N x Q truth matrices in memory) and are reused by
+            # later iterations, so that only basis functions added since the previous build are assembled
+            for term in self.quadratic_terms:
+                Q = self.truth_problem.Q["d" + term]
+                truth_operators = self._quadratic_truth_operators.get(term, dict())
+                self._quadratic_truth_operators[term] = dict()
+                self.quadratic_operator[term] = OnlineAffineExpansionStorage(len(basis_functions), Q)
+                for (k, basis_function) in enumerate(basis_functions):
+                    # Cached truth operators are looked up by identity of the basis function, since basis functions
+                    # are not modified after being added to the basis, while a new basis is made of new functions
+                    cached = truth_operators.get(id(basis_function))
+                    if cached is None or cached[0] is not basis_function:
+                        cached = (basis_function, self._assemble_quadratic_truth_operators(term, basis_function))
+                    self._quadratic_truth_operators[term][id(basis_function)] = cached
+                    for q in range(Q):
+                        self.quadratic_operator[term][k, q] = (
+                            transpose(self.basis_functions) * cached[1][q] * self.basis_functions)
+                self.quadratic_operator[term].save(self.folder["reduced_operators"], "quadratic_operator_" + term)
+                self._build_quadratic_tensor(term)
+
+        def _assemble_quadratic_truth_operators(self, term, basis_function):
+            truth_solution = copy(self.truth_problem._solution)
+            assign(self.truth_problem._solution, basis_function)
+            try:
+                truth_operators = list()
+                for q in range(self.truth_problem.Q["d" + term]):
+                    truth_operator = self.truth_problem.operator["d" + term][q]
+                    if isinstance(truth_operator, AbstractParametrizedTensorFactory):
+                        truth_operator = evaluate(truth_operator)
+                    truth_operators.append(copy(truth_operator))
+                return truth_operators
+            finally:
+                assign(self.truth_problem._solution, truth_solution)
+
+        def _build_quadratic_tensor(self, term):
+            size = self._quadratic_operator_size()
+            Q = self.truth_problem.Q["d" + term]
+            if size > 0:
+                self._quadratic_tensor[term] = stack([
+                    stack([asarray(self.quadratic_operator[term][k, q], dtype=float) for q in range(Q)], axis=-1)
+                    for k in range(size)], axis=-2)
+            else:
+                self._quadratic_tensor[term] = zeros((0, 0, 0, Q))
+            self._quadratic_tensor_restrictions.clear()
+
+        def _restricted_quadratic_tensor(self, term, N):
+            key = (term, tuple(N.items()) if isinstance(N, dict) else N)
+            if key not in self._quadratic_tensor_restrictions:
+                # Map the entries of the (possibly truncated) solution to the basis functions they refer to
+                basis_indices = OnlineVector(self.N + self.N_bc)
+                for k in range(self._quadratic_operator_size()):
+                    basis_indices[k] = k
+                indices = [int(k) for k in basis_indices[:N]]
+                tensor = self._quadratic_tensor[term]
+                if indices == list(range(len(indices))):
+                    # Leading basis functions (e.g. problems with one component): a view is enough
+                    restricted_tensor = tensor[:len(indices), :len(indices), :len(indices)]
+                else:
+                    restricted_tensor = tensor[ix_(indices, indices, indices)]
+                self._quadratic_tensor_restrictions[key] = restricted_tensor
+            return self._quadratic_tensor_restrictions[key]
+
         class ProblemSolver(ParametrizedReducedDifferentialProblem_DerivedClass.ProblemSolver, NonlinearProblemWrapper):
             def solve(self):
                 problem = self.problem
@@ -29,5 +149,21 @@ def NonlinearReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass)
                 solver.set_parameters(problem._nonlinear_solver_parameters)
                 solver.solve()
 
+            def quadratic_residual_eval(self, term, solution):
+                # Quadratic terms are homogeneous of degree two, so that their value is half of
+                # the action of their derivative on the solution
+                return 0.5 * (self.quadratic_jacobian_eval(term, solution) * solution)
+
+            def quadratic_jacobian_eval(self, term, solution):
+                problem = self.problem
+                N = self.N
+                # Contract the precomputed reduced tensor with the solution and the thetas at once
+                tensor = problem._restricted_quadratic_tensor(term, N)
+                coefficients = outer(asarray(solution.vector(), dtype=float),
+                                     asarray(problem.compute_theta("d" + term), dtype=float))
+                jacobian = OnlineMatrix(N, N)
+                jacobian[:, :] = einsum("ijkq,kq->ij", tensor, coefficients)
+                return jacobian
+
     # return value (a class) for the decorator
     return NonlinearReducedProblem_Class
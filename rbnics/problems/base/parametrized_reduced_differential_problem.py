@@ -341,6 +341,22 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
             delattr(self, "_is_solving")
         return self._solution
 
+    def solve_nested(self, Ns, **kwargs):
+        """
+        Perform online solves for several dimensions of the reduced problem at once. Problems which are able to
+        exploit the nested structure of reduced operators store all solutions in the cache, so that subsequent
+        calls to solve for any of the provided dimensions do not require any further assembly.
+
+        :param Ns : Dimensions of the reduced problem
+        :type Ns : list of integers
+        """
+        if len(Ns) == 0 or not all(isinstance(N, int) for N in Ns):
+            return
+        assert not hasattr(self, "_nested_N")
+        self._nested_N = Ns
+        self.solve(max(Ns), **kwargs)
+        delattr(self, "_nested_N")
+
     class ProblemSolver(object, metaclass=ABCMeta):
         def __init__(self, problem, N, **kwargs):
             self.problem = problem
@@ -497,12 +513,9 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         error = dict()
         # Compute the error on the solution
         if len(components) > 0:
-            N = self._solution.N
-            reduced_solution = self.basis_functions[:N] * self._solution
-            truth_solution = self.truth_problem._solution
-            error_function = truth_solution - reduced_solution
+            error_norm_squared = self._compute_error_norm_squared(components, inner_product)
             for component in components:
-                error_norm_squared_component = transpose(error_function) * inner_product[component] * error_function
+                error_norm_squared_component = error_norm_squared[component]
                 assert error_norm_squared_component >= 0. or isclose(error_norm_squared_component, 0.)
                 error[component] = sqrt(abs(error_norm_squared_component))
         # Simplify trivial case
@@ -511,6 +524,19 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         #
         return error
 
+    def _compute_error_norm_squared(self, components, inner_product):
+        """
+        It computes the squared norm of the error for each component. Internal method.
+        """
+        N = self._solution.N
+        reduced_solution = self.basis_functions[:N] * self._solution
+        truth_solution = self.truth_problem._solution
+        error_function = truth_solution - reduced_solution
+        error_norm_squared = dict()
+        for component in components:
+            error_norm_squared[component] = transpose(error_function) * inner_product[component] * error_function
+        return error_norm_squared
+
     def compute_relative_error(self, **kwargs):
         """
         It returns the function _compute_relative_error() evaluated for the desired parameter.
@@ -535,10 +561,9 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         relative_error = dict()
         # Compute the relative error on the solution
         if len(components) > 0:
-            truth_solution = self.truth_problem._solution
+            truth_solution_norm_squared = self._compute_truth_solution_norm_squared(components, inner_product)
             for component in components:
-                truth_solution_norm_squared_component = (
-                    transpose(truth_solution) * inner_product[component] * truth_solution)
+                truth_solution_norm_squared_component = truth_solution_norm_squared[component]
                 assert truth_solution_norm_squared_component >= 0. or isclose(truth_solution_norm_squared_component, 0.)
                 if truth_solution_norm_squared_component != 0.:
                     relative_error[component] = (
@@ -554,6 +579,17 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         #
         return relative_error
 
+    def _compute_truth_solution_norm_squared(self, components, inner_product):
+        """
+        It computes the squared norm of the truth solution for each component. Internal method.
+        """
+        truth_solution = self.truth_problem._solution
+        truth_solution_norm_squared = dict()
+        for component in components:
+            truth_solution_norm_squared[component] = (
+                transpose(truth_solution) * inner_product[component] * truth_solution)
+        return truth_solution_norm_squared
+
     def _preprocess_compute_error_and_relative_error_kwargs(self, **kwargs):
         """
         This function returns the components and the inner products, picking them up from the kwargs
@@ -44,6 +44,11 @@ def TimeDependentProblem(ParametrizedDifferentialProblem_DerivedClass):
             self._solution_over_time = None  # TimeSeries of Functions
             self._solution_dot_over_time = None  # TimeSeries of Functions
             self._output_over_time = None  # TimeSeries of numbers
+            # Set to True if Dirichlet boundary conditions only depend on time through their theta functions,
+            # rather than through the boundary data (e.g. through an expression of t). In such case, lifting
+            # functions of reduced order models of linear problems are computed by a steady solve,
+            # rather than by the time average of a truth trajectory.
+            self.dirichlet_bc_are_time_separable = False
 
             # I/O
             def _solution_cache_key_generator(*args, **kwargs):
@@ -372,6 +377,25 @@ def TimeDependentProblem(ParametrizedDifferentialProblem_DerivedClass):
             assign(self._solution_dot, self._solution_dot_over_time[-1])
             return self._solution_over_time
 
+        # Perform a truth solve of the steady problem at the current time, i.e. neglecting time derivatives,
+        # and return a copy of its solution. The truth solution is left unchanged. Internal method
+        def _solve_steady(self, **kwargs):
+            bak_solution = copy(self._solution)
+            assert not hasattr(self, "_is_solving")
+            self._is_solving = True
+            try:
+                problem_solver = self.SteadyProblemSolver(self, **kwargs)
+                problem_solver.solve()
+                steady_solution = copy(self._solution)
+            finally:
+                delattr(self, "_is_solving")
+                assign(self._solution, bak_solution)
+            return steady_solution
+
+        class SteadyProblemSolver(ParametrizedDifferentialProblem_DerivedClass.ProblemSolver):
+            def monitor(self, solution):
+                pass  # steady solutions are not stored in the cache
+
         class ProblemSolver(ParametrizedDifferentialProblem_DerivedClass.ProblemSolver, TimeDependentProblemWrapper):
             def set_time(self, t):
                 problem = self.problem
@@ -5,10 +5,12 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from numbers import Number
-from numpy import isclose
+from numpy import asarray, isclose
+from numpy.linalg import lstsq
 from rbnics.backends import (assign, copy, product, sum, TimeDependentProblemWrapper, TimeSeries, TimeQuadrature,
                              transpose)
-from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineFunction, OnlineLinearSolver, OnlineTimeStepping
+from rbnics.backends.online import (OnlineAffineExpansionStorage, OnlineFunction, OnlineLinearSolver,
+                                    OnlineTimeStepping, OnlineVector)
 from rbnics.utils.cache import Cache, TimeSeriesCache
 from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators, sync_setters
 
@@ -58,6 +60,13 @@ def TimeDependentReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCl
             self._solution_over_time = None  # TimeSeries of Functions
             self._solution_dot_over_time = None  # TimeSeries of Functions
             self._output_over_time = None  # TimeSeries of numbers
+            # Auxiliary storage for error computation over time. The truth solution at each time step is
+            # decomposed as its projection onto the whole reduced basis plus a residual, so that the error for
+            # every reduced dimension, as well as the norm of the truth solution, only require online operations
+            self._error_over_time_index = None  # index of the time step being processed, if any
+            self._error_over_time_key = None  # parameter and truth solve arguments of the stored decompositions
+            self._error_over_time_gram = list()  # of (inner product, Gram matrix of the reduced basis) pairs
+            self._error_over_time_data = dict()  # from time step index to list of (inner product, data) pairs
 
             # I/O
             def _solution_cache_key_generator(*args, **kwargs):
@@ -185,6 +194,8 @@ def TimeDependentReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCl
             ParametrizedReducedDifferentialProblem_DerivedClass.build_reduced_operators(self, current_stage)
             # Initial condition
             self._build_reduced_initial_condition(current_stage)
+            # Clear storage for error computation over time, since the reduced basis has changed
+            self._clear_error_over_time_data()
 
         def _build_reduced_initial_condition(self, current_stage="offline"):
             if len(self.components) > 1:
@@ -360,6 +371,31 @@ def TimeDependentReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCl
 
         def _lifting_truth_solve(self, term, i):
             assert term.startswith("dirichlet_bc")
+            if (self.truth_problem.dirichlet_bc_are_time_separable
+                    and self.truth_problem._time_stepping_parameters["problem_type"] == "linear"):
+                return self._lifting_truth_steady_solve(term, i)
+            else:
+                return self._lifting_truth_unsteady_solve(term, i)
+
+        def _lifting_truth_steady_solve(self, term, i):
+            # Boundary data are given by theta_i(t) times a time independent function, so that a lifting is obtained
+            # by a steady solve at any time at which theta_i does not vanish, scaled by the value of theta_i.
+            # The time with the largest theta_i is chosen, to avoid dividing by a small number
+            bak_t = self.truth_problem.t
+            times = self.truth_problem._solution_over_time.expected_times()
+            theta_over_time = list()
+            for t in times:
+                self.truth_problem.set_time(t)
+                theta_over_time.append(self.truth_problem.compute_theta(term)[i])
+            k = max(range(len(times)), key=lambda k: abs(theta_over_time[k]))
+            assert theta_over_time[k] != 0.
+            self.truth_problem.set_time(times[k])
+            lifting = self.truth_problem._solve_steady()
+            lifting /= theta_over_time[k]
+            self.truth_problem.set_time(bak_t)
+            return lifting
+
+        def _lifting_truth_unsteady_solve(self, term, i):
             component = term.replace("dirichlet_bc", "").replace("_", "")
             # Since lifting solves for different values of i are associated to the same parameter
             # but with a patched call to compute_theta(), which returns the i-th component, we set
@@ -410,15 +446,38 @@ def TimeDependentReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCl
         def _compute_error(self, **kwargs):
             error_over_time = TimeSeries(self._solution_over_time)
             assert len(self.truth_problem._solution_over_time) == len(self._solution_over_time)
+            self._update_error_over_time_key()
             for (k, t) in enumerate(self.truth_problem._solution_over_time.stored_times()):
                 self.set_time(t)
                 assign(self._solution, self._solution_over_time[k])
-                assign(self.truth_problem._solution, self.truth_problem._solution_over_time[k])
-                error = ParametrizedReducedDifferentialProblem_DerivedClass._compute_error(self, **kwargs)
+                # The truth solution at the current time step is read from self.truth_problem._solution_over_time
+                self._error_over_time_index = k
+                try:
+                    error = ParametrizedReducedDifferentialProblem_DerivedClass._compute_error(self, **kwargs)
+                finally:
+                    self._error_over_time_index = None
                 error_over_time.append(error)
             error_over_time = self._convert_error_over_time(error_over_time)
             return error_over_time
 
+        def _compute_error_norm_squared(self, components, inner_product):
+            if self._error_over_time_index is None:
+                return ParametrizedReducedDifferentialProblem_DerivedClass._compute_error_norm_squared(
+                    self, components, inner_product)
+            basis_indices = self._get_basis_indices()[:self._solution.N]
+            error_norm_squared = dict()
+            for component in components:
+                (gram, projection, residual_norm_squared, basis_inner_residual) = self._get_error_over_time_data(
+                    inner_product[component])
+                # Since truth_solution - reduced_solution = residual + basis_functions * difference
+                difference = copy(projection)
+                for (n, k) in enumerate(basis_indices):
+                    difference[int(k)] -= self._solution.vector()[n]
+                error_norm_squared[component] = (
+                    residual_norm_squared + 2. * (transpose(difference) * basis_inner_residual)
+                    + transpose(difference) * gram * difference)
+            return error_norm_squared
+
         # Internal method for relative error computation
         def _compute_relative_error(self, absolute_error_over_time, **kwargs):
             relative_error_over_time = TimeSeries(self._solution_over_time)
@@ -427,16 +486,92 @@ def TimeDependentReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCl
                     assert len(self._solution_over_time) == len(absolute_error_over_time_for_component)
             else:
                 assert len(self._solution_over_time) == len(absolute_error_over_time)
+            self._update_error_over_time_key()
             for (k, t) in enumerate(self.truth_problem._solution_over_time.stored_times()):
                 self.set_time(t)
-                assign(self.truth_problem._solution, self.truth_problem._solution_over_time[k])
                 absolute_error = self._convert_error_at_time(k, absolute_error_over_time)
-                relative_error = ParametrizedReducedDifferentialProblem_DerivedClass._compute_relative_error(
-                    self, absolute_error, **kwargs)
+                self._error_over_time_index = k
+                try:
+                    relative_error = ParametrizedReducedDifferentialProblem_DerivedClass._compute_relative_error(
+                        self, absolute_error, **kwargs)
+                finally:
+                    self._error_over_time_index = None
                 relative_error_over_time.append(relative_error)
             relative_error_over_time = self._convert_error_over_time(relative_error_over_time)
             return relative_error_over_time
 
+        def _compute_truth_solution_norm_squared(self, components, inner_product):
+            if self._error_over_time_index is None:
+                return ParametrizedReducedDifferentialProblem_DerivedClass._compute_truth_solution_norm_squared(
+                    self, components, inner_product)
+            truth_solution_norm_squared = dict()
+            for component in components:
+                (gram, projection, residual_norm_squared, basis_inner_residual) = self._get_error_over_time_data(
+                    inner_product[component])
+                # Since truth_solution = residual + basis_functions * projection
+                truth_solution_norm_squared[component] = (
+                    residual_norm_squared + 2. * (transpose(projection) * basis_inner_residual)
+                    + transpose(projection) * gram * projection)
+            return truth_solution_norm_squared
+
+        def _update_error_over_time_key(self):
+            key = self.truth_problem._cache_key_from_kwargs(**self.truth_problem._latest_solve_kwargs)
+            if key != self._error_over_time_key:
+                self._error_over_time_key = key
+                self._error_over_time_data.clear()
+
+        def _clear_error_over_time_data(self):
+            self._error_over_time_key = None
+            del self._error_over_time_gram[:]
+            self._error_over_time_data.clear()
+
+        def _get_error_over_time_data(self, inner_product):
+            """
+            It returns the Gram matrix of the reduced basis, the coefficients of the projection of the truth solution
+            at the current time step onto the whole reduced basis, the squared norm of the residual of the projection
+            and the inner products between the reduced basis and the residual, all with respect to inner_product.
+            Internal method.
+            """
+            # Storage is bounded by the number of components, since a new inner product matrix may be provided
+            # at each call (e.g. energy norms assembled for the current parameter)
+            maximum_storage_length = len(self.components)
+            gram = _find_by_inner_product(self._error_over_time_gram, inner_product)
+            if gram is None:
+                gram = transpose(self.basis_functions) * inner_product * self.basis_functions
+                _store_by_inner_product(self._error_over_time_gram, inner_product, gram, maximum_storage_length)
+            k = self._error_over_time_index
+            if k not in self._error_over_time_data:
+                self._error_over_time_data[k] = list()
+            data = _find_by_inner_product(self._error_over_time_data[k], inner_product)
+            if data is None:
+                truth_solution = self.truth_problem._solution_over_time[k]
+                # The Gram matrix is singular if some basis functions vanish in the norm induced by inner_product
+                # (e.g. when inner_product only acts on a component), hence a least squares solution is sought
+                projection = OnlineVector(self.N + self.N_bc)
+                projection[:] = lstsq(
+                    asarray(gram), asarray(transpose(self.basis_functions) * inner_product * truth_solution),
+                    rcond=None)[0]
+                residual = truth_solution - self.basis_functions * projection
+                inner_product_times_residual = inner_product * residual
+                data = (
+                    gram,
+                    projection,
+                    transpose(residual) * inner_product_times_residual,
+                    transpose(self.basis_functions) * inner_product_times_residual
+                )
+                _store_by_inner_product(self._error_over_time_data[k], inner_product, data, maximum_storage_length)
+            return data
+
+        def _get_basis_indices(self):
+            # Map the entries of (possibly truncated) reduced vectors to the basis functions they refer to
+            basis_indices = OnlineVector(self.N + self.N_bc)
+            k = 0
+            for component in self.components:
+                for _ in self.basis_functions[component]:
+                    basis_indices[k] = k
+                    k += 1
+            return basis_indices
+
         # Internal method for output error computation
         def _compute_error_output(self, **kwargs):
             error_output_over_time = TimeSeries(self._output_over_time)
@@ -536,3 +671,18 @@ def TimeDependentReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCl
 
     # return value (a class) for the decorator
     return TimeDependentReducedProblem_Class
+
+
+def _find_by_inner_product(storage, inner_product):
+    # Inner products are compared by identity, since matrices do not provide a cheap equality comparison
+    for (inner_product_, data) in storage:
+        if inner_product_ is inner_product:
+            return data
+    return None
+
+
+def _store_by_inner_product(storage, inner_product, data, maximum_storage_length):
+    # Discard the least recently stored data, so that storage does not grow when new inner products are provided
+    storage.append((inner_product, data))
+    if len(storage) > maximum_storage_length:
+        del storage[0]
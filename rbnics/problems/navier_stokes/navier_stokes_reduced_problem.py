@@ -21,7 +21,9 @@ def NavierStokesReducedProblem(StokesReducedProblem_DerivedClass):
                 assembled_operator = dict()
                 for term in ("a", "b", "bt", "c", "f", "g"):
                     assert problem.terms_order[term] in (1, 2)
-                    if problem.terms_order[term] == 2:
+                    if term in problem.quadratic_terms:
+                        assembled_operator[term] = self.quadratic_residual_eval(term, solution)
+                    elif problem.terms_order[term] == 2:
                         assembled_operator[term] = sum(product(
                             problem.compute_theta(term), problem.operator[term][:N, :N]))
                     elif problem.terms_order[term] == 1:
@@ -39,8 +41,11 @@ def NavierStokesReducedProblem(StokesReducedProblem_DerivedClass):
                 assembled_operator = dict()
                 for term in ("a", "b", "bt", "dc"):
                     assert problem.terms_order[term] == 2
-                    assembled_operator[term] = sum(product(
-                        problem.compute_theta(term), problem.operator[term][:N, :N]))
+                    if term.startswith("d") and term[1:] in problem.quadratic_terms:
+                        assembled_operator[term] = self.quadratic_jacobian_eval(term[1:], solution)
+                    else:
+                        assembled_operator[term] = sum(product(
+                            problem.compute_theta(term), problem.operator[term][:N, :N]))
                 return (assembled_operator["a"] + assembled_operator["b"] + assembled_operator["bt"]
                         + assembled_operator["dc"])
 
@@ -20,7 +20,10 @@ def NonlinearEllipticReducedProblem(EllipticReducedProblem_DerivedClass):
                 N = self.N
                 assembled_operator = dict()
                 assembled_operator["a"] = sum(product(problem.compute_theta("a"), problem.operator["a"][:N, :N]))
-                assembled_operator["c"] = sum(product(problem.compute_theta("c"), problem.operator["c"][:N]))
+                if "c" in problem.quadratic_terms:
+                    assembled_operator["c"] = self.quadratic_residual_eval("c", solution)
+                else:
+                    assembled_operator["c"] = sum(product(problem.compute_theta("c"), problem.operator["c"][:N]))
                 assembled_operator["f"] = sum(product(problem.compute_theta("f"), problem.operator["f"][:N]))
                 return assembled_operator["a"] * solution + assembled_operator["c"] - assembled_operator["f"]
 
@@ -29,7 +32,11 @@ def NonlinearEllipticReducedProblem(EllipticReducedProblem_DerivedClass):
                 N = self.N
                 assembled_operator = dict()
                 assembled_operator["a"] = sum(product(problem.compute_theta("a"), problem.operator["a"][:N, :N]))
-                assembled_operator["dc"] = sum(product(problem.compute_theta("dc"), problem.operator["dc"][:N, :N]))
+                if "c" in problem.quadratic_terms:
+                    assembled_operator["dc"] = self.quadratic_jacobian_eval("c", solution)
+                else:
+                    assembled_operator["dc"] = sum(product(
+                        problem.compute_theta("dc"), problem.operator["dc"][:N, :N]))
                 return assembled_operator["a"] + assembled_operator["dc"]
 
         # Perform an online evaluation of the output
@@ -6,7 +6,8 @@
 
 import hashlib
 from rbnics.problems.base import LinearProblem, ParametrizedDifferentialProblem
-from rbnics.backends import assign, copy, Function, LinearSolver, product, sum
+from rbnics.backends import assign, copy, FactorizedLinearSolver, Function, product, sum
+from rbnics.backends.abstract import ParametrizedTensorFactory as AbstractParametrizedTensorFactory
 from rbnics.utils.cache import Cache
 
 StokesProblem_Base = LinearProblem(ParametrizedDifferentialProblem)
@@ -35,6 +36,9 @@ class StokesProblem(StokesProblem_Base):
 
         # Auxiliary storage for supremizer enrichment, using a subspace of V
         self._supremizer = Function(V, "s")
+        # Solver for the supremizer problem. Since its left-hand side is the (non parametrized) inner product
+        # on the supremizer subspace, the same factorization is reused for all supremizer solves
+        self._supremizer_solver = None
 
         # I/O
         def _supremizer_cache_key_generator(*args, **kwargs):
@@ -101,22 +105,32 @@ class StokesProblem(StokesProblem_Base):
         return self._supremizer
 
     def _solve_supremizer(self, solution):
-        assert len(self.inner_product["s"]) == 1  # the affine expansion storage contains only the inner product matrix
-        assembled_operator_lhs = self.inner_product["s"][0]
-        assembled_operator_bt = sum(product(self.compute_theta("bt_restricted"), self.operator["bt_restricted"]))
-        assembled_operator_rhs = assembled_operator_bt * solution
+        assembled_operator_rhs = self._assemble_supremizer_rhs(solution)
         if self.dirichlet_bc["s"] is not None:
             assembled_dirichlet_bc = sum(product(self.compute_theta("dirichlet_bc_s"), self.dirichlet_bc["s"]))
         else:
             assembled_dirichlet_bc = None
-        solver = LinearSolver(
-            assembled_operator_lhs,
-            self._supremizer,
-            assembled_operator_rhs,
-            assembled_dirichlet_bc
-        )
-        solver.set_parameters(self._linear_solver_parameters)
-        solver.solve()
+        if self._supremizer_solver is None:
+            assert len(self.inner_product["s"]) == 1  # the affine expansion storage contains only the inner product
+            self._supremizer_solver = FactorizedLinearSolver(self.inner_product["s"][0], assembled_dirichlet_bc)
+        self._supremizer_solver.set_parameters(self._linear_solver_parameters)
+        self._supremizer_solver.solve(self._supremizer, assembled_operator_rhs, assembled_dirichlet_bc)
+
+    def _assemble_supremizer_rhs(self, solution):
+        thetas = self.compute_theta("bt_restricted")
+        operators = self.operator["bt_restricted"]
+        if any(isinstance(operator, AbstractParametrizedTensorFactory) for operator in operators):
+            # Operators need to be assembled for the current parameter
+            return sum(product(thetas, operators)) * solution
+        else:
+            # Apply each assembled affine component to the solution, rather than assembling their combination
+            assembled_operator_rhs = None
+            for (theta, operator) in zip(thetas, operators):
+                if assembled_operator_rhs is None:
+                    assembled_operator_rhs = theta * (operator * solution)
+                else:
+                    assembled_operator_rhs += theta * (operator * solution)
+            return assembled_operator_rhs
 
     def _supremizer_cache_key_from_kwargs(self, **kwargs):
         return self._cache_key_from_kwargs(**kwargs)
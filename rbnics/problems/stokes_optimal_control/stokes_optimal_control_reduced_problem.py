@@ -5,7 +5,7 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from rbnics.problems.base import LinearReducedProblem
-from rbnics.backends import product, sum, transpose
+from rbnics.backends import KKTLinearSolver, product, sum, transpose
 
 
 def StokesOptimalControlReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
@@ -14,7 +14,22 @@ def StokesOptimalControlReducedProblem(ParametrizedReducedDifferentialProblem_De
 
     class StokesOptimalControlReducedProblem_Class(StokesOptimalControlReducedProblem_Base):
 
+        # Default initialization of members
+        def __init__(self, truth_problem, **kwargs):
+            # Call to parent
+            StokesOptimalControlReducedProblem_Base.__init__(self, truth_problem, **kwargs)
+            # Factorizations of the state and adjoint blocks of the optimality system, reused by online solves
+            self._kkt_factorizations = dict()
+
         class ProblemSolver(StokesOptimalControlReducedProblem_Base.ProblemSolver):
+            def solve(self):
+                problem = self.problem
+                solver = KKTLinearSolver(
+                    self, problem._solution, state_components=("v", "s", "p"), control_components=("u", ),
+                    adjoint_components=("w", "r", "q"), factorizations=problem._kkt_factorizations)
+                solver.set_parameters(problem._linear_solver_parameters)
+                solver.solve()
+
             def matrix_eval(self):
                 problem = self.problem
                 N = self.N
@@ -20,6 +20,7 @@ from rbnics.reduction_methods.base.nonlinear_time_dependent_pod_galerkin_reducti
 from rbnics.reduction_methods.base.nonlinear_time_dependent_rb_reduction import NonlinearTimeDependentRBReduction
 from rbnics.reduction_methods.base.nonlinear_time_dependent_reduction_method import (
     NonlinearTimeDependentReductionMethod)
+from rbnics.reduction_methods.base.offline_pipeline import OfflinePipeline
 from rbnics.reduction_methods.base.pod_galerkin_reduction import PODGalerkinReduction
 from rbnics.reduction_methods.base.rb_reduction import RBReduction
 from rbnics.reduction_methods.base.reduction_method import ReductionMethod
@@ -41,6 +42,7 @@ __all__ = [
     "NonlinearTimeDependentPODGalerkinReduction",
     "NonlinearTimeDependentRBReduction",
     "NonlinearTimeDependentReductionMethod",
+    "OfflinePipeline",
     "PODGalerkinReduction",
     "RBReduction",
     "ReductionMethod",
@@ -5,9 +5,11 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 import inspect
+from contextlib import ExitStack
 from rbnics.backends import assign
 from rbnics.reduction_methods.base.reduction_method import ReductionMethod
-from rbnics.utils.io import Folders
+from rbnics.utils.cache import Cache
+from rbnics.utils.io import Folders, PhaseTimer, Timer
 from rbnics.utils.decorators import StoreMapFromProblemToReductionMethod, UpdateMapFromProblemToTrainingStatus
 from rbnics.utils.factories import ReducedProblemFactory
 from rbnics.utils.test import PatchInstanceMethod
@@ -160,6 +162,132 @@ class DifferentialProblemReductionMethod(ReductionMethod):
         # Undo patch to truth compute_output in case with_respect_to kwarg was provided
         self._undo_patch_truth_compute_output(True, **kwargs)
 
+    # Default settings of the benchmarking mode of the speedup analysis
+    _speedup_analysis_benchmark_defaults = {
+        "warm_up": 1,  # number of untimed calls before timing
+        "repeats": 5,  # number of timed calls
+        "statistic": "min"  # statistic of the timed calls which is stored in the table, either "min" or "median"
+    }
+
+    def _speedup_analysis_benchmark(self, benchmark):
+        """
+        Process the benchmark kwarg of the speedup analysis, which can either be None (or False) to time
+        every computation only once, True to enable the benchmarking mode with default settings, or a dict
+        overriding some of the default settings.
+        """
+        if benchmark is None or benchmark is False:
+            return None
+        else:
+            benchmark_settings = dict(self._speedup_analysis_benchmark_defaults)
+            if benchmark is not True:
+                assert isinstance(benchmark, dict)
+                assert all(key in benchmark_settings for key in benchmark)
+                benchmark_settings.update(benchmark)
+            assert benchmark_settings["warm_up"] >= 0
+            assert benchmark_settings["repeats"] > 0
+            assert benchmark_settings["statistic"] in ("min", "median")
+            return benchmark_settings
+
+    def _speedup_analysis_time(self, timer, function, benchmark, setup=None):
+        """
+        Time function, either once or, in benchmarking mode, after some warm up calls and as a statistic
+        over repeated calls. setup is called before each call in benchmarking mode, and it is not timed.
+        """
+        if benchmark is None:
+            timer.start()
+            output = function()
+            return (output, timer.stop())
+        else:
+            return timer.repeat(
+                function, benchmark["warm_up"], benchmark["repeats"], benchmark["statistic"], setup)
+
+    def _speedup_analysis_caches(self, problem, kind, **kwargs):
+        """
+        Return the caches of the given kind ("solution" or "output") of problem, including the ones of
+        the problem provided by the with_respect_to kwarg when problem is the truth problem.
+        """
+        if problem is self.truth_problem and "with_respect_to" in kwargs:
+            problems = (self.truth_problem, kwargs["with_respect_to"](self.truth_problem))
+        else:
+            problems = (problem, )
+        return [value for problem_ in problems for (name, value) in vars(problem_).items()
+                if name.startswith("_" + kind) and name.endswith("_cache") and isinstance(value, Cache)]
+
+    def _speedup_analysis_clear_caches(self, problem, kind, **kwargs):
+        """
+        Return a function which clears the RAM caches of the given kind ("solution" or "output") of problem,
+        so that repeated calls in benchmarking mode actually carry out the computation. Since disk caches
+        are not cleared, this is only suitable for reduced problems, whose caches are only stored in RAM.
+        """
+        caches = self._speedup_analysis_caches(problem, kind, **kwargs)
+
+        def clear_caches():
+            for cache in caches:
+                cache.clear()
+
+        return clear_caches
+
+    def _speedup_analysis_bypass_caches(self, function, problem, kind, **kwargs):
+        """
+        Return a function which calls function bypassing both RAM and disk caches of the given kind
+        ("solution" or "output") of problem, so that repeated truth computations in benchmarking mode
+        are not replaced by loads of previously stored results.
+        """
+        caches = self._speedup_analysis_caches(problem, kind, **kwargs)
+
+        def bypassed_function():
+            with ExitStack() as stack:
+                for cache in caches:
+                    stack.enter_context(cache.bypass())
+                return function()
+
+        return bypassed_function
+
+    def _speedup_analysis_online_phases(self, N, benchmark, **kwargs):
+        """
+        Split the time of a reduced solve into the time spent in the evaluation of the parameter dependent
+        coefficients of the affine expansion ("theta"), in the assembly of the reduced operators ("assembly")
+        and in the remaining part of the solve ("solve"). Each phase time is the statistic requested
+        by benchmark over repeated reduced solves.
+        """
+        reduced_problem = self.reduced_problem
+        phase_timer = PhaseTimer("serial", self.testing_set.group_mpi_comm)
+        clear_caches = self._speedup_analysis_clear_caches(reduced_problem, "solution", **kwargs)
+
+        # Charge theta evaluations to the "theta" phase ...
+        compute_theta = reduced_problem.compute_theta
+        compute_theta_was_patched = "compute_theta" in vars(reduced_problem)
+
+        # ... and evaluations of the reduced operators, which will in turn evaluate thetas, to the "assembly" phase
+        class TimedProblemSolver(reduced_problem.ProblemSolver):
+            pass
+
+        for method_name in ("matrix_eval", "vector_eval", "residual_eval", "jacobian_eval"):
+            if hasattr(TimedProblemSolver, method_name):
+                setattr(TimedProblemSolver, method_name,
+                        phase_timer.wrap("assembly", getattr(TimedProblemSolver, method_name)))
+
+        phases_elapsed = {"theta": list(), "assembly": list(), "solve": list()}
+        reduced_problem.compute_theta = phase_timer.wrap("theta", compute_theta)
+        reduced_problem.ProblemSolver = TimedProblemSolver
+        try:
+            for _ in range(benchmark["repeats"]):
+                clear_caches()
+                phase_timer.start()
+                reduced_problem.solve(N, **kwargs)
+                elapsed = phase_timer.stop()
+                for phase in ("theta", "assembly"):
+                    phases_elapsed[phase].append(phase_timer.phase_elapsed(phase))
+                phases_elapsed["solve"].append(
+                    max(elapsed - phases_elapsed["theta"][-1] - phases_elapsed["assembly"][-1], 0.))
+        finally:
+            del reduced_problem.ProblemSolver
+            if compute_theta_was_patched:
+                reduced_problem.compute_theta = compute_theta
+            else:
+                del reduced_problem.compute_theta
+        return {phase: Timer.statistic(elapsed, benchmark["statistic"]) for (phase, elapsed) in phases_elapsed.items()}
+
     def _patch_truth_solve(self, force, **kwargs):
         if "with_respect_to" in kwargs:
             assert inspect.isfunction(kwargs["with_respect_to"])
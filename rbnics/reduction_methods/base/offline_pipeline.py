@@ -0,0 +1,148 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import multiprocessing
+import sys
+from mpi4py.MPI import COMM_WORLD
+from rbnics.utils.test import PatchInstanceMethod
+
+
+class OfflinePipeline(object):
+    """
+    Offline stage of several coupled reduction methods. A reduction method depends on another one when the
+    EIM/DEIM approximations of the former involve the solution of the truth problem of the latter, e.g. when
+    the velocity of a reduced Stokes problem is the advection field of a reduced advection-diffusion problem.
+    Reduction methods are grouped in stages, so that each stage only depends on the previous ones, and the
+    offline stage of the reduction methods in the same stage can be carried out concurrently.
+
+    :param reduction_methods: reduction methods of the coupled problems, in any order.
+    """
+
+    def __init__(self, *reduction_methods):
+        self.reduction_methods = list(reduction_methods)
+        self._additional_dependencies = dict()  # from reduction method to list of reduction methods
+
+    def add_dependency(self, reduction_method, depends_on):
+        """
+        Declare that the offline stage of reduction_method requires the one of depends_on, in case such
+        dependency cannot be discovered from the EIM/DEIM approximations (e.g. with exact evaluation).
+        """
+        assert reduction_method in self.reduction_methods
+        assert depends_on in self.reduction_methods
+        self._additional_dependencies.setdefault(reduction_method, list()).append(depends_on)
+
+    def dependencies(self):
+        """
+        Return a dict from each reduction method to the list of reduction methods it depends on.
+        """
+        dependencies = dict()
+        for reduction_method in self.reduction_methods:
+            dependencies_reduction_method = list()
+            for problem in _auxiliary_problems(reduction_method):
+                for other_reduction_method in self.reduction_methods:
+                    if (other_reduction_method is not reduction_method
+                            and other_reduction_method.truth_problem is problem
+                            and other_reduction_method not in dependencies_reduction_method):
+                        dependencies_reduction_method.append(other_reduction_method)
+            for other_reduction_method in self._additional_dependencies.get(reduction_method, list()):
+                if other_reduction_method not in dependencies_reduction_method:
+                    dependencies_reduction_method.append(other_reduction_method)
+            dependencies[reduction_method] = dependencies_reduction_method
+        return dependencies
+
+    def stages(self):
+        """
+        Return a list of stages, each one being the list of reduction methods whose dependencies all belong
+        to previous stages.
+        """
+        dependencies = self.dependencies()
+        stages = list()
+        processed = list()
+        while len(processed) < len(self.reduction_methods):
+            stage = [
+                reduction_method for reduction_method in self.reduction_methods
+                if reduction_method not in processed and all(
+                    other_reduction_method in processed for other_reduction_method in dependencies[reduction_method])
+            ]
+            if len(stage) == 0:
+                raise RuntimeError("Cyclic dependency among the reduction methods of the offline pipeline")
+            stages.append(stage)
+            processed.extend(stage)
+        return stages
+
+    def offline(self, processes=1):
+        """
+        Perform the offline phase of all reduction methods, stage by stage.
+
+        :param processes: maximum number of reduction methods of the same stage to be run concurrently, each one
+            in a separate process. Offline data and truth solutions computed by such processes are shared with
+            the current one through files, and are then loaded by each reduction method. Concurrent processes
+            are forked from the current one, and are thus only available in serial runs. Truth problems of
+            previous stages do not store further solutions in their cache folders while concurrent processes
+            are running, so that processes never write the same files.
+        :return: list of reduced problems, in the same order as the reduction methods.
+        """
+        assert processes >= 1
+        assert processes == 1 or COMM_WORLD.size == 1, (
+            "Running stages in separate processes is not supported in parallel runs")
+        for stage in self.stages():
+            if processes > 1 and len(stage) > 1:
+                for begin in range(0, len(stage), processes):
+                    _offline_in_separate_processes(stage[begin:begin + processes])
+            for reduction_method in stage:
+                reduction_method.offline()
+        return [reduction_method.reduced_problem for reduction_method in self.reduction_methods]
+
+
+def _auxiliary_problems(reduction_method):
+    EIM_reductions = list(getattr(reduction_method, "EIM_reductions", dict()).values())
+    for DEIM_reductions_term in getattr(reduction_method, "DEIM_reductions", dict()).values():
+        EIM_reductions.extend(DEIM_reductions_term.values())
+    auxiliary_problems = list()
+    for EIM_reduction in EIM_reductions:
+        auxiliary_problems_and_components = (
+            EIM_reduction.EIM_approximation.parametrized_expression.auxiliary_problems_and_components())
+        if auxiliary_problems_and_components is not None:
+            for (problem, _) in auxiliary_problems_and_components:
+                if problem not in auxiliary_problems:
+                    auxiliary_problems.append(problem)
+    return auxiliary_problems
+
+
+def _offline_in_separate_processes(reduction_methods):
+    # Processes are forked, since reduction methods cannot be pickled, and forking is only safe in serial runs,
+    # in which MPI, PETSc and dolfin data structures are not shared with other MPI processes. Each process stores
+    # its offline data to file, so that the subsequent call to offline() in the current process will only need
+    # to load them.
+    context = multiprocessing.get_context("fork")
+    # Flush buffered output, which would otherwise be printed again by each forked process
+    sys.stdout.flush()
+    sys.stderr.flush()
+    processes = [context.Process(target=_offline_in_separate_process, args=(reduction_method, ))
+                 for reduction_method in reduction_methods]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    for (reduction_method, process) in zip(reduction_methods, processes):
+        if process.exitcode != 0:
+            raise RuntimeError(
+                "Offline stage of " + reduction_method.truth_problem.name() + " failed in a separate process")
+
+
+def _offline_in_separate_process(reduction_method):
+    # Truth problems of previous stages may be solved by several concurrent processes for the same parameters:
+    # their cached solutions and outputs are still read from file, but they are not exported, since concurrent
+    # processes would otherwise write (and read partially written) files with the same name. Solutions computed
+    # here are only required by this process, as the offline data is stored by the reduction method itself.
+    # (arguments are not named, since they differ between steady and time dependent problems)
+    def disable_export_method(self_, *args, **kwargs):
+        pass
+
+    for problem in _auxiliary_problems(reduction_method):
+        PatchInstanceMethod(problem, "export_solution", disable_export_method).patch()
+        PatchInstanceMethod(problem, "export_output", disable_export_method).patch()
+    reduction_method.offline()
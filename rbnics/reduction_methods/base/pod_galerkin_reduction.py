@@ -234,6 +234,8 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             print("")
 
             error_analysis_table = ErrorAnalysisTable(self.testing_set)
+            error_analysis_table.set_flush_location(
+                self.folder["error_analysis"], "error_analysis" if filename is None else filename)
             error_analysis_table.set_Nmax(N_generator_max())
             for component in components:
                 error_analysis_table.add_column(
@@ -243,32 +245,37 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             error_analysis_table.add_column("error_output", group_name="output", operations=("mean", "max"))
             error_analysis_table.add_column("relative_error_output", group_name="output", operations=("mean", "max"))
 
-            for (mu_index, mu) in enumerate(self.testing_set):
-                print(TextLine(str(mu_index), fill="#"))
+            with self.testing_set.distributed_io():
+                for (mu_index, mu) in self.testing_set.enumerate_local():
+                    print(TextLine(str(mu_index), fill="#"))
 
-                self.reduced_problem.set_mu(mu)
+                    self.reduced_problem.set_mu(mu)
+                    self.reduced_problem.solve_nested([n_arg for (_, n_arg) in N_generator_items()], **kwargs)
 
-                for (n_int, n_arg) in N_generator_items():
-                    self.reduced_problem.solve(n_arg, **kwargs)
-                    error = self.reduced_problem.compute_error(**kwargs)
-                    relative_error = self.reduced_problem.compute_relative_error(**kwargs)
+                    for (n_int, n_arg) in N_generator_items():
+                        self.reduced_problem.solve(n_arg, **kwargs)
+                        error = self.reduced_problem.compute_error(**kwargs)
+                        relative_error = self.reduced_problem.compute_relative_error(**kwargs)
 
-                    self.reduced_problem.compute_output()
-                    error_output = self.reduced_problem.compute_error_output(**kwargs)
-                    relative_error_output = self.reduced_problem.compute_relative_error_output(**kwargs)
+                        self.reduced_problem.compute_output()
+                        error_output = self.reduced_problem.compute_error_output(**kwargs)
+                        relative_error_output = self.reduced_problem.compute_relative_error_output(**kwargs)
 
-                    if len(components) > 1:
-                        for component in components:
-                            error_analysis_table["error_" + component, n_int, mu_index] = error[component]
-                            error_analysis_table[
-                                "relative_error_" + component, n_int, mu_index] = relative_error[component]
-                    else:
-                        component = components[0]
-                        error_analysis_table["error_" + component, n_int, mu_index] = error
-                        error_analysis_table["relative_error_" + component, n_int, mu_index] = relative_error
+                        if len(components) > 1:
+                            for component in components:
+                                error_analysis_table["error_" + component, n_int, mu_index] = error[component]
+                                error_analysis_table[
+                                    "relative_error_" + component, n_int, mu_index] = relative_error[component]
+                        else:
+                            component = components[0]
+                            error_analysis_table["error_" + component, n_int, mu_index] = error
+                            error_analysis_table["relative_error_" + component, n_int, mu_index] = relative_error
+
+                        error_analysis_table["error_output", n_int, mu_index] = error_output
+                        error_analysis_table["relative_error_output", n_int, mu_index] = relative_error_output
 
-                    error_analysis_table["error_output", n_int, mu_index] = error_output
-                    error_analysis_table["relative_error_output", n_int, mu_index] = relative_error_output
+            # Merge results computed by each group of processes
+            error_analysis_table.merge_partial_tables()
 
             # Print
             print("")
@@ -288,12 +295,19 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             over the testing set
 
             :param N_generator: generator of dimension of the reduced problem.
+            :param benchmark: (optional kwarg) enable the benchmarking mode, either with default settings (True)
+                or with a dict of settings among "warm_up" (number of untimed calls), "repeats" (number of timed
+                calls) and "statistic" ("min" or "median" of the timed calls). In benchmarking mode caches are
+                cleared before each call, and the online time is further split into theta evaluation, assembly
+                and solve.
             """
             self._init_speedup_analysis(**kwargs)
             self._speedup_analysis(N_generator, filename, **kwargs)
             self._finalize_speedup_analysis(**kwargs)
 
         def _speedup_analysis(self, N_generator=None, filename=None, **kwargs):
+            benchmark = self._speedup_analysis_benchmark(kwargs.pop("benchmark", None))
+
             if N_generator is None:
                 def N_generator():
                     N = self.reduced_problem.N
@@ -327,49 +341,79 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             print("")
 
             speedup_analysis_table = SpeedupAnalysisTable(self.testing_set)
+            speedup_analysis_table.set_flush_location(
+                self.folder["speedup_analysis"], "speedup_analysis" if filename is None else filename)
             speedup_analysis_table.set_Nmax(N_generator_max())
             speedup_analysis_table.add_column(
                 "speedup_solve", group_name="speedup_solve", operations=("min", "mean", "max"))
             speedup_analysis_table.add_column(
                 "speedup_output", group_name="speedup_output", operations=("min", "mean", "max"))
 
-            truth_timer = Timer("parallel")
-            reduced_timer = Timer("serial")
-
-            for (mu_index, mu) in enumerate(self.testing_set):
-                print(TextLine(str(mu_index), fill="#"))
+            if benchmark is not None:
+                for phase in ("theta", "assembly", "solve"):
+                    speedup_analysis_table.add_column(
+                        "online_time_" + phase, group_name="online_time", operations=("min", "mean", "max"))
 
-                self.reduced_problem.set_mu(mu)
+            truth_timer = Timer("parallel", self.testing_set.group_mpi_comm)
+            reduced_timer = Timer("serial", self.testing_set.group_mpi_comm)
 
-                truth_timer.start()
-                self.truth_problem.solve(**kwargs)
-                elapsed_truth_solve = truth_timer.stop()
-
-                truth_timer.start()
-                self.truth_problem.compute_output()
-                elapsed_truth_output = truth_timer.stop()
-
-                for (n_int, n_arg) in N_generator_items():
-                    reduced_timer.start()
-                    solution = self.reduced_problem.solve(n_arg, **kwargs)
-                    elapsed_reduced_solve = reduced_timer.stop()
-
-                    reduced_timer.start()
-                    output = self.reduced_problem.compute_output()
-                    elapsed_reduced_output = reduced_timer.stop()
+            # In benchmarking mode, reduced solutions and outputs are removed from caches before each timed call,
+            # while truth solutions and outputs are computed bypassing caches, which are also stored on disk
+            def timed(timer, function, clear_caches_of=None, bypass_caches_of=None):
+                if benchmark is not None and clear_caches_of is not None:
+                    setup = self._speedup_analysis_clear_caches(*clear_caches_of, **kwargs)
+                else:
+                    setup = None
+                if benchmark is not None and bypass_caches_of is not None:
+                    function = self._speedup_analysis_bypass_caches(function, *bypass_caches_of, **kwargs)
+                return self._speedup_analysis_time(timer, function, benchmark, setup)
+
+            with self.testing_set.distributed_io():
+                for (mu_index, mu) in self.testing_set.enumerate_local():
+                    print(TextLine(str(mu_index), fill="#"))
+
+                    self.reduced_problem.set_mu(mu)
+
+                    (_, elapsed_truth_solve) = timed(
+                        truth_timer, lambda: self.truth_problem.solve(**kwargs),
+                        bypass_caches_of=(self.truth_problem, "solution"))
+
+                    (_, elapsed_truth_output) = timed(
+                        truth_timer, self.truth_problem.compute_output,
+                        bypass_caches_of=(self.truth_problem, "output"))
+
+                    for (n_int, n_arg) in N_generator_items():
+                        (solution, elapsed_reduced_solve) = timed(
+                            reduced_timer, lambda: self.reduced_problem.solve(n_arg, **kwargs),
+                            (self.reduced_problem, "solution"))
+
+                        if benchmark is not None:
+                            if solution is not NotImplemented:
+                                online_phases_elapsed = self._speedup_analysis_online_phases(n_arg, benchmark, **kwargs)
+                                for (phase, elapsed_phase) in online_phases_elapsed.items():
+                                    speedup_analysis_table["online_time_" + phase, n_int, mu_index] = elapsed_phase
+                            else:
+                                for phase in ("theta", "assembly", "solve"):
+                                    speedup_analysis_table["online_time_" + phase, n_int, mu_index] = NotImplemented
+
+                        (output, elapsed_reduced_output) = timed(
+                            reduced_timer, self.reduced_problem.compute_output, (self.reduced_problem, "output"))
+
+                        if solution is not NotImplemented:
+                            speedup_analysis_table[
+                                "speedup_solve", n_int, mu_index] = elapsed_truth_solve / elapsed_reduced_solve
+                        else:
+                            speedup_analysis_table["speedup_solve", n_int, mu_index] = NotImplemented
+                        if output is not NotImplemented:
+                            speedup_analysis_table[
+                                "speedup_output", n_int, mu_index] = (
+                                    elapsed_truth_solve + elapsed_truth_output) / (
+                                        elapsed_reduced_solve + elapsed_reduced_output)
+                        else:
+                            speedup_analysis_table["speedup_output", n_int, mu_index] = NotImplemented
 
-                    if solution is not NotImplemented:
-                        speedup_analysis_table[
-                            "speedup_solve", n_int, mu_index] = elapsed_truth_solve / elapsed_reduced_solve
-                    else:
-                        speedup_analysis_table["speedup_solve", n_int, mu_index] = NotImplemented
-                    if output is not NotImplemented:
-                        speedup_analysis_table[
-                            "speedup_output", n_int, mu_index] = (
-                                elapsed_truth_solve + elapsed_truth_output) / (
-                                    elapsed_reduced_solve + elapsed_reduced_output)
-                    else:
-                        speedup_analysis_table["speedup_output", n_int, mu_index] = NotImplemented
+            # Merge results computed by each group of processes
+            speedup_analysis_table.merge_partial_tables()
 
             # Print
             print("")
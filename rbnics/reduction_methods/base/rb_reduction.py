@@ -43,6 +43,8 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             self.greedy_selected_parameters = GreedySelectedParametersList()
             self.greedy_error_estimators = GreedyErrorEstimatorsList()
             self.label = "RB"
+            # Checkpoint of an interrupted offline stage, if any
+            self._offline_checkpoint = None
 
         def _init_offline(self):
             # Call parent to initialize inner product and reduced problem
@@ -60,6 +62,18 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
                 inner_product = self.truth_problem.inner_product[0]
                 self.GS = GramSchmidt(self.truth_problem.V, inner_product)
 
+            # Resume an offline stage which was interrupted, rather than skipping it
+            self._offline_checkpoint = None
+            if not output:
+                checkpoint = self._load_offline_checkpoint()
+                if checkpoint is not None and not checkpoint["completed"]:
+                    # Offline data stored by the interrupted run are not loaded, since the interruption may have
+                    # left them in an inconsistent state: they will be overwritten while resuming
+                    self.reduced_problem.init("offline")
+                    if checkpoint["N"] is not None:  # otherwise, interrupted before the initial greedy was completed
+                        self._offline_checkpoint = checkpoint
+                    output = True
+
             # Return
             return output
 
@@ -80,16 +94,26 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase begins", fill="="))
             print("")
 
-            # Initialize first parameter to be used
-            self.reduced_problem.build_reduced_operators()
-            self.reduced_problem.build_error_estimation_operators()
-            (absolute_error_estimator_max, relative_error_estimator_max) = self.greedy()
-            print("initial maximum absolute error estimator over training set =", absolute_error_estimator_max)
-            print("initial maximum relative error estimator over training set =", relative_error_estimator_max)
+            if self._offline_checkpoint is None:
+                self._save_offline_checkpoint(completed=False, N=None)
+
+                # Initialize first parameter to be used
+                self.reduced_problem.build_reduced_operators()
+                self.reduced_problem.build_error_estimation_operators()
+                (absolute_error_estimator_max, relative_error_estimator_max) = self.greedy()
+                print("initial maximum absolute error estimator over training set =", absolute_error_estimator_max)
+                print("initial maximum relative error estimator over training set =", relative_error_estimator_max)
+                self._save_greedy_checkpoint(completed=False)
+            else:
+                # Restore the last consistent state of the interrupted offline stage
+                (absolute_error_estimator_max, relative_error_estimator_max) = self._restore_greedy_checkpoint()
+                print("resume from checkpoint with N =", self.reduced_problem.N)
+                print("maximum absolute error estimator over training set =", absolute_error_estimator_max)
+                print("maximum relative error estimator over training set =", relative_error_estimator_max)
 
             print("")
 
-            iteration = 0
+            iteration = len(self.greedy_selected_parameters) - 1
             while self.reduced_problem.N < self.Nmax and relative_error_estimator_max >= self.tol:
                 print(TextLine("N = " + str(self.reduced_problem.N), fill="#"))
 
@@ -114,12 +138,49 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
                 (absolute_error_estimator_max, relative_error_estimator_max) = self.greedy()
                 print("maximum absolute error estimator over training set =", absolute_error_estimator_max)
                 print("maximum relative error estimator over training set =", relative_error_estimator_max)
+                self._save_greedy_checkpoint(completed=False)
 
                 print("")
 
+            self._save_greedy_checkpoint(completed=True)
+
             print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase ends", fill="="))
             print("")
 
+        def _save_greedy_checkpoint(self, completed):
+            # Basis functions, reduced operators and Riesz representers have already been saved to file
+            # by the current iteration, so it is enough to store their size and the greedy history
+            self._save_offline_checkpoint(
+                completed=completed, N=self.reduced_problem.N,
+                greedy_selected_parameters=list(self.greedy_selected_parameters),
+                greedy_error_estimators=list(self.greedy_error_estimators))
+
+        def _restore_greedy_checkpoint(self):
+            # Replay the basis updates of the interrupted run, retrieving its snapshots from the truth solution
+            # cache. Basis functions cannot be simply truncated to the checkpointed dimension, since basis
+            # updates are not necessarily hierarchical (e.g. POD-Greedy with a POD basis extension)
+            checkpoint = self._offline_checkpoint
+            self.reduced_problem.build_reduced_operators()
+            self.reduced_problem.build_error_estimation_operators()
+            for (iteration, mu) in enumerate(checkpoint["greedy_selected_parameters"][:-1]):
+                print("replay basis update for mu =", mu)
+                self.truth_problem.set_mu(mu)
+                snapshot = self.truth_problem.solve()
+                snapshot = self.postprocess_snapshot(snapshot, iteration)
+                self.update_basis_matrix(snapshot)
+                self.reduced_problem.build_reduced_operators()
+                self.reduced_problem.build_error_estimation_operators()
+            assert self.reduced_problem.N == checkpoint["N"]
+            for mu in checkpoint["greedy_selected_parameters"]:
+                self.greedy_selected_parameters.append(mu)
+            self.greedy_selected_parameters.save(self.folder["post_processing"], "mu_greedy")
+            for error_estimator in checkpoint["greedy_error_estimators"]:
+                self.greedy_error_estimators.append(error_estimator)
+            self.greedy_error_estimators.save(self.folder["post_processing"], "error_estimator_max")
+            self.truth_problem.set_mu(self.greedy_selected_parameters[-1])
+            error_estimator_max = self.greedy_error_estimators[-1]
+            return (error_estimator_max, error_estimator_max / self.greedy_error_estimators[0])
+
         def update_basis_matrix(self, snapshot):
             """
             It updates basis matrix.
@@ -234,6 +295,8 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             print("")
 
             error_analysis_table = ErrorAnalysisTable(self.testing_set)
+            error_analysis_table.set_flush_location(
+                self.folder["error_analysis"], "error_analysis" if filename is None else filename)
             error_analysis_table.set_Nmax(N_generator_max())
             if len(components) > 1:
                 all_components_string = "".join(components)
@@ -309,85 +372,90 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             error_analysis_table.add_column(
                 "relative_effectivity_output", group_name="output_relative_error", operations=("min", "mean", "max"))
 
-            for (mu_index, mu) in enumerate(self.testing_set):
-                print(TextLine(str(mu_index), fill="#"))
-
-                self.reduced_problem.set_mu(mu)
-
-                for (n_int, n_arg) in N_generator_items():
-                    self.reduced_problem.solve(n_arg, **kwargs)
-                    error = self.reduced_problem.compute_error(**kwargs)
-                    if len(components) > 1:
-                        error[all_components_string] = sqrt(
-                            sum([error[component]**2 for component in components]))
-                    error_estimator = self.reduced_problem.estimate_error()
-                    relative_error = self.reduced_problem.compute_relative_error(**kwargs)
-                    if len(components) > 1:
-                        relative_error[all_components_string] = sqrt(
-                            sum([relative_error[component]**2 for component in components]))
-                    relative_error_estimator = self.reduced_problem.estimate_relative_error()
-
-                    self.reduced_problem.compute_output()
-                    error_output = self.reduced_problem.compute_error_output(**kwargs)
-                    error_output_estimator = self.reduced_problem.estimate_error_output()
-                    relative_error_output = self.reduced_problem.compute_relative_error_output(**kwargs)
-                    relative_error_output_estimator = self.reduced_problem.estimate_relative_error_output()
-
-                    if len(components) > 1:
-                        for component in components:
+            with self.testing_set.distributed_io():
+                for (mu_index, mu) in self.testing_set.enumerate_local():
+                    print(TextLine(str(mu_index), fill="#"))
+
+                    self.reduced_problem.set_mu(mu)
+                    self.reduced_problem.solve_nested([n_arg for (_, n_arg) in N_generator_items()], **kwargs)
+
+                    for (n_int, n_arg) in N_generator_items():
+                        self.reduced_problem.solve(n_arg, **kwargs)
+                        error = self.reduced_problem.compute_error(**kwargs)
+                        if len(components) > 1:
+                            error[all_components_string] = sqrt(
+                                sum([error[component]**2 for component in components]))
+                        error_estimator = self.reduced_problem.estimate_error()
+                        relative_error = self.reduced_problem.compute_relative_error(**kwargs)
+                        if len(components) > 1:
+                            relative_error[all_components_string] = sqrt(
+                                sum([relative_error[component]**2 for component in components]))
+                        relative_error_estimator = self.reduced_problem.estimate_relative_error()
+
+                        self.reduced_problem.compute_output()
+                        error_output = self.reduced_problem.compute_error_output(**kwargs)
+                        error_output_estimator = self.reduced_problem.estimate_error_output()
+                        relative_error_output = self.reduced_problem.compute_relative_error_output(**kwargs)
+                        relative_error_output_estimator = self.reduced_problem.estimate_relative_error_output()
+
+                        if len(components) > 1:
+                            for component in components:
+                                error_analysis_table[
+                                    "error_" + component, n_int, mu_index] = error[component]
+                                error_analysis_table[
+                                    "relative_error_" + component, n_int, mu_index] = relative_error[component]
                             error_analysis_table[
-                                "error_" + component, n_int, mu_index] = error[component]
+                                "error_" + all_components_string, n_int, mu_index] = error[all_components_string]
+                            error_analysis_table[
+                                "error_estimator_" + all_components_string, n_int, mu_index] = error_estimator
+                            error_analysis_table[
+                                "effectivity_" + all_components_string, n_int, mu_index] = error_analysis_table[
+                                    "error_estimator_" + all_components_string, n_int, mu_index] / error_analysis_table[
+                                        "error_" + all_components_string, n_int, mu_index]
+                            error_analysis_table[
+                                "relative_error_" + all_components_string, n_int, mu_index] = relative_error[
+                                    all_components_string]
                             error_analysis_table[
-                                "relative_error_" + component, n_int, mu_index] = relative_error[component]
-                        error_analysis_table[
-                            "error_" + all_components_string, n_int, mu_index] = error[all_components_string]
-                        error_analysis_table[
-                            "error_estimator_" + all_components_string, n_int, mu_index] = error_estimator
-                        error_analysis_table[
-                            "effectivity_" + all_components_string, n_int, mu_index] = error_analysis_table[
-                                "error_estimator_" + all_components_string, n_int, mu_index] / error_analysis_table[
-                                    "error_" + all_components_string, n_int, mu_index]
-                        error_analysis_table[
-                            "relative_error_" + all_components_string, n_int, mu_index] = relative_error[
-                                all_components_string]
-                        error_analysis_table[
-                            "relative_error_estimator_" + all_components_string, n_int,
-                            mu_index] = relative_error_estimator
-                        error_analysis_table[
-                            "relative_effectivity_" + all_components_string, n_int,
-                            mu_index] = error_analysis_table[
                                 "relative_error_estimator_" + all_components_string, n_int,
-                                mu_index] / error_analysis_table[
-                                    "relative_error_" + all_components_string, n_int, mu_index]
-                    else:
-                        component = components[0]
-                        error_analysis_table["error_" + component, n_int, mu_index] = error
-                        error_analysis_table["error_estimator_" + component, n_int, mu_index] = error_estimator
+                                mu_index] = relative_error_estimator
+                            error_analysis_table[
+                                "relative_effectivity_" + all_components_string, n_int,
+                                mu_index] = error_analysis_table[
+                                    "relative_error_estimator_" + all_components_string, n_int,
+                                    mu_index] / error_analysis_table[
+                                        "relative_error_" + all_components_string, n_int, mu_index]
+                        else:
+                            component = components[0]
+                            error_analysis_table["error_" + component, n_int, mu_index] = error
+                            error_analysis_table["error_estimator_" + component, n_int, mu_index] = error_estimator
+                            error_analysis_table[
+                                "effectivity_" + component, n_int, mu_index] = error_analysis_table[
+                                    "error_estimator_" + component, n_int, mu_index] / error_analysis_table[
+                                        "error_" + component, n_int, mu_index]
+                            error_analysis_table["relative_error_" + component, n_int, mu_index] = relative_error
+                            error_analysis_table[
+                                "relative_error_estimator_" + component, n_int, mu_index] = relative_error_estimator
+                            error_analysis_table[
+                                "relative_effectivity_" + component, n_int, mu_index] = error_analysis_table[
+                                    "relative_error_estimator_" + component, n_int, mu_index] / error_analysis_table[
+                                        "relative_error_" + component, n_int, mu_index]
+
+                        error_analysis_table["error_output", n_int, mu_index] = error_output
+                        error_analysis_table["error_estimator_output", n_int, mu_index] = error_output_estimator
                         error_analysis_table[
-                            "effectivity_" + component, n_int, mu_index] = error_analysis_table[
-                                "error_estimator_" + component, n_int, mu_index] / error_analysis_table[
-                                    "error_" + component, n_int, mu_index]
-                        error_analysis_table["relative_error_" + component, n_int, mu_index] = relative_error
+                            "effectivity_output", n_int, mu_index] = error_analysis_table[
+                                "error_estimator_output", n_int, mu_index] / error_analysis_table[
+                                    "error_output", n_int, mu_index]
+                        error_analysis_table["relative_error_output", n_int, mu_index] = relative_error_output
                         error_analysis_table[
-                            "relative_error_estimator_" + component, n_int, mu_index] = relative_error_estimator
+                            "relative_error_estimator_output", n_int, mu_index] = relative_error_output_estimator
                         error_analysis_table[
-                            "relative_effectivity_" + component, n_int, mu_index] = error_analysis_table[
-                                "relative_error_estimator_" + component, n_int, mu_index] / error_analysis_table[
-                                    "relative_error_" + component, n_int, mu_index]
-
-                    error_analysis_table["error_output", n_int, mu_index] = error_output
-                    error_analysis_table["error_estimator_output", n_int, mu_index] = error_output_estimator
-                    error_analysis_table[
-                        "effectivity_output", n_int, mu_index] = error_analysis_table[
-                            "error_estimator_output", n_int, mu_index] / error_analysis_table[
-                                "error_output", n_int, mu_index]
-                    error_analysis_table["relative_error_output", n_int, mu_index] = relative_error_output
-                    error_analysis_table[
-                        "relative_error_estimator_output", n_int, mu_index] = relative_error_output_estimator
-                    error_analysis_table[
-                        "relative_effectivity_output", n_int, mu_index] = error_analysis_table[
-                            "relative_error_estimator_output", n_int, mu_index] / error_analysis_table[
-                                "relative_error_output", n_int, mu_index]
+                            "relative_effectivity_output", n_int, mu_index] = error_analysis_table[
+                                "relative_error_estimator_output", n_int, mu_index] / error_analysis_table[
+                                    "relative_error_output", n_int, mu_index]
+
+            # Merge results computed by each group of processes
+            error_analysis_table.merge_partial_tables()
 
             # Print
             print("")
@@ -407,12 +475,19 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             over the testing set.
 
             :param N_generator: generator of dimension of the reduced problem.
+            :param benchmark: (optional kwarg) enable the benchmarking mode, either with default settings (True)
+                or with a dict of settings among "warm_up" (number of untimed calls), "repeats" (number of timed
+                calls) and "statistic" ("min" or "median" of the timed calls). In benchmarking mode caches are
+                cleared before each call, and the online time is further split into theta evaluation, assembly,
+                solve and error estimation.
             """
             self._init_speedup_analysis(**kwargs)
             self._speedup_analysis(N_generator, filename, **kwargs)
             self._finalize_speedup_analysis(**kwargs)
 
         def _speedup_analysis(self, N_generator=None, filename=None, **kwargs):
+            benchmark = self._speedup_analysis_benchmark(kwargs.pop("benchmark", None))
+
             if N_generator is None:
                 def N_generator():
                     N = self.reduced_problem.N
@@ -446,6 +521,8 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             print("")
 
             speedup_analysis_table = SpeedupAnalysisTable(self.testing_set)
+            speedup_analysis_table.set_flush_location(
+                self.folder["speedup_analysis"], "speedup_analysis" if filename is None else filename)
             speedup_analysis_table.set_Nmax(N_generator_max())
             speedup_analysis_table.add_column(
                 "speedup_solve",
@@ -472,112 +549,143 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
                 group_name="speedup_output_and_estimate_relative_error_output",
                 operations=("min", "mean", "max"))
 
-            truth_timer = Timer("parallel")
-            reduced_timer = Timer("serial")
-
-            for (mu_index, mu) in enumerate(self.testing_set):
-                print(TextLine(str(mu_index), fill="#"))
-
-                self.reduced_problem.set_mu(mu)
-
-                truth_timer.start()
-                self.truth_problem.solve(**kwargs)
-                elapsed_truth_solve = truth_timer.stop()
-
-                truth_timer.start()
-                self.truth_problem.compute_output()
-                elapsed_truth_output = truth_timer.stop()
-
-                for (n_int, n_arg) in N_generator_items():
-                    reduced_timer.start()
-                    solution = self.reduced_problem.solve(n_arg, **kwargs)
-                    elapsed_reduced_solve = reduced_timer.stop()
-
-                    truth_timer.start()
-                    self.reduced_problem.compute_error(**kwargs)
-                    elapsed_error = truth_timer.stop()
-
-                    reduced_timer.start()
-                    error_estimator = self.reduced_problem.estimate_error()
-                    elapsed_error_estimator = reduced_timer.stop()
-
-                    truth_timer.start()
-                    self.reduced_problem.compute_relative_error(**kwargs)
-                    elapsed_relative_error = truth_timer.stop()
-
-                    reduced_timer.start()
-                    relative_error_estimator = self.reduced_problem.estimate_relative_error()
-                    elapsed_relative_error_estimator = reduced_timer.stop()
-
-                    reduced_timer.start()
-                    output = self.reduced_problem.compute_output()
-                    elapsed_reduced_output = reduced_timer.stop()
-
-                    truth_timer.start()
-                    self.reduced_problem.compute_error_output(**kwargs)
-                    elapsed_error_output = truth_timer.stop()
-
-                    reduced_timer.start()
-                    error_estimator_output = self.reduced_problem.estimate_error_output()
-                    elapsed_error_estimator_output = reduced_timer.stop()
-
-                    truth_timer.start()
-                    self.reduced_problem.compute_relative_error_output(**kwargs)
-                    elapsed_relative_error_output = truth_timer.stop()
-
-                    reduced_timer.start()
-                    relative_error_estimator_output = self.reduced_problem.estimate_relative_error_output()
-                    elapsed_relative_error_estimator_output = reduced_timer.stop()
-
-                    if solution is not NotImplemented:
-                        speedup_analysis_table[
-                            "speedup_solve", n_int, mu_index] = elapsed_truth_solve / elapsed_reduced_solve
-                    else:
-                        speedup_analysis_table[
-                            "speedup_solve", n_int, mu_index] = NotImplemented
-                    if error_estimator is not NotImplemented:
-                        speedup_analysis_table[
-                            "speedup_solve_and_estimate_error", n_int, mu_index] = (
-                                elapsed_truth_solve + elapsed_error) / (
-                                    elapsed_reduced_solve + elapsed_error_estimator)
-                    else:
-                        speedup_analysis_table[
-                            "speedup_solve_and_estimate_error", n_int, mu_index] = NotImplemented
-                    if relative_error_estimator is not NotImplemented:
-                        speedup_analysis_table[
-                            "speedup_solve_and_estimate_relative_error", n_int, mu_index] = (
-                                elapsed_truth_solve + elapsed_relative_error) / (
-                                    elapsed_reduced_solve + elapsed_relative_error_estimator)
-                    else:
-                        speedup_analysis_table[
-                            "speedup_solve_and_estimate_relative_error", n_int, mu_index] = NotImplemented
-                    if output is not NotImplemented:
-                        speedup_analysis_table[
-                            "speedup_output", n_int, mu_index] = (
-                                elapsed_truth_solve + elapsed_truth_output) / (
-                                    elapsed_reduced_solve + elapsed_reduced_output)
-                    else:
-                        speedup_analysis_table[
-                            "speedup_output", n_int, mu_index] = NotImplemented
-                    if error_estimator_output is not NotImplemented:
-                        assert output is not NotImplemented
-                        speedup_analysis_table[
-                            "speedup_output_and_estimate_error_output", n_int, mu_index] = (
-                                elapsed_truth_solve + elapsed_truth_output + elapsed_error_output) / (
-                                    elapsed_reduced_solve + elapsed_reduced_output + elapsed_error_estimator_output)
-                    else:
-                        speedup_analysis_table[
-                            "speedup_output_and_estimate_error_output", n_int, mu_index] = NotImplemented
-                    if relative_error_estimator_output is not NotImplemented:
-                        assert output is not NotImplemented
-                        speedup_analysis_table[
-                            "speedup_output_and_estimate_relative_error_output", n_int, mu_index] = (
-                                elapsed_truth_solve + elapsed_truth_output + elapsed_relative_error_output) / (
-                                    elapsed_reduced_solve + elapsed_reduced_output
-                                    + elapsed_relative_error_estimator_output)
-                    else:
-                        speedup_analysis_table[
-                            "speedup_output_and_estimate_relative_error_output", n_int, mu_index] = NotImplemented
+            if benchmark is not None:
+                for phase in ("theta", "assembly", "solve", "estimate_error"):
+                    speedup_analysis_table.add_column(
+                        "online_time_" + phase,
+                        group_name="online_time",
+                        operations=("min", "mean", "max"))
+
+            truth_timer = Timer("parallel", self.testing_set.group_mpi_comm)
+            reduced_timer = Timer("serial", self.testing_set.group_mpi_comm)
+
+            # In benchmarking mode, reduced solutions and outputs are removed from caches before each timed call,
+            # while truth solutions and outputs are computed bypassing caches, which are also stored on disk
+            def timed(timer, function, clear_caches_of=None, bypass_caches_of=None):
+                if benchmark is not None and clear_caches_of is not None:
+                    setup = self._speedup_analysis_clear_caches(*clear_caches_of, **kwargs)
+                else:
+                    setup = None
+                if benchmark is not None and bypass_caches_of is not None:
+                    function = self._speedup_analysis_bypass_caches(function, *bypass_caches_of, **kwargs)
+                return self._speedup_analysis_time(timer, function, benchmark, setup)
+
+            with self.testing_set.distributed_io():
+                for (mu_index, mu) in self.testing_set.enumerate_local():
+                    print(TextLine(str(mu_index), fill="#"))
+
+                    self.reduced_problem.set_mu(mu)
+
+                    (_, elapsed_truth_solve) = timed(
+                        truth_timer, lambda: self.truth_problem.solve(**kwargs),
+                        bypass_caches_of=(self.truth_problem, "solution"))
+
+                    (_, elapsed_truth_output) = timed(
+                        truth_timer, self.truth_problem.compute_output,
+                        bypass_caches_of=(self.truth_problem, "output"))
+
+                    for (n_int, n_arg) in N_generator_items():
+                        (solution, elapsed_reduced_solve) = timed(
+                            reduced_timer, lambda: self.reduced_problem.solve(n_arg, **kwargs),
+                            (self.reduced_problem, "solution"))
+
+                        if benchmark is not None and solution is not NotImplemented:
+                            online_phases_elapsed = self._speedup_analysis_online_phases(n_arg, benchmark, **kwargs)
+                        else:
+                            online_phases_elapsed = None
+
+                        (_, elapsed_error) = timed(
+                            truth_timer, lambda: self.reduced_problem.compute_error(**kwargs))
+
+                        (error_estimator, elapsed_error_estimator) = timed(
+                            reduced_timer, self.reduced_problem.estimate_error)
+
+                        (_, elapsed_relative_error) = timed(
+                            truth_timer, lambda: self.reduced_problem.compute_relative_error(**kwargs))
+
+                        (relative_error_estimator, elapsed_relative_error_estimator) = timed(
+                            reduced_timer, self.reduced_problem.estimate_relative_error)
+
+                        (output, elapsed_reduced_output) = timed(
+                            reduced_timer, self.reduced_problem.compute_output, (self.reduced_problem, "output"))
+
+                        (_, elapsed_error_output) = timed(
+                            truth_timer, lambda: self.reduced_problem.compute_error_output(**kwargs))
+
+                        (error_estimator_output, elapsed_error_estimator_output) = timed(
+                            reduced_timer, self.reduced_problem.estimate_error_output)
+
+                        (_, elapsed_relative_error_output) = timed(
+                            truth_timer, lambda: self.reduced_problem.compute_relative_error_output(**kwargs))
+
+                        (relative_error_estimator_output, elapsed_relative_error_estimator_output) = timed(
+                            reduced_timer, self.reduced_problem.estimate_relative_error_output)
+
+                        if benchmark is not None:
+                            for phase in ("theta", "assembly", "solve"):
+                                if online_phases_elapsed is not None:
+                                    speedup_analysis_table[
+                                        "online_time_" + phase, n_int, mu_index] = online_phases_elapsed[phase]
+                                else:
+                                    speedup_analysis_table["online_time_" + phase, n_int, mu_index] = NotImplemented
+                            if error_estimator is not NotImplemented:
+                                speedup_analysis_table[
+                                    "online_time_estimate_error", n_int, mu_index] = elapsed_error_estimator
+                            else:
+                                speedup_analysis_table["online_time_estimate_error", n_int, mu_index] = NotImplemented
+
+                        if solution is not NotImplemented:
+                            speedup_analysis_table[
+                                "speedup_solve", n_int, mu_index] = elapsed_truth_solve / elapsed_reduced_solve
+                        else:
+                            speedup_analysis_table[
+                                "speedup_solve", n_int, mu_index] = NotImplemented
+                        if error_estimator is not NotImplemented:
+                            speedup_analysis_table[
+                                "speedup_solve_and_estimate_error", n_int, mu_index] = (
+                                    elapsed_truth_solve + elapsed_error) / (
+                                        elapsed_reduced_solve + elapsed_error_estimator)
+                        else:
+                            speedup_analysis_table[
+                                "speedup_solve_and_estimate_error", n_int, mu_index] = NotImplemented
+                        if relative_error_estimator is not NotImplemented:
+                            speedup_analysis_table[
+                                "speedup_solve_and_estimate_relative_error", n_int, mu_index] = (
+                                    elapsed_truth_solve + elapsed_relative_error) / (
+                                        elapsed_reduced_solve + elapsed_relative_error_estimator)
+                        else:
+                            speedup_analysis_table[
+                                "speedup_solve_and_estimate_relative_error", n_int, mu_index] = NotImplemented
+                        if output is not NotImplemented:
+                            speedup_analysis_table[
+                                "speedup_output", n_int, mu_index] = (
+                                    elapsed_truth_solve + elapsed_truth_output) / (
+                                        elapsed_reduced_solve + elapsed_reduced_output)
+                        else:
+                            speedup_analysis_table[
+                                "speedup_output", n_int, mu_index] = NotImplemented
+                        if error_estimator_output is not NotImplemented:
+                            assert output is not NotImplemented
+                            speedup_analysis_table[
+                                "speedup_output_and_estimate_error_output", n_int, mu_index] = (
+                                    elapsed_truth_solve + elapsed_truth_output + elapsed_error_output) / (
+                                        elapsed_reduced_solve + elapsed_reduced_output + elapsed_error_estimator_output)
+                        else:
+                            speedup_analysis_table[
+                                "speedup_output_and_estimate_error_output", n_int, mu_index] = NotImplemented
+                        if relative_error_estimator_output is not NotImplemented:
+                            assert output is not NotImplemented
+                            speedup_analysis_table[
+                                "speedup_output_and_estimate_relative_error_output", n_int, mu_index] = (
+                                    elapsed_truth_solve + elapsed_truth_output + elapsed_relative_error_output) / (
+                                        elapsed_reduced_solve + elapsed_reduced_output
+                                        + elapsed_relative_error_estimator_output)
+                        else:
+                            speedup_analysis_table[
+                                "speedup_output_and_estimate_relative_error_output", n_int, mu_index] = NotImplemented
+
+            # Merge results computed by each group of processes
+            speedup_analysis_table.merge_partial_tables()
 
             # Print
             print("")
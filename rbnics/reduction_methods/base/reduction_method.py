@@ -7,7 +7,8 @@
 import os
 from abc import ABCMeta, abstractmethod
 from rbnics.sampling import ParameterSpaceSubset
-from rbnics.utils.io import Folders
+from rbnics.utils.io import Folders, PickleIO
+from rbnics.utils.mpi import parallel_io
 
 
 # Implementation of a class containing an offline/online decomposition of ROM for parametrized problems
@@ -96,6 +97,27 @@ class ReductionMethod(object, metaclass=ABCMeta):
     def _finalize_offline(self):
         pass
 
+    # Save a checkpoint of the offline phase in the post processing folder. The checkpoint is written to a
+    # temporary file first, which then atomically replaces the previous one, so that a run which gets
+    # interrupted always leaves behind the last consistent checkpoint
+    def _save_offline_checkpoint(self, **checkpoint):
+        directory = str(self.folder["post_processing"])
+        PickleIO.save_file(checkpoint, directory, "offline_checkpoint_tmp")
+
+        def replace_checkpoint_task():
+            os.replace(os.path.join(directory, "offline_checkpoint_tmp.pkl"),
+                       os.path.join(directory, "offline_checkpoint.pkl"))
+
+        parallel_io(replace_checkpoint_task)
+
+    # Load the last checkpoint of the offline phase, or return None if no checkpoint is available
+    # (e.g. because offline data were generated by a version which did not store checkpoints)
+    def _load_offline_checkpoint(self):
+        if PickleIO.exists_file(self.folder["post_processing"], "offline_checkpoint"):
+            return PickleIO.load_file(self.folder["post_processing"], "offline_checkpoint")
+        else:
+            return None
+
     # Compute the error of the reduced order approximation with respect to the full order one
     # over the testing set
     @abstractmethod
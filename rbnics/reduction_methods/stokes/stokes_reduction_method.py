@@ -34,6 +34,13 @@ def StokesReductionMethod(DifferentialProblemReductionMethod_DerivedClass):
             # Return a tuple
             return (snapshot, supremizer)
 
+        # Finalize data structures required after the offline phase
+        def _finalize_offline(self):
+            # Release the factorization of the supremizer inner product
+            self.truth_problem._supremizer_solver = None
+            # Call parent
+            StokesReductionMethod_Base._finalize_offline(self)
+
         def _print_supremizer_solve_message(self):
             print("supremizer solve for mu =", self.truth_problem.mu)
 
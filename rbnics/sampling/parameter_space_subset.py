@@ -5,14 +5,15 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 import operator  # to find closest parameters
+from contextlib import nullcontext
 from math import sqrt
-from mpi4py.MPI import COMM_WORLD
+from mpi4py.MPI import COMM_WORLD, UNDEFINED
 from numpy import zeros as array
 from numpy import argmax
 from rbnics.sampling.distributions import CompositeDistribution, UniformDistribution
 from rbnics.utils.decorators import overload
 from rbnics.utils.io import ExportableList
-from rbnics.utils.mpi import parallel_io as parallel_generate, parallel_max
+from rbnics.utils.mpi import parallel_io as parallel_generate, parallel_io_default_mpi_comm, parallel_max
 
 
 class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
@@ -20,6 +21,9 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
         ExportableList.__init__(self, "text")
         self.mpi_comm = COMM_WORLD
         self.distributed_max = True
+        self.group_mpi_comm = None
+        self._group_index = 0
+        self._number_of_groups = 1
 
     @overload
     def __getitem__(self, key: int):
@@ -79,6 +83,36 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
     def serialize_maximum_computations(self):
         self.distributed_max = False
 
+    # Partition the parameters among groups of processes, each one owning a copy of the truth problem
+    # distributed over group_mpi_comm, which must be obtained by splitting the communicator of this subset
+    def distribute_enumeration(self, group_mpi_comm):
+        roots_mpi_comm = self.mpi_comm.Split(0 if group_mpi_comm.rank == 0 else UNDEFINED, self.mpi_comm.rank)
+        if group_mpi_comm.rank == 0:
+            group_index_and_number_of_groups = (roots_mpi_comm.rank, roots_mpi_comm.size)
+            roots_mpi_comm.Free()
+        else:
+            group_index_and_number_of_groups = None
+        (self._group_index, self._number_of_groups) = group_mpi_comm.bcast(group_index_and_number_of_groups, root=0)
+        self.group_mpi_comm = group_mpi_comm
+
+    # Enumerate the parameters assigned to the group of the current process, with their global index
+    def enumerate_local(self):
+        if self.group_mpi_comm is None:
+            return list(enumerate(self._list))
+        else:
+            return [(i, self._list[i]) for i in range(self._group_index, len(self._list), self._number_of_groups)]
+
+    # Carry out I/O collectively on the group communicator while processing the parameters assigned to the group.
+    # Meant to be used as a with statement enclosing the loop over enumerate_local
+    def distributed_io(self):
+        if self.group_mpi_comm is None:
+            return nullcontext()
+        else:
+            return parallel_io_default_mpi_comm(self.group_mpi_comm)
+
+    def is_group_root(self):
+        return self.group_mpi_comm is None or self.group_mpi_comm.rank == 0
+
     def diff(self, other_set):
         output = ParameterSpaceSubset()
         output.distributed_max = self.distributed_max
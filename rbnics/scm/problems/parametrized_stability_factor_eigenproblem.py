@@ -6,10 +6,13 @@
 
 import os
 import hashlib
-from numpy import isclose
+from collections import OrderedDict
+from numpy import argmin, asarray, isclose
+from numpy.linalg import norm
 from rbnics.problems.base import ParametrizedProblem
 from rbnics.backends import AffineExpansionStorage, assign, copy, EigenSolver, export, Function, import_, product, sum
 from rbnics.utils.cache import Cache
+from rbnics.utils.config import config
 from rbnics.utils.decorators import sync_setters
 
 
@@ -38,6 +41,17 @@ class ParametrizedStabilityFactorEigenProblem(ParametrizedProblem):
         # Solution
         self._eigenvalue = 0.
         self._eigenvector = Function(truth_problem.stability_factor_V)
+        # Eigenvectors already computed at other parameters, to be used as initial guess by the eigen solver.
+        # Only the most recently computed ones are kept, up to the limit provided in the configuration
+        self._warm_start = config.get("SCM", "warm start")
+        warm_start_limit = config.get("SCM", "warm start limit")
+        assert isinstance(warm_start_limit, str)
+        if warm_start_limit == "unlimited":
+            self._warm_start_limit = None
+        else:
+            self._warm_start_limit = int(warm_start_limit)
+            assert self._warm_start_limit > 0
+        self._warm_start_eigenvectors = OrderedDict()
         # I/O
         self.folder["cache"] = os.path.join(folder_prefix, "cache")
 
@@ -145,6 +159,10 @@ class ParametrizedStabilityFactorEigenProblem(ParametrizedProblem):
         eigensolver_parameters["spectrum"] = self.spectrum + " real"
         eigensolver_parameters.update(self.eigensolver_parameters)
         eigensolver.set_parameters(eigensolver_parameters)
+        if self._warm_start:
+            initial_guess = self._get_warm_start_eigenvector()
+            if initial_guess is not None:
+                eigensolver.set_initial_space([initial_guess])
         eigensolver.solve(1)
 
         r, c = eigensolver.get_eigenvalue(0)  # real and complex part of the eigenvalue
@@ -154,6 +172,28 @@ class ParametrizedStabilityFactorEigenProblem(ParametrizedProblem):
 
         self._eigenvalue = r
         assign(self._eigenvector, r_vector)
+        if self._warm_start:
+            self._store_warm_start_eigenvector()
+
+    def _get_warm_start_eigenvector(self):
+        # Only the eigen problem associated to the full parametrized operator is solved for several
+        # parameters; eigen problems associated to a single affine expansion term are solved only once
+        if self.expansion_index is not None or len(self._warm_start_eigenvectors) == 0:
+            return None
+        # Return the eigenvector associated to the closest parameter, with distances normalized by
+        # the size of the parameter range
+        mu_range_size = asarray([mu_max - mu_min for (mu_min, mu_max) in self.mu_range])
+        mu_range_size[isclose(mu_range_size, 0.)] = 1.
+        warm_start_mu = list(self._warm_start_eigenvectors.keys())
+        distances = norm((asarray(warm_start_mu) - asarray(self.mu)) / mu_range_size, axis=1)
+        return self._warm_start_eigenvectors[warm_start_mu[argmin(distances)]]
+
+    def _store_warm_start_eigenvector(self):
+        if self.expansion_index is None:
+            self._warm_start_eigenvectors[self.mu] = copy(self._eigenvector)
+            self._warm_start_eigenvectors.move_to_end(self.mu)
+            if self._warm_start_limit is not None and len(self._warm_start_eigenvectors) > self._warm_start_limit:
+                self._warm_start_eigenvectors.popitem(last=False)
 
     def _cache_key(self):
         if self.expansion_index is None:
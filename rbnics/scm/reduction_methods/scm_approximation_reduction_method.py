@@ -29,6 +29,8 @@ class SCMApproximationReductionMethod(ReductionMethod):
         self.folder["post_processing"] = os.path.join(self.folder_prefix, "post_processing")
         self.greedy_selected_parameters = SCM_approximation.greedy_selected_parameters
         self.greedy_error_estimators = GreedyErrorEstimatorsList()
+        # Checkpoint of an interrupted offline stage, if any
+        self._offline_checkpoint = None
 
     # OFFLINE: set the elements in the training set.
     def initialize_training_set(self, ntrain, enable_import=True, sampling=None, **kwargs):
@@ -67,50 +69,91 @@ class SCMApproximationReductionMethod(ReductionMethod):
         # speedup analysis folder is required only in the speedup analysis
         at_least_one_required_folder_created = required_folders.create()
         at_least_one_optional_folder_created = optional_folders.create()  # noqa: F841
-        if not at_least_one_required_folder_created:
+        checkpoint = self._load_offline_checkpoint()
+        self._offline_checkpoint = None
+        if not at_least_one_required_folder_created and (checkpoint is None or checkpoint["completed"]):
             return False  # offline construction should be skipped, since data are already available
         else:
+            # offline construction should be carried out, resuming it if it was previously interrupted:
+            # expensive evaluations are anyway retrieved from the disk cache
+            if checkpoint is not None and "greedy_selected_parameters" in checkpoint:
+                self._offline_checkpoint = checkpoint
             self.SCM_approximation.init("offline")
-            return True  # offline construction should be carried out
+            return True
 
     def _offline(self):
         print(TextBox("SCM offline phase begins", fill="="))
         print("")
 
+        # Mark the offline stage as not completed, until the end of this method is reached
+        if self._offline_checkpoint is None:
+            self._save_offline_checkpoint(completed=False)
+
         # Compute the bounding box \mathcal{B}
         self.compute_bounding_box()
         print("")
 
-        # Arbitrarily start from the first parameter in the training set
-        self.SCM_approximation.set_mu(self.training_set[0])
-        relative_error_estimator_max = 2. * self.tol
+        if self._offline_checkpoint is None:
+            # Arbitrarily start from the first parameter in the training set
+            self.SCM_approximation.set_mu(self.training_set[0])
+            relative_error_estimator_max = 2. * self.tol
+        else:
+            # Restore the last consistent state of the interrupted offline stage
+            relative_error_estimator_max = self._restore_greedy_checkpoint()
+            print("resume from checkpoint with N =", self.SCM_approximation.N)
+            print("")
 
         while self.SCM_approximation.N < self.Nmax and relative_error_estimator_max >= self.tol:
             print(TextLine("SCM N = " + str(self.SCM_approximation.N), fill="~"))
 
-            # Store the greedy parameter
-            self.store_greedy_selected_parameters()
-
-            # Evaluate the stability factor
-            print("evaluate the stability factor for mu =", self.SCM_approximation.mu)
-            (stability_factor, eigenvector) = self.SCM_approximation.evaluate_stability_factor()
-            print("stability factor =", stability_factor)
-
-            # Update data structures related to upper bound vectors
-            upper_bound_vector = self.compute_upper_bound_vector(eigenvector)
-            self.update_upper_bound_vectors(upper_bound_vector)
+            self._update_greedy()
 
             # Prepare for next iteration
             print("find next mu")
             (error_estimator_max, relative_error_estimator_max) = self.greedy()
             print("maximum SCM error estimator =", error_estimator_max)
             print("maximum SCM relative error estimator =", relative_error_estimator_max)
+            self._save_greedy_checkpoint()
 
             print("")
 
+        self._save_offline_checkpoint(completed=True)
+
         print(TextBox("SCM offline phase ends", fill="="))
         print("")
 
+    # Enrich the SCM approximation with the stability factor at the current parameter
+    def _update_greedy(self):
+        # Store the greedy parameter
+        self.store_greedy_selected_parameters()
+
+        # Evaluate the stability factor
+        print("evaluate the stability factor for mu =", self.SCM_approximation.mu)
+        (stability_factor, eigenvector) = self.SCM_approximation.evaluate_stability_factor()
+        print("stability factor =", stability_factor)
+
+        # Update data structures related to upper bound vectors
+        upper_bound_vector = self.compute_upper_bound_vector(eigenvector)
+        self.update_upper_bound_vectors(upper_bound_vector)
+
+    def _save_greedy_checkpoint(self):
+        self._save_offline_checkpoint(
+            completed=False, greedy_selected_parameters=list(self.SCM_approximation.greedy_selected_parameters),
+            greedy_error_estimators=list(self.greedy_error_estimators), mu=self.SCM_approximation.mu)
+
+    def _restore_greedy_checkpoint(self):
+        # Replay the updates of the interrupted run, retrieving stability factors from the disk cache
+        checkpoint = self._offline_checkpoint
+        for mu in checkpoint["greedy_selected_parameters"]:
+            self.SCM_approximation.set_mu(mu)
+            self._update_greedy()
+        for error_estimator in checkpoint["greedy_error_estimators"]:
+            self.greedy_error_estimators.append(error_estimator)
+        self.greedy_error_estimators.save(self.folder["post_processing"], "error_estimator_max")
+        # Set the parameter selected by the last greedy search
+        self.SCM_approximation.set_mu(checkpoint["mu"])
+        return self.greedy_error_estimators[-1] / self.greedy_error_estimators[0]
+
     # Finalize data structures required after the offline phase
     def _finalize_offline(self):
         self.SCM_approximation.init("online")
@@ -227,38 +270,44 @@ class SCMApproximationReductionMethod(ReductionMethod):
         print("")
 
         error_analysis_table = ErrorAnalysisTable(self.testing_set)
+        error_analysis_table.set_flush_location(
+            self.folder["error_analysis"], "error_analysis" if filename is None else filename)
         error_analysis_table.set_Nmax(N_generator_max())
         error_analysis_table.add_column("normalized_error", group_name="scm", operations=("min", "mean", "max"))
 
-        for (mu_index, mu) in enumerate(self.testing_set):
-            print(TextLine("SCM " + str(mu_index), fill="~"))
-
-            self.SCM_approximation.set_mu(mu)
-
-            (exact_stability_factor, _) = self.SCM_approximation.evaluate_stability_factor()
-            for n in N_generator():
-                stability_factor_lower_bound = self.SCM_approximation.get_stability_factor_lower_bound(n)
-                stability_factor_upper_bound = self.SCM_approximation.get_stability_factor_upper_bound(n)
-                ratio_lower_bound_to_upper_bound = stability_factor_lower_bound / stability_factor_upper_bound
-                ratio_lower_bound_to_exact = stability_factor_lower_bound / exact_stability_factor
-
-                if ratio_lower_bound_to_upper_bound < 0. and not isclose(ratio_lower_bound_to_upper_bound, 0.):
-                    # if ratio_lower_bound_to_upper_bound << 0
-                    print("SCM warning at mu = " + str(mu)
-                          + ": stability factor lower bound = " + str(stability_factor_lower_bound) + " < 0")
-                if ratio_lower_bound_to_upper_bound > 1. and not isclose(ratio_lower_bound_to_upper_bound, 1.):
-                    # if ratio_lower_bound_to_upper_bound >> 1
-                    print("SCM warning at mu = " + str(mu)
-                          + ": stability factor lower bound = " + str(stability_factor_lower_bound)
-                          + " > stability factor upper bound = " + str(stability_factor_upper_bound))
-                if ratio_lower_bound_to_exact > 1. and not isclose(ratio_lower_bound_to_exact, 1.):
-                    # if ratio_lower_bound_to_exact >> 1
-                    print("SCM warning at mu = " + str(mu)
-                          + ": stability factor lower bound = " + str(stability_factor_lower_bound)
-                          + " > exact stability factor =" + str(exact_stability_factor))
-
-                error_analysis_table["normalized_error", n, mu_index] = (
-                    exact_stability_factor - stability_factor_lower_bound) / stability_factor_upper_bound
+        with self.testing_set.distributed_io():
+            for (mu_index, mu) in self.testing_set.enumerate_local():
+                print(TextLine("SCM " + str(mu_index), fill="~"))
+
+                self.SCM_approximation.set_mu(mu)
+
+                (exact_stability_factor, _) = self.SCM_approximation.evaluate_stability_factor()
+                for n in N_generator():
+                    stability_factor_lower_bound = self.SCM_approximation.get_stability_factor_lower_bound(n)
+                    stability_factor_upper_bound = self.SCM_approximation.get_stability_factor_upper_bound(n)
+                    ratio_lower_bound_to_upper_bound = stability_factor_lower_bound / stability_factor_upper_bound
+                    ratio_lower_bound_to_exact = stability_factor_lower_bound / exact_stability_factor
+
+                    if ratio_lower_bound_to_upper_bound < 0. and not isclose(ratio_lower_bound_to_upper_bound, 0.):
+                        # if ratio_lower_bound_to_upper_bound << 0
+                        print("SCM warning at mu = " + str(mu)
+                              + ": stability factor lower bound = " + str(stability_factor_lower_bound) + " < 0")
+                    if ratio_lower_bound_to_upper_bound > 1. and not isclose(ratio_lower_bound_to_upper_bound, 1.):
+                        # if ratio_lower_bound_to_upper_bound >> 1
+                        print("SCM warning at mu = " + str(mu)
+                              + ": stability factor lower bound = " + str(stability_factor_lower_bound)
+                              + " > stability factor upper bound = " + str(stability_factor_upper_bound))
+                    if ratio_lower_bound_to_exact > 1. and not isclose(ratio_lower_bound_to_exact, 1.):
+                        # if ratio_lower_bound_to_exact >> 1
+                        print("SCM warning at mu = " + str(mu)
+                              + ": stability factor lower bound = " + str(stability_factor_lower_bound)
+                              + " > exact stability factor =" + str(exact_stability_factor))
+
+                    error_analysis_table["normalized_error", n, mu_index] = (
+                        exact_stability_factor - stability_factor_lower_bound) / stability_factor_upper_bound
+
+        # Merge results computed by each group of processes
+        error_analysis_table.merge_partial_tables()
 
         # Print
         print("")
@@ -304,27 +353,33 @@ class SCMApproximationReductionMethod(ReductionMethod):
         print("")
 
         speedup_analysis_table = SpeedupAnalysisTable(self.testing_set)
+        speedup_analysis_table.set_flush_location(
+            self.folder["speedup_analysis"], "speedup_analysis" if filename is None else filename)
         speedup_analysis_table.set_Nmax(N_generator_max())
         speedup_analysis_table.add_column("speedup", group_name="speedup", operations=("min", "mean", "max"))
 
-        exact_timer = Timer("parallel")
-        SCM_timer = Timer("serial")
+        exact_timer = Timer("parallel", self.testing_set.group_mpi_comm)
+        SCM_timer = Timer("serial", self.testing_set.group_mpi_comm)
 
-        for (mu_index, mu) in enumerate(self.testing_set):
-            print(TextLine("SCM " + str(mu_index), fill="~"))
+        with self.testing_set.distributed_io():
+            for (mu_index, mu) in self.testing_set.enumerate_local():
+                print(TextLine("SCM " + str(mu_index), fill="~"))
 
-            self.SCM_approximation.set_mu(mu)
+                self.SCM_approximation.set_mu(mu)
+
+                exact_timer.start()
+                self.SCM_approximation.evaluate_stability_factor()
+                elapsed_exact = exact_timer.stop()
 
-            exact_timer.start()
-            self.SCM_approximation.evaluate_stability_factor()
-            elapsed_exact = exact_timer.stop()
+                for n in N_generator():
+                    SCM_timer.start()
+                    self.SCM_approximation.get_stability_factor_lower_bound(n)
+                    self.SCM_approximation.get_stability_factor_upper_bound(n)
+                    elapsed_SCM = SCM_timer.stop()
+                    speedup_analysis_table["speedup", n, mu_index] = elapsed_exact / elapsed_SCM
 
-            for n in N_generator():
-                SCM_timer.start()
-                self.SCM_approximation.get_stability_factor_lower_bound(n)
-                self.SCM_approximation.get_stability_factor_upper_bound(n)
-                elapsed_SCM = SCM_timer.stop()
-                speedup_analysis_table["speedup", n, mu_index] = elapsed_exact / elapsed_SCM
+        # Merge results computed by each group of processes
+        speedup_analysis_table.merge_partial_tables()
 
         # Print
         print("")
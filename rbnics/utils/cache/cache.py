@@ -5,6 +5,7 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from collections.abc import MutableMapping
+from contextlib import contextmanager
 from functools import wraps
 from logging import DEBUG, getLogger
 
@@ -58,6 +59,25 @@ class Cache(object):
         """
         self._storage.clear()
 
+    @contextmanager
+    def bypass(self):
+        """
+        Bypass both RAM and disk storage within the context, i.e. keys are never found and are not exported
+        to disk. Keys set within the context are stored in RAM cache when leaving the context.
+        """
+        storage = self._storage
+        filename_generator = self._filename_generator
+        self._storage = BypassedStorage()
+        self._filename_generator = None
+        try:
+            yield
+        finally:
+            bypassed_storage = self._storage
+            self._storage = storage
+            self._filename_generator = filename_generator
+            for (storage_key, value) in bypassed_storage.items():
+                storage[storage_key] = value
+
     def __contains__(self, key):
         """
         Checks if key is in current RAM cache.
@@ -196,3 +216,11 @@ class DisabledStorage(MutableMapping):
 
     def __keytransform__(self, key):
         return key
+
+
+class BypassedStorage(dict):
+    def __getitem__(self, key):
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return False
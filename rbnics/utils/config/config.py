@@ -37,7 +37,9 @@ class Config(object):
         "SCM": {
             "cache": {"disk", "RAM"},
             "disk cache limit": "unlimited",
-            "RAM cache limit": "1"
+            "RAM cache limit": "1",
+            "warm start": True,
+            "warm start limit": "10"
         }
     }
 
@@ -4,6 +4,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from weakref import WeakKeyDictionary
 from rbnics.utils.test import PatchInstanceMethod
 
 
@@ -42,20 +43,22 @@ def sync_setters__internal(other_object__name__or__instance, method__name, priva
                         and all_synced_setters_for_method_other_object is not None):
                     _original_setters[method__name][self] = getattr(self, method__name)
                     all_synced_setters_for_method = all_synced_setters_for_method_other_object
-                    all_synced_setters_for_method.add(self)
+                    _add_to_synced_setters(all_synced_setters_for_method, self, method__name, private_attribute__name)
                     _synced_setters[method__name][self] = all_synced_setters_for_method
                 elif (all_synced_setters_for_method_self is not None
                         and all_synced_setters_for_method_other_object is None):
                     _original_setters[method__name][other_object] = getattr(other_object, method__name)
                     all_synced_setters_for_method = all_synced_setters_for_method_self
-                    all_synced_setters_for_method.add(other_object)
+                    _add_to_synced_setters(
+                        all_synced_setters_for_method, other_object, method__name, private_attribute__name)
                     _synced_setters[method__name][other_object] = all_synced_setters_for_method
                 else:
                     _original_setters[method__name][self] = getattr(self, method__name)
                     _original_setters[method__name][other_object] = getattr(other_object, method__name)
-                    all_synced_setters_for_method = set()
-                    all_synced_setters_for_method.add(self)
-                    all_synced_setters_for_method.add(other_object)
+                    all_synced_setters_for_method = _SyncedSetters()
+                    _add_to_synced_setters(all_synced_setters_for_method, self, method__name, private_attribute__name)
+                    _add_to_synced_setters(
+                        all_synced_setters_for_method, other_object, method__name, private_attribute__name)
                     _synced_setters[method__name][self] = all_synced_setters_for_method
                     _synced_setters[method__name][other_object] = all_synced_setters_for_method
                 # Now both storage and local variable should be consistent between self and other_object,
@@ -66,10 +69,19 @@ def sync_setters__internal(other_object__name__or__instance, method__name, priva
                 def overridden_method(self_, arg):
                     if method__name not in _synced_setters__disabled_methods:
                         all_synced_setters = _synced_setters[method__name][self_]
-                        for obj in all_synced_setters:
-                            setter = _original_setters[method__name][obj]
-                            if getattr(obj, private_attribute__name) is not arg:
-                                setter(arg)
+                        if method__name in _lazy_methods:
+                            # Only store the new value: objects will pull it the first time they access it,
+                            # except for self_ and for objects which require the setter to be called eagerly
+                            all_synced_setters.value = arg
+                            all_synced_setters.version += 1
+                            _pull_synced_value(self_, method__name, private_attribute__name)
+                            for obj in all_synced_setters.eager:
+                                _pull_synced_value(obj, method__name, private_attribute__name)
+                        else:
+                            for obj in all_synced_setters:
+                                setter = _original_setters[method__name][obj]
+                                if getattr(obj, private_attribute__name) is not arg:
+                                    setter(arg)
 
                 method__decorator__changed = False
                 if method__decorator is not None:
@@ -114,6 +126,108 @@ def sync_setters(other_object, method__name, private_attribute__name, method__de
         raise ValueError("Invalid method in sync_setters.")
 
 
+def sync_setters__eager(instance, method__name):
+    """
+    Require that the setter method__name of instance is called as soon as any synced setter is called, rather
+    than when the corresponding attribute is accessed. This is needed when the setter has side effects on
+    other objects, e.g. updating the parameters of expressions.
+    """
+    if method__name not in _synced_setters__eager:
+        _synced_setters__eager[method__name] = set()
+    _synced_setters__eager[method__name].add(instance)
+    if method__name in _synced_setters and instance in _synced_setters[method__name]:
+        _synced_setters[method__name][instance].eager.add(instance)
+        _pull_synced_value(instance, method__name, _lazy_methods[method__name])
+
+
+class _SyncedSetters(set):
+    """
+    Set of objects whose setters are kept in sync. For lazy methods, it also stores the latest value passed
+    to the setters, a version number which is increased each time a new value is set, and the version
+    which has been last pulled by each object.
+    """
+
+    def __init__(self):
+        set.__init__(self)
+        self.value = None
+        self.version = 0
+        self.versions = WeakKeyDictionary()  # from object to the version it has last pulled
+        self.eager = set()  # objects which do not pull the latest value lazily
+
+
+class _SyncedAttribute(object):
+    """
+    Descriptor which pulls the latest value set by any synced setter before returning the attribute value.
+    It is only installed on the classes of synced objects, see _install_synced_attribute.
+    """
+
+    def __init__(self, method__name, private_attribute__name):
+        self._method__name = method__name
+        self._private_attribute__name = private_attribute__name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        _pull_synced_value(instance, self._method__name, self._private_attribute__name)
+        try:
+            return instance.__dict__[self._private_attribute__name]
+        except KeyError:
+            raise AttributeError(self._private_attribute__name)
+
+    def __set__(self, instance, value):
+        instance.__dict__[self._private_attribute__name] = value
+
+    def __delete__(self, instance):
+        del instance.__dict__[self._private_attribute__name]
+
+
+def _add_to_synced_setters(all_synced_setters, instance, method__name, private_attribute__name):
+    all_synced_setters.add(instance)
+    if method__name in _lazy_methods:
+        if (
+            (method__name in _synced_setters__eager and instance in _synced_setters__eager[method__name])
+            or not _install_synced_attribute(instance, method__name, private_attribute__name)
+        ):
+            all_synced_setters.eager.add(instance)
+
+
+def _install_synced_attribute(instance, method__name, private_attribute__name):
+    # The descriptor is installed on a subclass of the class of instance, which then becomes the class of
+    # instance, so that attribute access on objects which are not synced is not affected.
+    # Return False if the attribute cannot be replaced by a descriptor, e.g. because the class
+    # already defines an attribute with the same name
+    cls = type(instance)
+    for base in cls.__mro__:
+        if private_attribute__name in vars(base):
+            return isinstance(vars(base)[private_attribute__name], _SyncedAttribute)
+    if not hasattr(instance, "__dict__") or "__slots__" in vars(cls):
+        return False
+    if (cls, private_attribute__name) not in _synced_classes:
+        _synced_classes[cls, private_attribute__name] = type(cls)(cls.__name__, (cls, ), {
+            private_attribute__name: _SyncedAttribute(method__name, private_attribute__name),
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__
+        })
+    instance.__class__ = _synced_classes[cls, private_attribute__name]
+    return True
+
+
+def _pull_synced_value(instance, method__name, private_attribute__name):
+    all_synced_setters = _synced_setters[method__name][instance]
+    if all_synced_setters.version > 0 and all_synced_setters.versions.get(instance) != all_synced_setters.version:
+        all_synced_setters.versions[instance] = all_synced_setters.version
+        if instance.__dict__.get(private_attribute__name) is not all_synced_setters.value:
+            # Calls to synced setters from the original setter must not be propagated, since the latest
+            # value has been already set by the caller
+            already_disabled = method__name in _synced_setters__disabled_methods
+            _synced_setters__disabled_methods.add(method__name)
+            try:
+                _original_setters[method__name][instance](all_synced_setters.value)
+            finally:
+                if not already_disabled:
+                    _synced_setters__disabled_methods.remove(method__name)
+
+
 def set_mu_range__decorator(set_mu_range__method):
 
     def set_mu_range__decorated(self_, mu_range):
@@ -138,3 +252,9 @@ _original_setters = dict()
 _synced_setters = dict()
 _synced_setters__decorators = dict()
 _synced_setters__disabled_methods = set()
+_synced_setters__eager = dict()
+# Subclasses of the classes of synced objects on which the descriptors of lazy attributes are installed
+_synced_classes = dict()  # from (class, private attribute name) to subclass
+# Setters which are called very frequently (e.g. in greedy loops or time stepping), and which only store
+# their argument, are propagated lazily: synced objects pull the latest value when they access it
+_lazy_methods = {"set_mu": "mu", "set_time": "t"}  # from method name to private attribute name
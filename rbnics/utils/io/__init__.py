@@ -19,7 +19,7 @@ from rbnics.utils.io.speedup_analysis_table import SpeedupAnalysisTable
 from rbnics.utils.io.text_box import TextBox
 from rbnics.utils.io.text_io import TextIO
 from rbnics.utils.io.text_line import TextLine
-from rbnics.utils.io.timer import Timer
+from rbnics.utils.io.timer import PhaseTimer, Timer
 
 __all__ = [
     "ComponentNameToBasisComponentIndexDict",
@@ -32,6 +32,7 @@ __all__ = [
     "NumpyIO",
     "OnlineSizeDict",
     "PerformanceTable",
+    "PhaseTimer",
     "PickleIO",
     "SpeedupAnalysisTable",
     "TextBox",
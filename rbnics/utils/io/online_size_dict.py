@@ -46,6 +46,7 @@ class OnlineSizeDict(OrderedDict):
                 elif isinstance(N, OnlineSizeDict):
                     # check that components are the same, and are ordered correctly
                     assert list(N.keys()) == list(default.keys())
+                    N = OnlineSizeDict(N)  # copy the dict, since it may be incremented by the caller
                 else:
                     raise TypeError("Invalid N")
         else:
@@ -7,7 +7,7 @@
 import os
 import sys
 import collections
-from numpy import exp, isnan, log, max, mean, min, nan, zeros as Content
+from numpy import errstate, exp, int8, isnan, log, max, maximum, minimum, nan, where, zeros as Content
 from rbnics.utils.io.csv_io import CSVIO
 from rbnics.utils.io.folders import Folders
 
@@ -17,17 +17,33 @@ class PerformanceTable(object):
     # Storage for class methods
     _suppressed_groups = list()
     _preprocessor_setitem = dict()
+    _streaming = False
+    _flush_every = None
 
     def __init__(self, testing_set):
-        self._columns = dict()  # string to Content matrix
+        self._columns = list()  # of strings, fields of self._content
         self._columns_operations = dict()  # string to tuple
         self._columns_not_implemented = dict()  # string to bool
-        self._rows_not_implemented = dict()  # string to dict of bool
+        self._rows_not_implemented = dict()  # string to int8 array, see _NOT_IMPLEMENTED_* flags
         self._groups = dict()  # string to list
         self._group_names_sorted = list()
         self._len_testing_set = len(testing_set)
+        self._mpi_comm = testing_set.mpi_comm
+        self._distributed = testing_set.group_mpi_comm is not None
+        self._is_group_root = testing_set.is_group_root()
         self._Nmin = 1
         self._Nmax = 0
+        # Values are stored in a structured array with a field for each column, allocated when the first
+        # value is set. Streaming tables only store the values for the current parameter, and keep
+        # the statistics over the previous parameters in self._statistics
+        self._content = None
+        self._streaming = type(self)._streaming
+        self._current_mu_index = None
+        self._current_mu_pending = False  # whether values for the current parameter have not been processed yet
+        self._number_of_processed_mu = 0
+        self._statistics = None
+        self._flush_directory = None
+        self._flush_filename = None
 
     def set_Nmin(self, Nmin):
         self._Nmin = Nmin
@@ -39,10 +55,11 @@ class PerformanceTable(object):
         assert self._Nmax > 0
         assert self._Nmax >= self._Nmin
         assert column_name not in self._columns and column_name not in self._columns_operations
-        self._columns[column_name] = Content((self._Nmax - self._Nmin + 1, self._len_testing_set))
+        assert self._content is None, "Columns must be added before setting any value"
+        self._columns.append(column_name)
         self._columns_not_implemented[column_name] = None  # will be set to a bool
-        self._rows_not_implemented[column_name] = {
-            n: None for n in range(self._Nmax - self._Nmin + 1)}  # will be set to a bool
+        self._rows_not_implemented[column_name] = Content(
+            (self._Nmax - self._Nmin + 1, ), dtype=int8) + _NOT_IMPLEMENTED_UNSET
         if group_name not in self._groups:
             self._groups[group_name] = list()
             self._group_names_sorted.append(group_name)  # preserve the ordering provided by the user
@@ -54,6 +71,14 @@ class PerformanceTable(object):
         else:
             raise ValueError("Invalid operation in PerformanceTable")
 
+    def set_flush_location(self, directory, filename):
+        """
+        Set the location where partial statistics are saved while the table is being filled in,
+        if streaming has been enabled with a flush frequency.
+        """
+        self._flush_directory = directory
+        self._flush_filename = filename
+
     @classmethod
     def suppress_group(cls, group_name):
         cls._suppressed_groups.append(group_name)
@@ -70,44 +95,155 @@ class PerformanceTable(object):
     def clear_setitem_preprocessing(cls):
         cls._preprocessor_setitem.clear()
 
+    @classmethod
+    def enable_streaming(cls, flush_every=None):
+        """
+        Only store the values for the current parameter in tables created from now on, and update statistics
+        over the testing set as soon as a new parameter is processed, so that memory usage does not depend
+        on the size of the testing set. Values for previous parameters cannot be accessed anymore.
+        If flush_every is provided, partial statistics are also saved every flush_every parameters,
+        provided that the enumeration of the testing set has not been distributed.
+        """
+        cls._streaming = True
+        cls._flush_every = flush_every
+
+    @classmethod
+    def disable_streaming(cls):
+        cls._streaming = False
+        cls._flush_every = None
+
     def __getitem__(self, args):
         assert len(args) == 3
         column_name = args[0]
         N = args[1]
         mu_index = args[2]
         assert self._columns_not_implemented[column_name] in (True, False)
-        assert self._rows_not_implemented[column_name][N - self._Nmin] in (True, False)
-        if (not self._columns_not_implemented[column_name]
-                and not self._rows_not_implemented[column_name][N - self._Nmin]):
-            return self._columns[column_name][N - self._Nmin, mu_index]
+        rows_not_implemented = self._rows_not_implemented[column_name][_row_indices(N, self._Nmin)]
+        assert (rows_not_implemented != _NOT_IMPLEMENTED_UNSET).all()
+        if not self._columns_not_implemented[column_name] and (rows_not_implemented == _NOT_IMPLEMENTED_FALSE).all():
+            content_index = self._content_index(mu_index)
+            return self._content[column_name][_row_indices(N, self._Nmin), content_index]
         else:
             return CustomNotImplementedAfterDiv
 
     def __setitem__(self, args, value):
+        """
+        Set the value of a column for a given parameter index, and either a single reduced dimension N or a
+        sequence (or slice) of them. In the latter case, value must be either an array of the same length
+        or NotImplemented.
+        """
         assert len(args) == 3
         column_name = args[0]
         N = args[1]
         mu_index = args[2]
+        rows = _row_indices(N, self._Nmin)
+        rows_not_implemented = self._rows_not_implemented[column_name]
         if is_not_implemented(value):
             assert self._columns_not_implemented[column_name] in (None, True, False)
             if self._columns_not_implemented[column_name] is None:
                 self._columns_not_implemented[column_name] = True
-            assert self._rows_not_implemented[column_name][N - self._Nmin] in (None, True)
-            if self._rows_not_implemented[column_name][N - self._Nmin] is None:
-                self._rows_not_implemented[column_name][N - self._Nmin] = True
+            assert (rows_not_implemented[rows] != _NOT_IMPLEMENTED_FALSE).all()
+            rows_not_implemented[rows] = _NOT_IMPLEMENTED_TRUE
         else:
             assert self._columns_not_implemented[column_name] in (None, True, False)
             if self._columns_not_implemented[column_name] in (None, True):
                 self._columns_not_implemented[column_name] = False
-            assert self._rows_not_implemented[column_name][N - self._Nmin] in (None, False)
-            if self._rows_not_implemented[column_name][N - self._Nmin] is None:
-                self._rows_not_implemented[column_name][N - self._Nmin] = False
-            if column_name not in self._preprocessor_setitem:
-                self._columns[column_name][N - self._Nmin, mu_index] = value
+            assert (rows_not_implemented[rows] != _NOT_IMPLEMENTED_TRUE).all()
+            rows_not_implemented[rows] = _NOT_IMPLEMENTED_FALSE
+            if column_name in self._preprocessor_setitem:
+                if isinstance(rows, int):
+                    value = self._preprocessor_setitem[column_name](value)
+                else:
+                    value = [self._preprocessor_setitem[column_name](v) for v in value]
+            content_index = self._content_index(mu_index)
+            self._content[column_name][rows, content_index] = value
+
+    def _content_index(self, mu_index):
+        if self._content is None:
+            self._content = Content(
+                (self._Nmax - self._Nmin + 1, 1 if self._streaming else self._len_testing_set),
+                dtype=[(column_name, float) for column_name in self._columns])
+        if not self._streaming:
+            return mu_index
+        else:
+            if mu_index != self._current_mu_index:
+                if self._current_mu_index is not None and mu_index < self._current_mu_index:
+                    raise ValueError("Values of previous parameters cannot be accessed in streaming mode")
+                self._update_statistics()
+                if self._flush_every is not None and self._number_of_processed_mu % self._flush_every == 0:
+                    self._flush()
+                self._current_mu_index = mu_index
+                self._current_mu_pending = True
+            return 0
+
+    def _update_statistics(self):
+        # Update statistics with the values of the current parameter, which are then reset
+        if not self._current_mu_pending:
+            return
+        for column_name in self._columns:
+            column_statistics = _statistics_from_content(self._content[column_name])
+            if self._statistics is None:
+                self._statistics = dict()
+            if column_name not in self._statistics:
+                self._statistics[column_name] = column_statistics
+            else:
+                self._statistics[column_name] = _merge_statistics(
+                    [self._statistics[column_name], column_statistics])
+        self._content.fill(0.)
+        self._current_mu_pending = False
+        self._number_of_processed_mu += 1
+
+    def _flush(self):
+        if self._flush_directory is not None and not self._distributed and self._number_of_processed_mu > 0:
+            self.save(self._flush_directory, self._flush_filename)
+
+    def _get_statistics(self):
+        if self._content is None:
+            return None
+        elif self._streaming:
+            self._update_statistics()
+            return self._statistics
+        else:
+            return {column_name: _statistics_from_content(self._content[column_name])
+                    for column_name in self._columns}
+
+    # Merge the partial tables filled in by each group of processes when the enumeration of the testing set
+    # has been distributed. Must be called collectively, after the loop over the testing set
+    def merge_partial_tables(self):
+        if not self._distributed:
+            return
+        # Only one process per group contributes, since all processes in a group store the same values
+        if self._is_group_root:
+            if self._streaming:
+                partial_content = self._get_statistics()
             else:
-                self._columns[column_name][N - self._Nmin, mu_index] = self._preprocessor_setitem[column_name](value)
+                partial_content = self._content
+            partial_table = (partial_content, self._columns_not_implemented, self._rows_not_implemented)
+        else:
+            partial_table = None
+        partial_tables = [t for t in self._mpi_comm.allgather(partial_table) if t is not None]
+        partial_contents = [t[0] for t in partial_tables if t[0] is not None]
+        if len(partial_contents) > 0:
+            if self._streaming:
+                # Statistics of each group are combined
+                self._statistics = {
+                    column_name: _merge_statistics([c[column_name] for c in partial_contents])
+                    for column_name in self._columns}
+                self._content = Content(
+                    (self._Nmax - self._Nmin + 1, 1), dtype=[(column_name, float) for column_name in self._columns])
+            else:
+                # Each entry has been set by a single group, and it is zero on all other ones
+                self._content = partial_contents[0].copy()
+                for column_name in self._columns:
+                    self._content[column_name] = sum(c[column_name] for c in partial_contents)
+        for column_name in self._columns:
+            self._columns_not_implemented[column_name] = _merge_not_implemented(
+                [t[1][column_name] for t in partial_tables])
+            self._rows_not_implemented[column_name] = _merge_rows_not_implemented(
+                [t[2][column_name] for t in partial_tables])
 
     def _process(self):
+        statistics = self._get_statistics()
         groups_content = collections.OrderedDict()
         for group in self._group_names_sorted:
             # Skip suppresed groups
@@ -116,7 +252,7 @@ class PerformanceTable(object):
             # Populate all columns
             columns = list()
             for column in self._groups[group]:
-                assert self._columns_not_implemented[column] in (True, False)
+                assert self._columns_not_implemented[column] in (True, False) or self._streaming
                 if self._columns_not_implemented[column] is False:
                     columns.append(column)
             if len(columns) == 0:
@@ -133,6 +269,7 @@ class PerformanceTable(object):
             column_size["N"] = max([max([len(str(x)) for x in table_content["N"]]), len("N")])
             # Then fill in with postprocessed data
             for column in columns:
+                rows_implemented = self._rows_not_implemented[column] == _NOT_IMPLEMENTED_FALSE
                 for operation in self._columns_operations[column]:
                     # Set header
                     if operation in ("min", "max"):
@@ -145,27 +282,18 @@ class PerformanceTable(object):
                         raise ValueError("Invalid operation in PerformanceTable")
                     table_index.append(current_table_index)
                     table_header[current_table_index] = current_table_header
-                    # Compute the required operation of each column over the second index (testing set)
-                    table_content[current_table_index] = Content((self._Nmax - self._Nmin + 1,))
-                    for n in range(self._Nmin, self._Nmax + 1):
-                        assert self._rows_not_implemented[column][n - self._Nmin] in (None, True, False)
-                        if self._rows_not_implemented[column][n - self._Nmin] is False:
-                            if operation == "min":
-                                current_table_content = min(self._columns[column][n - self._Nmin, :])
-                            elif operation == "mean":
-                                data = self._columns[column][n - self._Nmin, :]
-                                if not data.any():  # all zeros
-                                    current_table_content = 0.
-                                else:
-                                    data[data == 0.] = sys.float_info.epsilon
-                                    current_table_content = exp(mean(log(data)))
-                            elif operation == "max":
-                                current_table_content = max(self._columns[column][n - self._Nmin, :])
-                            else:
-                                raise ValueError("Invalid operation in PerformanceTable")
-                            table_content[current_table_index][n - self._Nmin] = current_table_content
-                        else:
-                            table_content[current_table_index][n - self._Nmin] = nan
+                    # Get the required operation of each column over the testing set from the statistics
+                    if operation == "min":
+                        current_table_content = statistics[column]["min"].copy()
+                    elif operation == "mean":
+                        current_table_content = where(
+                            statistics[column]["all_zeros"], 0., exp(statistics[column]["mean_log"]))
+                    elif operation == "max":
+                        current_table_content = statistics[column]["max"].copy()
+                    else:
+                        raise ValueError("Invalid operation in PerformanceTable")
+                    current_table_content[~rows_implemented] = nan
+                    table_content[current_table_index] = current_table_content
                     # Get the width of the columns
                     column_size[current_table_index] = max([max([
                         len(str(x)) for x in table_content[current_table_index]]), len(current_table_header)])
@@ -228,6 +356,78 @@ class PerformanceTable(object):
         raise RuntimeError("PerformanceTable.load has not been implemented yet")
 
 
+def _merge_not_implemented(flags):
+    # Groups which had no parameters to process leave the flag unset
+    if False in flags:
+        return False
+    elif True in flags:
+        return True
+    else:
+        return None
+
+
+# Flags for rows of each column, i.e. for each reduced dimension N
+_NOT_IMPLEMENTED_UNSET = -1
+_NOT_IMPLEMENTED_FALSE = 0
+_NOT_IMPLEMENTED_TRUE = 1
+
+
+def _merge_rows_not_implemented(flags):
+    # Groups which had no parameters to process leave the flag unset
+    merged_flags = Content(flags[0].shape, dtype=int8) + _NOT_IMPLEMENTED_UNSET
+    for flags_ in flags:
+        merged_flags[(flags_ == _NOT_IMPLEMENTED_TRUE) & (merged_flags == _NOT_IMPLEMENTED_UNSET)] = (
+            _NOT_IMPLEMENTED_TRUE)
+    for flags_ in flags:
+        merged_flags[flags_ == _NOT_IMPLEMENTED_FALSE] = _NOT_IMPLEMENTED_FALSE
+    return merged_flags
+
+
+def _row_indices(N, Nmin):
+    if isinstance(N, int):
+        return N - Nmin
+    elif isinstance(N, slice):
+        assert N.step is None or N.step > 0
+        return slice(
+            N.start - Nmin if N.start is not None else None, N.stop - Nmin if N.stop is not None else None, N.step)
+    else:
+        return [n - Nmin for n in N]
+
+
+# Statistics over the testing set are stored, for each column, as a structured array with an entry for each
+# reduced dimension N. The geometric mean is computed from the running mean of the logarithm of the values,
+# after replacing zeros by machine epsilon
+_statistics_dtype = [("count", int), ("min", float), ("max", float), ("mean_log", float), ("all_zeros", bool)]
+
+
+def _statistics_from_content(content):
+    # content is a 2D array, with rows associated to N and columns to the parameters in the testing set
+    statistics = Content((content.shape[0], ), dtype=_statistics_dtype)
+    statistics["count"] = content.shape[1]
+    statistics["min"] = content.min(axis=1)
+    statistics["max"] = content.max(axis=1)
+    with errstate(divide="ignore", invalid="ignore"):
+        statistics["mean_log"] = log(where(content == 0., sys.float_info.epsilon, content)).mean(axis=1)
+    statistics["all_zeros"] = ~content.any(axis=1)
+    return statistics
+
+
+def _merge_statistics(statistics):
+    # Combine the statistics of disjoint subsets of the testing set, updating the running mean
+    # as in Welford's algorithm
+    merged_statistics = statistics[0].copy()
+    for statistics_ in statistics[1:]:
+        count = merged_statistics["count"] + statistics_["count"]
+        with errstate(invalid="ignore"):
+            merged_statistics["mean_log"] += (
+                (statistics_["mean_log"] - merged_statistics["mean_log"]) * statistics_["count"] / count)
+        merged_statistics["count"] = count
+        merged_statistics["min"] = minimum(merged_statistics["min"], statistics_["min"])
+        merged_statistics["max"] = maximum(merged_statistics["max"], statistics_["max"])
+        merged_statistics["all_zeros"] &= statistics_["all_zeros"]
+    return merged_statistics
+
+
 class CustomNotImplementedType(object):
     def __init__(self):
         pass
@@ -4,17 +4,20 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from statistics import median
 from timeit import default_timer as python_timer
 from mpi4py import MPI
 from mpi4py.MPI import MAX, SUM
 
 
 class Timer(object):
-    def __init__(self, mode):
+    def __init__(self, mode, mpi_comm=None):
         assert mode in ("serial", "parallel")
         self._mode = mode
         self._start = None
-        self._comm = MPI.COMM_WORLD
+        if mpi_comm is None:
+            mpi_comm = MPI.COMM_WORLD
+        self._comm = mpi_comm
 
     def start(self):
         self._start = python_timer()
@@ -22,9 +25,79 @@ class Timer(object):
     def stop(self):
         elapsed = python_timer() - self._start
         self._start = None
+        return self._reduce(elapsed)
+
+    def repeat(self, function, warm_up=0, repeats=1, statistic="min", setup=None):
+        """
+        Call function warm_up times without timing it, and then time repeats calls to it. If provided, setup is
+        called before each call, and its cost is not timed. Return the output of the last call and the
+        requested statistic ("min" or "median") of the elapsed times.
+        """
+        assert warm_up >= 0
+        assert repeats > 0
+        for _ in range(warm_up):
+            if setup is not None:
+                setup()
+            function()
+        elapsed = list()
+        for _ in range(repeats):
+            if setup is not None:
+                setup()
+            self.start()
+            output = function()
+            elapsed.append(self.stop())
+        return (output, Timer.statistic(elapsed, statistic))
+
+    @staticmethod
+    def statistic(elapsed, statistic):
+        if statistic == "min":
+            return min(elapsed)
+        elif statistic == "median":
+            return median(elapsed)
+        else:
+            raise ValueError("Invalid statistic for timer")
+
+    def _reduce(self, elapsed):
         if self._mode == "serial":
             return self._comm.allreduce(elapsed, op=MAX)
         elif self._mode == "parallel":
             return self._comm.allreduce(elapsed, op=SUM)
         else:
             raise ValueError("Invalid mode for timer")
+
+
+class PhaseTimer(Timer):
+    """
+    Timer which, besides the total elapsed time between start and stop, also accumulates the time spent in
+    each phase, i.e. in each call to a function wrapped by wrap. Phases may be nested: the time spent in an
+    inner phase is only charged to the inner phase, and not to the outer one.
+    """
+
+    def __init__(self, mode, mpi_comm=None):
+        Timer.__init__(self, mode, mpi_comm)
+        self._phases_elapsed = dict()
+        self._phases_stack = list()  # of [phase, start, time spent in nested phases]
+
+    def start(self):
+        self._phases_elapsed = dict()
+        self._phases_stack = list()
+        Timer.start(self)
+
+    def wrap(self, phase, function):
+        def wrapped_function(*args, **kwargs):
+            self._phases_stack.append([phase, python_timer(), 0.])
+            try:
+                return function(*args, **kwargs)
+            finally:
+                (phase_, start, nested_elapsed) = self._phases_stack.pop()
+                elapsed = python_timer() - start
+                self._phases_elapsed[phase_] = self._phases_elapsed.get(phase_, 0.) + elapsed - nested_elapsed
+                if len(self._phases_stack) > 0:
+                    self._phases_stack[-1][2] += elapsed
+        return wrapped_function
+
+    def phase_elapsed(self, phase):
+        """
+        Return the time spent in phase since the latest call to start.
+        """
+        return self._reduce(self._phases_elapsed.get(phase, 0.))
@@ -5,12 +5,25 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 import sys
+from contextlib import contextmanager
 from mpi4py.MPI import COMM_WORLD
 
+# Stack of communicators to be used when parallel_io is called without an explicit communicator
+_default_mpi_comms = [COMM_WORLD]
+
+
+@contextmanager
+def parallel_io_default_mpi_comm(mpi_comm):
+    _default_mpi_comms.append(mpi_comm)
+    try:
+        yield
+    finally:
+        _default_mpi_comms.pop()
+
 
 def parallel_io(lambda_function, mpi_comm=None):
     if mpi_comm is None:
-        mpi_comm = COMM_WORLD
+        mpi_comm = _default_mpi_comms[-1]
     return_value = None
     error_raised = False
     error_type = None
@@ -0,0 +1,112 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import allclose, asarray
+from dolfin import *
+from rbnics import *
+
+
+class ThermalBlock(EllipticCoerciveProblem):
+
+    # Default initialization of members
+    def __init__(self, V, **kwargs):
+        # Call the standard initialization
+        EllipticCoerciveProblem.__init__(self, V, **kwargs)
+        # ... and also store FEniCS data structures for assembly
+        assert "subdomains" in kwargs
+        assert "boundaries" in kwargs
+        self.subdomains, self.boundaries = kwargs["subdomains"], kwargs["boundaries"]
+        self.u = TrialFunction(V)
+        self.v = TestFunction(V)
+        self.dx = Measure("dx")(subdomain_data=self.subdomains)
+        self.ds = Measure("ds")(subdomain_data=self.boundaries)
+
+    # Return custom problem name
+    def name(self):
+        return "ThermalBlockLinearFreeze"
+
+    # Return the alpha_lower bound.
+    def get_stability_factor_lower_bound(self):
+        return min(self.compute_theta("a"))
+
+    # Return theta multiplicative terms of the affine expansion of the problem.
+    def compute_theta(self, term):
+        mu = self.mu
+        if term == "a":
+            theta_a0 = mu[0]
+            theta_a1 = 1.
+            return (theta_a0, theta_a1)
+        elif term == "f":
+            theta_f0 = mu[1]
+            return (theta_f0,)
+        elif term == "dirichlet_bc":
+            theta_bc0 = mu[2]
+            return (theta_bc0,)
+        else:
+            raise ValueError("Invalid term for compute_theta().")
+
+    # Return forms resulting from the discretization of the affine expansion of the problem operators.
+    def assemble_operator(self, term):
+        v = self.v
+        dx = self.dx
+        if term == "a":
+            u = self.u
+            a0 = inner(grad(u), grad(v)) * dx(1)
+            a1 = inner(grad(u), grad(v)) * dx(2)
+            return (a0, a1)
+        elif term == "f":
+            ds = self.ds
+            f0 = v * ds(1)
+            return (f0,)
+        elif term == "dirichlet_bc":
+            bc0 = [DirichletBC(self.V, Constant(1.0), self.boundaries, 3)]
+            return (bc0,)
+        elif term == "inner_product":
+            u = self.u
+            x0 = inner(grad(u), grad(v)) * dx
+            return (x0,)
+        else:
+            raise ValueError("Invalid term for assemble_operator().")
+
+
+# 1. Read the mesh for this problem
+mesh = Mesh("data/thermal_block.xml")
+subdomains = MeshFunction("size_t", mesh, "data/thermal_block_physical_region.xml")
+boundaries = MeshFunction("size_t", mesh, "data/thermal_block_facet_region.xml")
+
+# 2. Create Finite Element space (Lagrange P1)
+V = FunctionSpace(mesh, "Lagrange", 1)
+
+# 3. Allocate an object of the ThermalBlock class, with a nonhomogeneous Dirichlet boundary condition
+problem = ThermalBlock(V, subdomains=subdomains, boundaries=boundaries)
+mu_range = [(0.1, 10.0), (-1.0, 1.0), (-1.0, 1.0)]
+problem.set_mu_range(mu_range)
+
+# 4. Prepare reduction with a POD-Galerkin method
+reduction_method = PODGalerkin(problem)
+reduction_method.set_Nmax(6)
+
+# 5. Perform the offline phase
+reduction_method.initialize_training_set(50)
+reduced_problem = reduction_method.offline()
+
+# 6. Compare online solves by plans to the ones by the reduced problem, for several dimensions and parameters
+current_mu = (1.0, 0.5, 0.5)
+reduced_problem.set_mu(current_mu)
+for N in (None, 3):
+    plan = reduced_problem.freeze(N)
+    for mu in [(8.0, -1.0, 1.0), (0.1, 1.0, -1.0), (2.5, 0.2, 0.7)]:
+        plan_solution = plan.solve(mu)
+        # Plans do not change the parameter of the reduced problem
+        assert reduced_problem.mu == current_mu
+        reduced_problem.set_mu(mu)
+        solution = reduced_problem.solve(N)
+        assert allclose(asarray(plan_solution.vector()), asarray(solution.vector()), rtol=1e-10, atol=1e-12)
+        # Plans solve for the current parameter when no parameter is provided
+        assert allclose(asarray(plan.solve().vector()), asarray(solution.vector()), rtol=1e-10, atol=1e-12)
+        reduced_problem.set_mu(current_mu)
+    # Thetas are restored after the plan has been assembled
+    assert tuple(reduced_problem.compute_theta("a")) == (current_mu[0], 1.)
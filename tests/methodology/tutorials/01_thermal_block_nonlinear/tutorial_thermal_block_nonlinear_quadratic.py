@@ -0,0 +1,138 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import allclose, asarray
+from dolfin import *
+from rbnics import *
+
+
+@ExactParametrizedFunctions()
+class ThermalBlock(NonlinearEllipticProblem):
+
+    # Default initialization of members
+    def __init__(self, V, **kwargs):
+        # Call the standard initialization
+        NonlinearEllipticProblem.__init__(self, V, **kwargs)
+        # ... and also store FEniCS data structures for assembly
+        assert "subdomains" in kwargs
+        assert "boundaries" in kwargs
+        self.subdomains, self.boundaries = kwargs["subdomains"], kwargs["boundaries"]
+        self.u = TrialFunction(V)
+        self.v = TestFunction(V)
+        self.dx = Measure("dx")(subdomain_data=self.subdomains)
+        self.ds = Measure("ds")(subdomain_data=self.boundaries)
+        self._nonlinear_solver_parameters.update({
+            "linear_solver": "mumps",
+            "maximum_iterations": 20,
+            "report": True
+        })
+
+    # Return custom problem name
+    def name(self):
+        return "ThermalBlockNonlinearQuadratic"
+
+    # Return theta multiplicative terms of the affine expansion of the problem.
+    def compute_theta(self, term):
+        mu = self.mu
+        if term == "a":
+            theta_a0 = mu[0]
+            theta_a1 = 1.
+            return (theta_a0, theta_a1)
+        elif term in ("c", "dc"):
+            theta_c0 = 1.
+            return (theta_c0,)
+        elif term == "f":
+            theta_f0 = mu[1]
+            return (theta_f0,)
+        else:
+            raise ValueError("Invalid term for compute_theta().")
+
+    # Return forms resulting from the discretization of the affine expansion of the problem operators.
+    def assemble_operator(self, term):
+        v = self.v
+        dx = self.dx
+        if term == "a":
+            u = self.u
+            a0 = inner(grad(u), grad(v)) * dx(1)
+            a1 = inner(grad(u), grad(v)) * dx(2)
+            return (a0, a1)
+        elif term == "c":
+            u = self._solution
+            c0 = u * u * v * dx
+            return (c0,)
+        elif term == "dc":
+            u = self._solution
+            du = self.u
+            dc0 = 2 * u * du * v * dx
+            return (dc0,)
+        elif term == "f":
+            ds = self.ds
+            f0 = v * ds(1)
+            return (f0,)
+        elif term == "dirichlet_bc":
+            bc0 = [DirichletBC(self.V, Constant(0.0), self.boundaries, 3)]
+            return (bc0,)
+        elif term == "inner_product":
+            u = self.u
+            x0 = inner(grad(u), grad(v)) * dx
+            return (x0,)
+        else:
+            raise ValueError("Invalid term for assemble_operator().")
+
+
+# Customize the resulting reduced problem, so that the quadratic term is evaluated by the precomputed reduced tensor
+@CustomizeReducedProblemFor(NonlinearEllipticProblem)
+def CustomizeReducedNonlinearElliptic(ReducedNonlinearElliptic_Base):
+    class ReducedNonlinearElliptic(ReducedNonlinearElliptic_Base):
+        def __init__(self, truth_problem, **kwargs):
+            ReducedNonlinearElliptic_Base.__init__(self, truth_problem, **kwargs)
+            self._nonlinear_solver_parameters.update({
+                "report": True
+            })
+            self.quadratic_terms = ["c"]
+
+    return ReducedNonlinearElliptic
+
+
+# 1. Read the mesh for this problem
+mesh = Mesh("data/thermal_block.xml")
+subdomains = MeshFunction("size_t", mesh, "data/thermal_block_physical_region.xml")
+boundaries = MeshFunction("size_t", mesh, "data/thermal_block_facet_region.xml")
+
+# 2. Create Finite Element space (Lagrange P1)
+V = FunctionSpace(mesh, "Lagrange", 1)
+
+# 3. Allocate an object of the ThermalBlock class
+problem = ThermalBlock(V, subdomains=subdomains, boundaries=boundaries)
+mu_range = [(0.1, 10.0), (-1.0, 1.0)]
+problem.set_mu_range(mu_range)
+
+# 4. Prepare reduction with a POD-Galerkin method
+reduction_method = PODGalerkin(problem)
+reduction_method.set_Nmax(4)
+
+# 5. Perform the offline phase
+reduction_method.initialize_training_set(20)
+reduced_problem = reduction_method.offline()
+
+# 6. Perform an online solve by contraction of the precomputed reduced tensor
+online_mu = (8.0, -1.0)
+reduced_problem.set_mu(online_mu)
+quadratic_solution = asarray(reduced_problem.solve().vector()).copy()
+
+# 7. Perform the same online solve by assembly of the quadratic term and of its derivative
+reduced_problem.quadratic_terms = list()
+reduced_problem._solve(reduced_problem.N)
+assembled_solution = asarray(reduced_problem._solution.vector()).copy()
+assert allclose(quadratic_solution, assembled_solution, rtol=1e-8, atol=1e-12)
+
+# 8. Compare residuals evaluated at the same reduced solution
+assembled_residual = asarray(
+    reduced_problem.ProblemSolver(reduced_problem, reduced_problem.N).residual_eval(reduced_problem._solution))
+reduced_problem.quadratic_terms = ["c"]
+quadratic_residual = asarray(
+    reduced_problem.ProblemSolver(reduced_problem, reduced_problem.N).residual_eval(reduced_problem._solution))
+assert allclose(quadratic_residual, assembled_residual, rtol=1e-8, atol=1e-12)
@@ -0,0 +1,115 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import allclose
+from numpy.random import default_rng
+from dolfin import *
+from rbnics import *
+from rbnics.utils.test import PatchInstanceMethod
+
+
+@EIM()
+class Gaussian(EllipticCoerciveProblem):
+
+    # Default initialization of members
+    def __init__(self, V, **kwargs):
+        # Call the standard initialization
+        EllipticCoerciveProblem.__init__(self, V, **kwargs)
+        # ... and also store FEniCS data structures for assembly
+        assert "subdomains" in kwargs
+        assert "boundaries" in kwargs
+        self.subdomains, self.boundaries = kwargs["subdomains"], kwargs["boundaries"]
+        self.u = TrialFunction(V)
+        self.v = TestFunction(V)
+        self.dx = Measure("dx")(subdomain_data=subdomains)
+        self.f = ParametrizedExpression(
+            self, "exp( - 2*pow(x[0]-mu[0], 2) - 2*pow(x[1]-mu[1], 2) )", mu=(0., 0.), element=V.ufl_element())
+        # note that we cannot use self.mu in the initialization of self.f, because self.mu has not been initialized yet
+
+    # Return custom problem name
+    def name(self):
+        return "GaussianEIMInterpolatedThetas"
+
+    # Return the alpha_lower bound.
+    def get_stability_factor_lower_bound(self):
+        return 1.
+
+    # Return theta multiplicative terms of the affine expansion of the problem.
+    def compute_theta(self, term):
+        if term == "a":
+            return (1., )
+        elif term == "f":
+            return (1., )
+        else:
+            raise ValueError("Invalid term for compute_theta().")
+
+    # Return forms resulting from the discretization of the affine expansion of the problem operators.
+    def assemble_operator(self, term):
+        v = self.v
+        dx = self.dx
+        if term == "a":
+            u = self.u
+            a0 = inner(grad(u), grad(v)) * dx
+            return (a0,)
+        elif term == "f":
+            f = self.f
+            f0 = f * v * dx
+            return (f0,)
+        elif term == "dirichlet_bc":
+            bc0 = [DirichletBC(self.V, Constant(0.0), self.boundaries, 1),
+                   DirichletBC(self.V, Constant(0.0), self.boundaries, 2),
+                   DirichletBC(self.V, Constant(0.0), self.boundaries, 3)]
+            return (bc0,)
+        elif term == "inner_product":
+            u = self.u
+            x0 = inner(grad(u), grad(v)) * dx
+            return (x0,)
+        else:
+            raise ValueError("Invalid term for assemble_operator().")
+
+
+# 1. Read the mesh for this problem
+mesh = Mesh("data/gaussian.xml")
+subdomains = MeshFunction("size_t", mesh, "data/gaussian_physical_region.xml")
+boundaries = MeshFunction("size_t", mesh, "data/gaussian_facet_region.xml")
+
+# 2. Create Finite Element space (Lagrange P1)
+V = FunctionSpace(mesh, "Lagrange", 1)
+
+# 3. Allocate an object of the Gaussian class
+problem = Gaussian(V, subdomains=subdomains, boundaries=boundaries)
+mu_range = [(-1.0, 1.0), (-1.0, 1.0)]
+problem.set_mu_range(mu_range)
+
+# 4. Prepare reduction with a reduced basis method
+reduction_method = ReducedBasis(problem)
+reduction_method.set_Nmax(5, EIM=12)
+reduction_method.set_tolerance(1e-4, EIM=1e-8)
+
+# 5. Perform the offline phase
+reduction_method.initialize_training_set(20, EIM=30)
+reduced_problem = reduction_method.offline()
+
+# 6. Compare interpolated thetas computed for a block of parameters to the ones computed one parameter at a time
+mus = [tuple(mu) for mu in default_rng(0).uniform(-1.0, 1.0, size=(10, 2))]
+for EIM_reduction in reduction_method.EIM_reductions.values():
+    EIM_approximation = EIM_reduction.EIM_approximation
+    for N in (None, 5):
+        expected_interpolated_thetas = list()
+        for mu in mus:
+            EIM_approximation.set_mu(mu)
+            expected_interpolated_thetas.append(EIM_approximation.compute_interpolated_theta(N))
+        # Block evaluation of the analytical expression
+        interpolated_thetas = EIM_approximation.compute_interpolated_thetas(mus, N)
+        assert interpolated_thetas.shape == (len(mus), EIM_approximation.N)
+        assert allclose(interpolated_thetas, expected_interpolated_thetas, rtol=1e-8, atol=1e-10)
+        # Evaluation one parameter at a time, for expressions which cannot be evaluated as a block
+        block_evaluation_patch = PatchInstanceMethod(
+            EIM_approximation.parametrized_expression, "evaluate_for_parameters_at", lambda self_, mus, at: None)
+        block_evaluation_patch.patch()
+        interpolated_thetas = EIM_approximation.compute_interpolated_thetas(mus, N)
+        block_evaluation_patch.unpatch()
+        assert allclose(interpolated_thetas, expected_interpolated_thetas, rtol=1e-8, atol=1e-10)
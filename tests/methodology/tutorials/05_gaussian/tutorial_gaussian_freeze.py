@@ -0,0 +1,128 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import allclose, asarray
+from dolfin import *
+from rbnics import *
+
+
+class Gaussian(EllipticCoerciveProblem):
+
+    # Default initialization of members
+    def __init__(self, V, **kwargs):
+        # Call the standard initialization
+        EllipticCoerciveProblem.__init__(self, V, **kwargs)
+        # ... and also store FEniCS data structures for assembly
+        assert "subdomains" in kwargs
+        assert "boundaries" in kwargs
+        self.subdomains, self.boundaries = kwargs["subdomains"], kwargs["boundaries"]
+        self.u = TrialFunction(V)
+        self.v = TestFunction(V)
+        self.dx = Measure("dx")(subdomain_data=subdomains)
+        self.f = ParametrizedExpression(
+            self, "exp( - 2*pow(x[0]-mu[0], 2) - 2*pow(x[1]-mu[1], 2) )", mu=(0., 0.), element=V.ufl_element())
+        # note that we cannot use self.mu in the initialization of self.f, because self.mu has not been initialized yet
+
+    # Return the alpha_lower bound.
+    def get_stability_factor_lower_bound(self):
+        return 1.
+
+    # Return theta multiplicative terms of the affine expansion of the problem.
+    def compute_theta(self, term):
+        if term == "a":
+            return (1., )
+        elif term == "f":
+            return (1., )
+        else:
+            raise ValueError("Invalid term for compute_theta().")
+
+    # Return forms resulting from the discretization of the affine expansion of the problem operators.
+    def assemble_operator(self, term):
+        v = self.v
+        dx = self.dx
+        if term == "a":
+            u = self.u
+            a0 = inner(grad(u), grad(v)) * dx
+            return (a0,)
+        elif term == "f":
+            f = self.f
+            f0 = f * v * dx
+            return (f0,)
+        elif term == "dirichlet_bc":
+            bc0 = [DirichletBC(self.V, Constant(0.0), self.boundaries, 1),
+                   DirichletBC(self.V, Constant(0.0), self.boundaries, 2),
+                   DirichletBC(self.V, Constant(0.0), self.boundaries, 3)]
+            return (bc0,)
+        elif term == "inner_product":
+            u = self.u
+            x0 = inner(grad(u), grad(v)) * dx
+            return (x0,)
+        else:
+            raise ValueError("Invalid term for assemble_operator().")
+
+
+@EIM()
+class GaussianEIM(Gaussian):
+
+    # Return custom problem name
+    def name(self):
+        return "GaussianFreezeEIM"
+
+
+@ExactParametrizedFunctions()
+class GaussianExact(Gaussian):
+
+    # Return custom problem name
+    def name(self):
+        return "GaussianFreezeExact"
+
+
+# 1. Read the mesh for this problem
+mesh = Mesh("data/gaussian.xml")
+subdomains = MeshFunction("size_t", mesh, "data/gaussian_physical_region.xml")
+boundaries = MeshFunction("size_t", mesh, "data/gaussian_facet_region.xml")
+
+# 2. Create Finite Element space (Lagrange P1)
+V = FunctionSpace(mesh, "Lagrange", 1)
+
+for Problem in (GaussianEIM, GaussianExact):
+    # 3. Allocate an object of the Gaussian class
+    problem = Problem(V, subdomains=subdomains, boundaries=boundaries)
+    mu_range = [(-1.0, 1.0), (-1.0, 1.0)]
+    problem.set_mu_range(mu_range)
+
+    # 4. Prepare reduction with a reduced basis method
+    reduction_method = ReducedBasis(problem)
+    if Problem is GaussianEIM:
+        reduction_method.set_Nmax(5, EIM=12)
+        reduction_method.set_tolerance(1e-4, EIM=1e-8)
+    else:
+        reduction_method.set_Nmax(5)
+        reduction_method.set_tolerance(1e-4)
+
+    # 5. Perform the offline phase
+    if Problem is GaussianEIM:
+        reduction_method.initialize_training_set(20, EIM=30)
+    else:
+        reduction_method.initialize_training_set(20)
+    reduced_problem = reduction_method.offline()
+
+    # 6. Freeze the reduced problem at a parameter, and solve by the plan at a different one
+    freeze_mu = (0.5, -0.5)
+    online_mu = (-0.3, 0.8)
+    reduced_problem.set_mu(freeze_mu)
+    if Problem is GaussianEIM:
+        # The right-hand side is affinely decomposed by EIM, with interpolated thetas depending on the parameter
+        plan = reduced_problem.freeze()
+        plan_solution = plan.solve(online_mu)
+        reduced_problem.set_mu(online_mu)
+        solution = reduced_problem.solve()
+        assert allclose(asarray(plan_solution.vector()), asarray(solution.vector()), rtol=1e-10, atol=1e-12)
+    else:
+        # The right-hand side is evaluated exactly at each parameter, so that plans cannot be frozen
+        with pytest.raises(ValueError):
+            reduced_problem.freeze()
@@ -0,0 +1,139 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import allclose, sqrt
+from dolfin import *
+from rbnics import *
+from rbnics.backends import transpose
+
+
+class UnsteadyThermalBlock(ParabolicCoerciveProblem):
+
+    # Default initialization of members
+    def __init__(self, V, **kwargs):
+        # Call the standard initialization
+        ParabolicCoerciveProblem.__init__(self, V, **kwargs)
+        # ... and also store FEniCS data structures for assembly
+        assert "subdomains" in kwargs
+        assert "boundaries" in kwargs
+        self.subdomains, self.boundaries = kwargs["subdomains"], kwargs["boundaries"]
+        self.u = TrialFunction(V)
+        self.v = TestFunction(V)
+        self.dx = Measure("dx")(subdomain_data=self.subdomains)
+        self.ds = Measure("ds")(subdomain_data=self.boundaries)
+
+    # Return custom problem name
+    def name(self):
+        return "UnsteadyThermalBlockErrorOverTime"
+
+    # Return the alpha_lower bound.
+    def get_stability_factor_lower_bound(self):
+        return min(self.compute_theta("a"))
+
+    # Return theta multiplicative terms of the affine expansion of the problem.
+    def compute_theta(self, term):
+        mu = self.mu
+        if term == "m":
+            theta_m0 = 1.
+            return (theta_m0, )
+        elif term == "a":
+            theta_a0 = mu[0]
+            theta_a1 = 1.
+            return (theta_a0, theta_a1)
+        elif term == "f":
+            theta_f0 = mu[1]
+            return (theta_f0,)
+        else:
+            raise ValueError("Invalid term for compute_theta().")
+
+    # Return forms resulting from the discretization of the affine expansion of the problem operators.
+    def assemble_operator(self, term):
+        v = self.v
+        dx = self.dx
+        if term == "m":
+            u = self.u
+            m0 = u * v * dx
+            return (m0, )
+        elif term == "a":
+            u = self.u
+            a0 = inner(grad(u), grad(v)) * dx(1)
+            a1 = inner(grad(u), grad(v)) * dx(2)
+            return (a0, a1)
+        elif term == "f":
+            ds = self.ds
+            f0 = v * ds(1)
+            return (f0,)
+        elif term == "dirichlet_bc":
+            bc0 = [DirichletBC(self.V, Constant(0.0), self.boundaries, 3)]
+            return (bc0,)
+        elif term == "inner_product":
+            u = self.u
+            x0 = inner(grad(u), grad(v)) * dx
+            return (x0,)
+        elif term == "projection_inner_product":
+            u = self.u
+            x0 = u * v * dx
+            return (x0,)
+        else:
+            raise ValueError("Invalid term for assemble_operator().")
+
+
+# 1. Read the mesh for this problem
+mesh = Mesh("data/thermal_block.xml")
+subdomains = MeshFunction("size_t", mesh, "data/thermal_block_physical_region.xml")
+boundaries = MeshFunction("size_t", mesh, "data/thermal_block_facet_region.xml")
+
+# 2. Create Finite Element space (Lagrange P1)
+V = FunctionSpace(mesh, "Lagrange", 1)
+
+# 3. Allocate an object of the UnsteadyThermalBlock class
+problem = UnsteadyThermalBlock(V, subdomains=subdomains, boundaries=boundaries)
+problem.set_mu_range([(0.1, 10.0), (-1.0, 1.0)])
+problem.set_time_step_size(0.05)
+problem.set_final_time(1)
+
+# 4. Prepare reduction with a POD-Galerkin method
+reduction_method = PODGalerkin(problem)
+reduction_method.set_Nmax(6, nested_POD=3)
+reduction_method.initialize_training_set(10)
+
+# 5. Perform the offline phase
+reduced_problem = reduction_method.offline()
+
+
+# 6. Compute the error over time directly from the reduced and truth solutions at each time step
+def compute_error_over_time_directly(inner_product):
+    truth_solution_over_time = reduced_problem.truth_problem._solution_over_time
+    reduced_solution_over_time = reduced_problem._solution_over_time
+    error_over_time = list()
+    relative_error_over_time = list()
+    for (truth_solution, reduced_solution) in zip(truth_solution_over_time, reduced_solution_over_time):
+        error_function = truth_solution - reduced_problem.basis_functions[:reduced_solution.N] * reduced_solution
+        error = sqrt(abs(transpose(error_function) * inner_product * error_function))
+        error_over_time.append(error)
+        truth_solution_norm = sqrt(abs(transpose(truth_solution) * inner_product * truth_solution))
+        relative_error_over_time.append(error / truth_solution_norm if truth_solution_norm != 0. else 0.)
+    return (error_over_time, relative_error_over_time)
+
+
+# 7. Compare the error over time computed by the Gram matrix of the reduced basis with the direct one,
+#    for several reduced dimensions
+reduced_problem.set_mu((8.0, -1.0))
+for N in (reduced_problem.N, 4, 2):
+    reduced_problem.solve(N)
+    error_over_time = reduced_problem.compute_error()
+    relative_error_over_time = reduced_problem.compute_relative_error()
+    (expected_error_over_time, expected_relative_error_over_time) = compute_error_over_time_directly(
+        problem.inner_product[0])
+    assert allclose(list(error_over_time), expected_error_over_time, rtol=1e-6, atol=1e-10)
+    assert allclose(list(relative_error_over_time), expected_relative_error_over_time, rtol=1e-6, atol=1e-10)
+
+# 8. Storage of Gram matrices is bounded when a new inner product is provided at every call
+for _ in range(3):
+    scaled_inner_product = problem.inner_product[0] * 4.
+    error_over_time = reduced_problem._compute_error(inner_product={"u": scaled_inner_product})
+    assert allclose(list(error_over_time), [2. * error for error in expected_error_over_time], rtol=1e-6, atol=1e-10)
+    assert len(reduced_problem._error_over_time_gram) <= len(reduced_problem.components)
@@ -0,0 +1,161 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import shutil
+from numpy import allclose
+from dolfin import *
+from rbnics import *
+from rbnics.utils.test import PatchInstanceMethod
+
+
+class UnsteadyThermalBlock(ParabolicCoerciveProblem):
+
+    # Default initialization of members
+    def __init__(self, V, **kwargs):
+        # Call the standard initialization
+        ParabolicCoerciveProblem.__init__(self, V, **kwargs)
+        # ... and also store FEniCS data structures for assembly
+        assert "subdomains" in kwargs
+        assert "boundaries" in kwargs
+        assert "name" in kwargs
+        self.subdomains, self.boundaries = kwargs["subdomains"], kwargs["boundaries"]
+        self.u = TrialFunction(V)
+        self.v = TestFunction(V)
+        self.dx = Measure("dx")(subdomain_data=self.subdomains)
+        self.ds = Measure("ds")(subdomain_data=self.boundaries)
+        # Store the problem name, so that interrupted and uninterrupted runs do not share their folders
+        self._name = kwargs["name"]
+
+    # Return custom problem name
+    def name(self):
+        return self._name
+
+    # Return the alpha_lower bound.
+    def get_stability_factor_lower_bound(self):
+        return min(self.compute_theta("a"))
+
+    # Return theta multiplicative terms of the affine expansion of the problem.
+    def compute_theta(self, term):
+        mu = self.mu
+        if term == "m":
+            theta_m0 = 1.
+            return (theta_m0, )
+        elif term == "a":
+            theta_a0 = mu[0]
+            theta_a1 = 1.
+            return (theta_a0, theta_a1)
+        elif term == "f":
+            theta_f0 = mu[1]
+            return (theta_f0,)
+        else:
+            raise ValueError("Invalid term for compute_theta().")
+
+    # Return forms resulting from the discretization of the affine expansion of the problem operators.
+    def assemble_operator(self, term):
+        v = self.v
+        dx = self.dx
+        if term == "m":
+            u = self.u
+            m0 = u * v * dx
+            return (m0, )
+        elif term == "a":
+            u = self.u
+            a0 = inner(grad(u), grad(v)) * dx(1)
+            a1 = inner(grad(u), grad(v)) * dx(2)
+            return (a0, a1)
+        elif term == "f":
+            ds = self.ds
+            f0 = v * ds(1)
+            return (f0,)
+        elif term == "dirichlet_bc":
+            bc0 = [DirichletBC(self.V, Constant(0.0), self.boundaries, 3)]
+            return (bc0,)
+        elif term == "inner_product":
+            u = self.u
+            x0 = inner(grad(u), grad(v)) * dx
+            return (x0,)
+        elif term == "projection_inner_product":
+            u = self.u
+            x0 = u * v * dx
+            return (x0,)
+        else:
+            raise ValueError("Invalid term for assemble_operator().")
+
+
+class InterruptedOfflineStage(Exception):
+    pass
+
+
+# 1. Read the mesh for this problem
+mesh = Mesh("data/thermal_block.xml")
+subdomains = MeshFunction("size_t", mesh, "data/thermal_block_physical_region.xml")
+boundaries = MeshFunction("size_t", mesh, "data/thermal_block_facet_region.xml")
+
+# 2. Create Finite Element space (Lagrange P1)
+V = FunctionSpace(mesh, "Lagrange", 1)
+
+
+# 3. Carry out the offline phase of a reduced basis method with POD-Greedy, optionally interrupting it
+#    after a given number of greedy searches
+def offline(name, interrupt_after_greedy=None):
+    problem = UnsteadyThermalBlock(V, subdomains=subdomains, boundaries=boundaries, name=name)
+    problem.set_mu_range([(0.1, 10.0), (-1.0, 1.0)])
+    problem.set_time_step_size(0.05)
+    problem.set_final_time(1)
+    reduction_method = ReducedBasis(problem)
+    # The basis extension by POD makes basis updates not hierarchical
+    reduction_method.set_Nmax(12, POD_Greedy=(4, 2))
+    reduction_method.set_tolerance(1e-5, POD_Greedy=(1e-2, 1e-1))
+    reduction_method.initialize_training_set(16, sampling=EquispacedDistribution())
+    if interrupt_after_greedy is not None:
+        greedy_calls = [0]
+        unpatched_greedy = reduction_method.greedy
+
+        def interrupted_greedy(self_):
+            greedy_calls[0] += 1
+            if greedy_calls[0] > interrupt_after_greedy:
+                raise InterruptedOfflineStage()
+            return unpatched_greedy()
+
+        PatchInstanceMethod(reduction_method, "greedy", interrupted_greedy).patch()
+    reduced_problem = reduction_method.offline()
+    return (reduction_method, reduced_problem)
+
+
+# 4. Perform the offline phase without interruptions, after having removed offline data of previous runs
+for name in ("UnsteadyThermalBlockResumeReference", "UnsteadyThermalBlockResume"):
+    if os.path.exists(name):
+        shutil.rmtree(name)
+(reference_reduction_method, reference_reduced_problem) = offline("UnsteadyThermalBlockResumeReference")
+
+# 5. Interrupt the offline phase after the basis of the second greedy iteration has been stored,
+#    but before the corresponding checkpoint has been saved ...
+try:
+    offline("UnsteadyThermalBlockResume", interrupt_after_greedy=2)
+except InterruptedOfflineStage:
+    pass
+else:
+    raise AssertionError("The offline phase should have been interrupted")
+
+# 6. ... and resume it with new objects, as a new run would do
+(resumed_reduction_method, resumed_reduced_problem) = offline("UnsteadyThermalBlockResume")
+
+# 7. Compare the resumed offline phase to the uninterrupted one
+assert resumed_reduced_problem.N == reference_reduced_problem.N
+assert list(resumed_reduction_method.greedy_selected_parameters) == list(
+    reference_reduction_method.greedy_selected_parameters)
+assert allclose(list(resumed_reduction_method.greedy_error_estimators),
+                list(reference_reduction_method.greedy_error_estimators))
+for (resumed_basis_function, reference_basis_function) in zip(
+        resumed_reduced_problem.basis_functions, reference_reduced_problem.basis_functions):
+    assert allclose(resumed_basis_function.vector().get_local(), reference_basis_function.vector().get_local())
+online_mu = (8.0, -1.0)
+for reduced_problem in (resumed_reduced_problem, reference_reduced_problem):
+    reduced_problem.set_mu(online_mu)
+    reduced_problem.solve()
+assert allclose(resumed_reduced_problem.compute_output(), reference_reduced_problem.compute_output())
+assert allclose(resumed_reduced_problem.estimate_error(), reference_reduced_problem.estimate_error())
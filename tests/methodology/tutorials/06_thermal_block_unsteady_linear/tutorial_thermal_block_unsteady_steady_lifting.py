@@ -0,0 +1,124 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import allclose
+from dolfin import *
+from rbnics import *
+from rbnics.backends import copy
+
+
+class UnsteadyThermalBlock(ParabolicCoerciveProblem):
+
+    # Default initialization of members
+    def __init__(self, V, **kwargs):
+        # Call the standard initialization
+        ParabolicCoerciveProblem.__init__(self, V, **kwargs)
+        # ... and also store FEniCS data structures for assembly
+        assert "subdomains" in kwargs
+        assert "boundaries" in kwargs
+        self.subdomains, self.boundaries = kwargs["subdomains"], kwargs["boundaries"]
+        self.u = TrialFunction(V)
+        self.v = TestFunction(V)
+        self.dx = Measure("dx")(subdomain_data=self.subdomains)
+        self.ds = Measure("ds")(subdomain_data=self.boundaries)
+        # Boundary data only depend on time through their theta
+        self.dirichlet_bc_are_time_separable = True
+        # Boundary and initial data, chosen so that the truth solution is constant in time and equal to
+        # the solution of the steady problem
+        self.g = Expression("x[0]", element=self.V.ufl_element())
+
+    # Return custom problem name
+    def name(self):
+        return "UnsteadyThermalBlockSteadyLifting"
+
+    # Return theta multiplicative terms of the affine expansion of the problem.
+    def compute_theta(self, term):
+        mu = self.mu
+        if term == "m":
+            theta_m0 = 1.
+            return (theta_m0, )
+        elif term == "a":
+            theta_a0 = mu[0]
+            return (theta_a0, )
+        elif term == "f":
+            theta_f0 = 1.
+            return (theta_f0,)
+        elif term in ("dirichlet_bc", "initial_condition"):
+            theta_g0 = mu[1]
+            return (theta_g0,)
+        else:
+            raise ValueError("Invalid term for compute_theta().")
+
+    # Return forms resulting from the discretization of the affine expansion of the problem operators.
+    def assemble_operator(self, term):
+        v = self.v
+        dx = self.dx
+        if term == "m":
+            u = self.u
+            m0 = u * v * dx
+            return (m0, )
+        elif term == "a":
+            u = self.u
+            a0 = inner(grad(u), grad(v)) * dx
+            return (a0, )
+        elif term == "f":
+            f0 = Constant(0.) * v * dx
+            return (f0,)
+        elif term == "dirichlet_bc":
+            bc0 = [DirichletBC(self.V, self.g, "on_boundary")]
+            return (bc0,)
+        elif term == "initial_condition":
+            ic0 = project(self.g, self.V)
+            return (ic0,)
+        elif term == "inner_product":
+            u = self.u
+            x0 = inner(grad(u), grad(v)) * dx
+            return (x0,)
+        elif term == "projection_inner_product":
+            u = self.u
+            x0 = u * v * dx
+            return (x0,)
+        else:
+            raise ValueError("Invalid term for assemble_operator().")
+
+
+# 1. Read the mesh for this problem
+mesh = Mesh("data/thermal_block.xml")
+subdomains = MeshFunction("size_t", mesh, "data/thermal_block_physical_region.xml")
+boundaries = MeshFunction("size_t", mesh, "data/thermal_block_facet_region.xml")
+
+# 2. Create Finite Element space (Lagrange P1)
+V = FunctionSpace(mesh, "Lagrange", 1)
+
+# 3. Allocate an object of the UnsteadyThermalBlock class
+problem = UnsteadyThermalBlock(V, subdomains=subdomains, boundaries=boundaries)
+problem.set_mu_range([(0.1, 10.0), (0.5, 2.0)])
+problem.set_time_step_size(0.05)
+problem.set_final_time(1)
+
+# 4. Initialize the offline phase, during which the lifting is computed by a steady solve. Snapshots would vanish
+#    after the removal of the lifting, hence the offline phase is not carried out any further
+reduction_method = PODGalerkin(problem)
+reduction_method.set_Nmax(4)
+reduction_method.initialize_training_set(4)
+reduction_method._init_offline()
+reduced_problem = reduction_method.reduced_problem
+
+# 5. Compare the lifting computed by a steady solve to the one computed by the time average of the truth
+#    trajectory, which coincide since the truth solution is constant in time
+reduced_problem.set_mu((2.0, 1.5))
+problem.set_time(0.5)
+truth_solution = copy(problem._solution)
+steady_lifting = reduced_problem._lifting_truth_steady_solve("dirichlet_bc", 0)
+# The steady solve does not alter the state of the truth problem
+assert not hasattr(problem, "_is_solving")
+assert problem.t == 0.5
+assert allclose(problem._solution.vector().get_local(), truth_solution.vector().get_local())
+unsteady_lifting = reduced_problem._lifting_truth_unsteady_solve("dirichlet_bc", 0)
+assert allclose(steady_lifting.vector().get_local(), unsteady_lifting.vector().get_local(), rtol=1e-8, atol=1e-10)
+# The lifting stored during the offline stage is the same for any parameter, since so is the boundary data
+assert allclose(reduced_problem.basis_functions[0].vector().get_local(), steady_lifting.vector().get_local(),
+                rtol=1e-8, atol=1e-10)
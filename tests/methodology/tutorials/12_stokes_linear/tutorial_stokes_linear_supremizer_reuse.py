@@ -0,0 +1,155 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import allclose
+from dolfin import *
+from rbnics import *
+from rbnics.backends import copy, Function, LinearSolver, product, sum
+
+
+@PullBackFormsToReferenceDomain()
+@AffineShapeParametrization("data/t_bypass_vertices_mapping.vmp")
+class Stokes(StokesProblem):
+
+    # Default initialization of members
+    def __init__(self, V, **kwargs):
+        # Call the standard initialization
+        StokesProblem.__init__(self, V, **kwargs)
+        # ... and also store FEniCS data structures for assembly
+        assert "subdomains" in kwargs
+        assert "boundaries" in kwargs
+        self.subdomains, self.boundaries = kwargs["subdomains"], kwargs["boundaries"]
+        up = TrialFunction(V)
+        (self.u, self.p) = split(up)
+        vq = TestFunction(V)
+        (self.v, self.q) = split(vq)
+        self.dx = Measure("dx")(subdomain_data=self.subdomains)
+        self.ds = Measure("ds")(subdomain_data=self.boundaries)
+        #
+        self.f = Constant((0.0, -10.0))
+        self.g = Constant(0.0)
+
+    # Return custom problem name
+    def name(self):
+        return "StokesLinearSupremizerReuse"
+
+    # Return the lower bound for inf-sup constant.
+    def get_stability_factor_lower_bound(self):
+        return 1.
+
+    # Return theta multiplicative terms of the affine expansion of the problem.
+    @compute_theta_for_supremizers
+    def compute_theta(self, term):
+        if term == "a":
+            theta_a0 = 1.0
+            return (theta_a0, )
+        elif term in ("b", "bt"):
+            theta_b0 = 1.0
+            return (theta_b0, )
+        elif term == "f":
+            theta_f0 = 1.0
+            return (theta_f0, )
+        elif term == "g":
+            theta_g0 = 1.0
+            return (theta_g0, )
+        else:
+            raise ValueError("Invalid term for compute_theta().")
+
+    # Return forms resulting from the discretization of the affine expansion of the problem operators.
+    @assemble_operator_for_supremizers
+    def assemble_operator(self, term):
+        dx = self.dx
+        if term == "a":
+            u = self.u
+            v = self.v
+            a0 = inner(grad(u), grad(v)) * dx
+            return (a0, )
+        elif term == "b":
+            u = self.u
+            q = self.q
+            b0 = - q * div(u) * dx
+            return (b0, )
+        elif term == "bt":
+            p = self.p
+            v = self.v
+            bt0 = - p * div(v) * dx
+            return (bt0, )
+        elif term == "f":
+            v = self.v
+            f0 = inner(self.f, v) * dx
+            return (f0, )
+        elif term == "g":
+            q = self.q
+            g0 = self.g * q * dx
+            return (g0, )
+        elif term == "dirichlet_bc_u":
+            bc0 = [DirichletBC(self.V.sub(0), Constant((0.0, 0.0)), self.boundaries, 3)]
+            return (bc0,)
+        elif term == "inner_product_u":
+            u = self.u
+            v = self.v
+            x0 = inner(grad(u), grad(v)) * dx
+            return (x0, )
+        elif term == "inner_product_p":
+            p = self.p
+            q = self.q
+            x0 = inner(p, q) * dx
+            return (x0, )
+        else:
+            raise ValueError("Invalid term for assemble_operator().")
+
+
+# 1. Read the mesh for this problem
+mesh = Mesh("data/t_bypass.xml")
+subdomains = MeshFunction("size_t", mesh, "data/t_bypass_physical_region.xml")
+boundaries = MeshFunction("size_t", mesh, "data/t_bypass_facet_region.xml")
+
+# 2. Create Finite Element space (Taylor-Hood P2-P1)
+element_u = VectorElement("Lagrange", mesh.ufl_cell(), 2)
+element_p = FiniteElement("Lagrange", mesh.ufl_cell(), 1)
+element = MixedElement(element_u, element_p)
+V = FunctionSpace(mesh, element, components=[["u", "s"], "p"])
+
+# 3. Allocate an object of the Stokes class
+problem = Stokes(V, subdomains=subdomains, boundaries=boundaries)
+mu_range = [
+    (0.5, 1.5),
+    (0.5, 1.5),
+    (0.5, 1.5),
+    (0.5, 1.5),
+    (0.5, 1.5),
+    (0., pi / 6.)
+]
+problem.set_mu_range(mu_range)
+problem.init()
+
+
+# 4. Solve the supremizer problem as before the introduction of the factorized solver, i.e. by assembling the
+#    parametrized right-hand side and by factorizing the inner product at every solve
+def solve_supremizer_without_factorization(solution):
+    supremizer = Function(V, "s")
+    assembled_operator_bt = sum(product(problem.compute_theta("bt_restricted"), problem.operator["bt_restricted"]))
+    assembled_dirichlet_bc = sum(product(problem.compute_theta("dirichlet_bc_s"), problem.dirichlet_bc["s"]))
+    solver = LinearSolver(problem.inner_product["s"][0], supremizer, assembled_operator_bt * solution,
+                          assembled_dirichlet_bc)
+    solver.set_parameters(problem._linear_solver_parameters)
+    solver.solve()
+    return supremizer
+
+
+# 5. Compare the supremizers obtained by the factorized solver and by the previous solver for several parameters
+supremizer_solver = None
+for mu in [(1.0, 1.0, 1.0, 1.0, 1.0, 0.), (0.5, 1.5, 0.7, 1.2, 0.9, pi / 6.), (1.5, 0.5, 1.3, 0.6, 1.1, pi / 12.)]:
+    problem.set_mu(mu)
+    solution = copy(problem.solve())
+    problem._solve_supremizer(solution)
+    # The same factorized solver is reused for all parameters
+    if supremizer_solver is None:
+        supremizer_solver = problem._supremizer_solver
+    assert problem._supremizer_solver is supremizer_solver
+    expected_supremizer = solve_supremizer_without_factorization(solution)
+    assert allclose(problem._supremizer.vector().get_local(), expected_supremizer.vector().get_local(),
+                    rtol=1e-8, atol=1e-10)
@@ -0,0 +1,69 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy.random import rand
+from rbnics.problems.base import ParametrizedProblem
+from rbnics.utils.decorators import sync_setters
+from rbnics.utils.decorators.sync_setters import sync_setters__eager
+
+
+class Problem(ParametrizedProblem):
+    def __init__(self, folder_prefix):
+        ParametrizedProblem.__init__(self, folder_prefix)
+
+
+class SyncedProblem(Problem):
+    @sync_setters("truth_problem", "set_mu", "mu")
+    @sync_setters("truth_problem", "set_mu_range", "mu_range")
+    def __init__(self, truth_problem, folder_prefix):
+        Problem.__init__(self, folder_prefix)
+        self.truth_problem = truth_problem
+
+
+class Data(object):
+    def __init__(self, n_synced, P, test_type):
+        self.n_synced = n_synced
+        self.P = P
+        self.test_type = test_type
+        self.Ntest = 100
+
+    def generate_random(self):
+        # Generate a truth problem and several objects synced to it, e.g. reduced problems, EIM and
+        # SCM approximations
+        truth_problem = Problem("truth")
+        truth_problem.set_mu_range([(0., 1.)] * self.P)
+        synced_problems = [SyncedProblem(truth_problem, "synced_" + str(i)) for i in range(self.n_synced)]
+        if self.test_type == "eager":
+            for problem in [truth_problem] + synced_problems:
+                sync_setters__eager(problem, "set_mu")
+        # Generate random testing set
+        testing_set = [tuple(rand(self.P)) for _ in range(self.Ntest)]
+        # Return
+        return (synced_problems[0], testing_set)
+
+    def evaluate(self, reduced_problem, testing_set):
+        # Loop over the testing set as in error analysis, where only the reduced problem reads the parameter
+        mu_sum = 0.
+        for mu in testing_set:
+            reduced_problem.set_mu(mu)
+            mu_sum += reduced_problem.mu[0]
+        return mu_sum
+
+    def assert_result(self, reduced_problem, testing_set, mu_sum):
+        assert mu_sum == sum(mu[0] for mu in testing_set)
+        # Other synced objects are in sync as soon as they read the parameter
+        assert reduced_problem.truth_problem.mu == testing_set[-1]
+
+
+@pytest.mark.parametrize("n_synced", [2**i for i in range(1, 6)])
+@pytest.mark.parametrize("P", [2, 10])
+@pytest.mark.parametrize("test_type", ["eager", "lazy"])
+def test_sync_setters_set_mu(n_synced, P, test_type, benchmark):
+    data = Data(n_synced, P, test_type)
+    print("n_synced = " + str(n_synced) + ", P = " + str(P))
+    print("Testing", test_type)
+    benchmark(data.evaluate, setup=data.generate_random, teardown=data.assert_result)
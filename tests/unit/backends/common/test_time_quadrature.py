@@ -0,0 +1,37 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import diag, isclose, linspace, outer, vstack
+from rbnics.backends.common.time_quadrature import TimeQuadrature
+
+
+@pytest.mark.parametrize("rule", ["trapezoidal", "simpson", "boole"])
+def test_time_quadrature_numbers(rule):
+    times = linspace(0., 2., 17)
+    quadrature = TimeQuadrature((0., 2.), [float(t**2) for t in times])
+    quadrature.set_parameters({"rule": rule})
+    assert isclose(quadrature.integrate(), 8. / 3., rtol=1.e-2)
+
+
+@pytest.mark.parametrize("rule", ["simpson", "boole"])
+def test_time_quadrature_array(rule):
+    times = linspace(0., 1., 9)
+    # Each row is a dof, each column a time
+    function_over_time = vstack((times, times**2, outer([3.], times**3)))
+    quadrature = TimeQuadrature((0., 1.), function_over_time)
+    quadrature.set_parameters({"rule": rule})
+    assert isclose(quadrature.integrate(), [1. / 2., 1. / 3., 3. / 4.]).all()
+    # Space-time norm
+    inner_product = diag([1., 2., 1.])
+    assert isclose(quadrature.integrate_inner_product(inner_product), 1. / 3. + 2. / 5. + 9. / 7., rtol=1.e-3)
+
+
+def test_time_quadrature_invalid_rule():
+    quadrature = TimeQuadrature((0., 1.), [0., 1., 2.])
+    quadrature.set_parameters({"rule": "boole"})
+    with pytest.raises(ValueError):
+        quadrature.integrate()
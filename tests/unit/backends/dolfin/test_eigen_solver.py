@@ -17,7 +17,7 @@ of a Stokes problem on a square
 
 
 # ~~~ Sparse case ~~~ #
-def _test_eigen_solver_sparse(callback_type):
+def _test_eigen_solver_sparse(callback_type, initial_space=None):
     from rbnics.backends.dolfin import EigenSolver
 
     # Define mesh
@@ -67,12 +67,15 @@ def _test_eigen_solver_sparse(callback_type):
         "spectral_transform": "shift-and-invert",
         "spectral_shift": 1.e-5
     })
+    if initial_space is not None:
+        solver.set_initial_space(initial_space)
     solver.solve(1)
     r, c = solver.get_eigenvalue(0)
     assert abs(c) < 1.e-10
     assert r > 0., "r = " + str(r) + " is not positive"
     print("Sparse inf-sup constant: ", sqrt(r))
-    return (sqrt(r), solver.condensed_A, solver.condensed_B)
+    r_vector, _ = solver.get_eigenvector(0)
+    return (sqrt(r), solver.condensed_A, solver.condensed_B, r_vector)
 
 
 # ~~~ Dense case ~~~ #
@@ -102,10 +105,13 @@ def _test_eigen_solver_dense(sparse_LHS, sparse_RHS):
 # ~~~ Test function ~~~ #
 def test_eigen_solver():
     sqrt_r_exact = 0.6051627263949135
-    (sqrt_r_sparse_tensor_callbacks, sparse_LHS, sparse_RHS) = _test_eigen_solver_sparse("tensor callbacks")
+    (sqrt_r_sparse_tensor_callbacks, sparse_LHS, sparse_RHS, r_vector) = _test_eigen_solver_sparse(
+        "tensor callbacks")
     assert isclose(sqrt_r_sparse_tensor_callbacks, sqrt_r_exact)
-    (sqrt_r_sparse_form_callbacks, _, _) = _test_eigen_solver_sparse("form callbacks")
+    (sqrt_r_sparse_form_callbacks, _, _, _) = _test_eigen_solver_sparse("form callbacks")
     assert isclose(sqrt_r_sparse_form_callbacks, sqrt_r_exact)
+    (sqrt_r_sparse_warm_start, _, _, _) = _test_eigen_solver_sparse("tensor callbacks", [r_vector])
+    assert isclose(sqrt_r_sparse_warm_start, sqrt_r_exact)
     if sparse_LHS.mpi_comm().size == 1:  # dense solver is not partitioned
         (sqrt_r_dense, _, _) = _test_eigen_solver_dense(sparse_LHS, sparse_RHS)
         assert isclose(sqrt_r_dense, sqrt_r_exact)
@@ -0,0 +1,57 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import glob
+import os
+import pytest
+from numpy import isclose
+from dolfin import Expression, FunctionSpace, interpolate, UnitSquareMesh
+from dolfin_utils.test import fixture as module_fixture
+from rbnics.backends.dolfin import FunctionsList
+from rbnics.utils.mpi import parallel_io
+
+
+# Mesh
+@module_fixture
+def mesh():
+    return UnitSquareMesh(10, 10)
+
+
+def test_functions_list_io(mesh, tempdir):
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    functions_list = FunctionsList(V)
+    for c in (1., 2., 3.):
+        functions_list.enrich(interpolate(Expression("c*x[0] + x[1]", c=c, element=V.ufl_element()), V))
+    functions_list.save(tempdir, "functions_list")
+    loaded_functions_list = FunctionsList(V)
+    assert loaded_functions_list.load(tempdir, "functions_list")
+    assert not loaded_functions_list.load(tempdir, "functions_list")
+    assert len(loaded_functions_list) == 3
+    # Slices share the functions they are extracted from, even if they are read from file on demand
+    loaded_functions_list_slice = loaded_functions_list[1:]
+    assert loaded_functions_list_slice[0] is loaded_functions_list[1]
+    for (function, loaded_function) in zip(functions_list, loaded_functions_list):
+        assert isclose(function.vector().get_local(), loaded_function.vector().get_local()).all()
+
+
+def test_functions_list_io_missing_files(mesh, tempdir):
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    functions_list = FunctionsList(V)
+    for c in (1., 2., 3.):
+        functions_list.enrich(interpolate(Expression("c*x[0] + x[1]", c=c, element=V.ufl_element()), V))
+    functions_list.save(tempdir, "functions_list")
+
+    # Remove the files of the second function
+    def remove_files_task():
+        for filename in glob.glob(os.path.join(str(tempdir), "functions_list_1[._]*")):
+            os.remove(filename)
+
+    parallel_io(remove_files_task, mesh.mpi_comm())
+    # Missing files are reported by load, rather than when the function is first accessed
+    loaded_functions_list = FunctionsList(V)
+    with pytest.raises(OSError):
+        loaded_functions_list.load(tempdir, "functions_list")
+    assert len(loaded_functions_list) == 0
@@ -0,0 +1,43 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import isclose
+from dolfin import (assemble, dx, Expression, FunctionSpace, interpolate, TestFunction, TrialFunction,
+                    UnitSquareMesh)
+from dolfin_utils.test import fixture as module_fixture
+from rbnics.backends.dolfin import ProperOrthogonalDecomposition, transpose
+
+
+# Mesh
+@module_fixture
+def mesh():
+    return UnitSquareMesh(10, 10)
+
+
+def test_proper_orthogonal_decomposition_result(mesh):
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    u = TrialFunction(V)
+    v = TestFunction(V)
+    inner_product = assemble(u * v * dx)
+    POD = ProperOrthogonalDecomposition(V, inner_product)
+    for c in range(1, 9):
+        POD.store_snapshot(interpolate(Expression("sin(c*x[0])*cos(x[1]/c)", c=c, element=V.ufl_element()), V))
+    result = POD.decompose()
+    assert result.number_of_modes(5, 0.) == 5
+    assert result.number_of_modes(100, 0.) == 8
+    # Nested truncations share the same modes
+    modes_3 = result.modes(3)
+    modes_5 = result.modes(5)
+    assert len(modes_3) == 3
+    assert len(modes_5) == 5
+    for (mode_3, mode_5) in zip(modes_3, modes_5):
+        assert isclose(mode_3.vector().get_local(), mode_5.vector().get_local()).all()
+    # Projected operators on fewer modes are slices of the ones on more modes
+    projected_operators_5 = result.project((inner_product, ), 5)
+    projected_operators_3 = result.project((inner_product, ), 3)
+    expected_3 = transpose(modes_3) * inner_product * modes_3
+    assert isclose(projected_operators_3[0], expected_3).all()
+    assert isclose(projected_operators_5[0][:3, :3], expected_3).all()
@@ -18,7 +18,8 @@ else:
     has_mshr = True
 from rbnics.backends.dolfin import ReducedMesh
 from rbnics.backends.dolfin.wrapping import (
-    evaluate_and_vectorize_sparse_matrix_at_dofs, evaluate_sparse_function_at_dofs, evaluate_sparse_vector_at_dofs)
+    evaluate_and_vectorize_sparse_matrix_at_dofs, evaluate_sparse_function_at_dofs, evaluate_sparse_vector_at_dofs,
+    SparseFunctionAtDofsInterpolator)
 from rbnics.utils.test import enable_logging
 
 # Logger
@@ -256,6 +257,10 @@ def _test_reduced_mesh_elliptic_function(V, reduced_mesh):
     assert isclose(nonzero_values(f_dofs), nonzero_values(f_reduced_dofs)).all()
     assert isclose(f_reduced_dofs.vector().get_local(), f_N_reduced_dofs.vector().get_local()).all()
 
+    interpolator = SparseFunctionAtDofsInterpolator(dofs, reduced_V[0], reduced_dofs)
+    for _ in range(2):  # the second application reuses the scatter built by the first one
+        assert isclose(interpolator(f).vector().get_local(), f_reduced_dofs.vector().get_local()).all()
+
 
 # ~~~ Mixed case ~~~ #
 def MixedFunctionSpace(mesh):
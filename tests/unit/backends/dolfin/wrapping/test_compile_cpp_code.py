@@ -0,0 +1,42 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from dolfin import compile_cpp_code as dolfin_compile_cpp_code
+from rbnics.backends.dolfin.wrapping.compile_cpp_code import (
+    compile_cpp_code, precompile_cpp_code, register_cpp_code)
+from rbnics.backends.dolfin.wrapping.get_local_dof_to_component_map import _collapse_dofmap_cpp_code
+
+_add_cpp_code = """
+    #include <pybind11/pybind11.h>
+
+    int add(int a, int b)
+    {
+        return a + b;
+    }
+
+    PYBIND11_MODULE(SIGNATURE, m)
+    {
+        m.def("add", &add);
+    }
+"""
+
+
+def test_compile_cpp_code():
+    module = compile_cpp_code(_add_cpp_code)
+    # The same source is compiled only once per process
+    assert compile_cpp_code(_add_cpp_code) is module
+    # ... and the module behaves as the one compiled directly by dolfin
+    assert module.add(2, 3) == dolfin_compile_cpp_code(_add_cpp_code).add(2, 3) == 5
+
+
+def test_precompile_cpp_code():
+    assert register_cpp_code(_add_cpp_code) is _add_cpp_code
+    number_of_cpp_codes = precompile_cpp_code()
+    assert number_of_cpp_codes >= 2  # at least the one above and the helpers already imported by rbnics
+    # Helpers registered at import time are then available without compiling them again
+    collapse_dofmap_module = compile_cpp_code(_collapse_dofmap_cpp_code)
+    assert compile_cpp_code(_collapse_dofmap_cpp_code) is collapse_dofmap_module
+    assert precompile_cpp_code() == number_of_cpp_codes
@@ -0,0 +1,45 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import isclose
+from numpy.random import default_rng
+from dolfin import Expression, Function, FunctionSpace, interpolate, UnitSquareMesh, VectorFunctionSpace
+from dolfin_utils.test import fixture as module_fixture
+from rbnics.backends.dolfin.wrapping import evaluate_expression
+
+
+# Mesh
+@module_fixture
+def mesh():
+    return UnitSquareMesh(10, 10)
+
+
+@pytest.mark.parametrize("family, degree", [("Lagrange", 1), ("Lagrange", 2), ("Discontinuous Lagrange", 1)])
+@pytest.mark.parametrize("code", ["sin(x[0])*exp(x[1])", ("x[0]*x[1]", "cos(x[0] + 2*x[1])")])
+def test_evaluate_expression_at_dofs(mesh, family, degree, code):
+    if isinstance(code, tuple):
+        V = VectorFunctionSpace(mesh, family, degree)
+    else:
+        V = FunctionSpace(mesh, family, degree)
+    expression = Expression(code, element=V.ufl_element())
+    dofs = sorted(default_rng(0).choice(V.dim(), size=10, replace=False))
+    function = Function(V)
+    evaluate_expression(expression, function, dofs_list=[(dof, ) for dof in dofs])
+    # Values at the required dofs are the same as the ones obtained by interpolation ...
+    interpolated_expression = interpolate(expression, V).vector().get_local()
+    assert isclose(function.vector().get_local()[dofs], interpolated_expression[dofs]).all()
+    # ... while all other values are left untouched
+    other_dofs = sorted(set(range(V.dim())) - set(dofs))
+    assert (function.vector().get_local()[other_dofs] == 0.).all()
+
+
+def test_evaluate_expression_without_dofs(mesh):
+    V = FunctionSpace(mesh, "Lagrange", 2)
+    expression = Expression("sin(x[0])*exp(x[1])", element=V.ufl_element())
+    function = Function(V)
+    evaluate_expression(expression, function)
+    assert isclose(function.vector().get_local(), interpolate(expression, V).vector().get_local()).all()
@@ -0,0 +1,59 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import isclose
+from dolfin import FunctionSpace, interpolate, UnitSquareMesh, VectorFunctionSpace
+from dolfin_utils.test import fixture as module_fixture
+from rbnics.backends.dolfin.wrapping import evaluate_parametrized_expression_at_dofs, ParametrizedExpression
+from rbnics.problems.base import ParametrizedProblem
+
+
+# Mesh
+@module_fixture
+def mesh():
+    return UnitSquareMesh(10, 10)
+
+
+# Mock problem to which the parametrized expression is attached
+class MockProblem(ParametrizedProblem):
+    def __init__(self, V):
+        ParametrizedProblem.__init__(self, "")
+        self.V = V
+
+    def name(self):
+        return "MockProblem"
+
+
+@pytest.mark.parametrize("code", [
+    "exp( - 2*pow(x[0]-mu[0], 2) - 2*pow(x[1]-mu[1], 2) )",
+    "1/sqrt(pow(x[0]-mu[0], 2) + pow(x[1]-mu[1], 2) + 0.01)",
+    "(1-x[0])*cos(3*pi*(pi+mu[1])*(1+x[1]))*exp(-(pi+mu[0])*(1+x[0]))",
+    ("mu[0]*x[0]", "std::sin(mu[1]*x[1])")
+])
+def test_evaluate_parametrized_expression_at_dofs(mesh, code):
+    if isinstance(code, tuple):
+        V = VectorFunctionSpace(mesh, "Lagrange", 1)
+    else:
+        V = FunctionSpace(mesh, "Lagrange", 1)
+    problem = MockProblem(V)
+    expression = ParametrizedExpression(problem, code, mu=(0., 0.), element=V.ufl_element())
+    mus = [(0.1, 0.2), (0.5, 0.5), (-1., 2.)]
+    values = evaluate_parametrized_expression_at_dofs(expression, V, mus)
+    assert values.shape[1] == len(mus)
+    for (j, mu) in enumerate(mus):
+        problem.set_mu(mu)
+        assert isclose(values[:, j], interpolate(expression, V).vector().get_local()).all()
+
+
+@pytest.mark.parametrize("code", [
+    "x[0] < mu[0] ? 1. : 0.",
+    "1/2*mu[0]*x[0]"
+])
+def test_evaluate_parametrized_expression_at_dofs_not_vectorizable(mesh, code):
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    expression = ParametrizedExpression(MockProblem(V), code, mu=(0., ), element=V.ufl_element())
+    assert evaluate_parametrized_expression_at_dofs(expression, V, [(0.5, )]) is None
@@ -0,0 +1,81 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import asarray, isclose
+from dolfin import Expression, Function, FunctionSpace, interpolate, UnitSquareMesh
+from dolfin_utils.test import fixture as module_fixture
+from rbnics.backends.dolfin import BasisFunctionsMatrix
+from rbnics.backends.dolfin.wrapping.expression_on_reduced_mesh import _DenseReducedBasisFunctions
+from rbnics.backends.online import OnlineFunction
+from rbnics.utils.io import OnlineSizeDict
+
+
+# Mesh
+@module_fixture
+def mesh():
+    return UnitSquareMesh(10, 10)
+
+
+def _basis_function(V, c):
+    return interpolate(Expression("c*x[0] + x[1]*x[1]", c=c, element=V.ufl_element()), V)
+
+
+def _mul_online_function(dense_reduced_basis_functions, coefficients, V):
+    N = OnlineSizeDict()
+    N["u"] = len(coefficients)
+    online_function = OnlineFunction(N)
+    online_function.vector()[:] = asarray(coefficients)
+    output = Function(V)
+    dense_reduced_basis_functions.mul_online_function(online_function, output)
+    return output.vector().get_local()
+
+
+def _linear_combination(basis_functions_matrix, coefficients):
+    return sum(coefficient * basis_functions_matrix[n].vector().get_local()
+               for (n, coefficient) in enumerate(coefficients))
+
+
+def test_dense_reduced_basis_functions(mesh):
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    basis_functions_matrix = BasisFunctionsMatrix(V)
+    basis_functions_matrix.init(["u"])
+    for c in (1., 2., 3.):
+        basis_functions_matrix.enrich(_basis_function(V, c))
+    dense_reduced_basis_functions = _DenseReducedBasisFunctions(basis_functions_matrix)
+    # Product with the first basis functions only
+    assert isclose(_mul_online_function(dense_reduced_basis_functions, [1., -2.], V),
+                   _linear_combination(basis_functions_matrix, [1., -2.])).all()
+    # Product with all basis functions
+    assert isclose(_mul_online_function(dense_reduced_basis_functions, [1., -2., 0.5], V),
+                   _linear_combination(basis_functions_matrix, [1., -2., 0.5])).all()
+    # Changes to the basis functions matrix are detected, even if a new function is stored in place of an old one
+    basis_functions_matrix.clear()
+    for c in (4., 5., 6., 7.):
+        basis_functions_matrix.enrich(_basis_function(V, c))
+    assert isclose(_mul_online_function(dense_reduced_basis_functions, [1., -2., 0.5, 3.], V),
+                   _linear_combination(basis_functions_matrix, [1., -2., 0.5, 3.])).all()
+    basis_functions_matrix["u"][0] = _basis_function(V, 8.)
+    assert isclose(_mul_online_function(dense_reduced_basis_functions, [1., -2.], V),
+                   _linear_combination(basis_functions_matrix, [1., -2.])).all()
+
+
+def test_dense_reduced_basis_functions_load(mesh, tempdir):
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    basis_functions_matrix = BasisFunctionsMatrix(V)
+    basis_functions_matrix.init(["u"])
+    for c in (1., 2., 3.):
+        basis_functions_matrix.enrich(_basis_function(V, c))
+    basis_functions_matrix.save(tempdir, "basis")
+    loaded_basis_functions_matrix = BasisFunctionsMatrix(V)
+    loaded_basis_functions_matrix.init(["u"])
+    loaded_basis_functions_matrix.load(tempdir, "basis")
+    dense_reduced_basis_functions = _DenseReducedBasisFunctions(loaded_basis_functions_matrix)
+    # Only the basis functions which are required by the product are read from file
+    output = _mul_online_function(dense_reduced_basis_functions, [2.], V)
+    assert isinstance(loaded_basis_functions_matrix["u"]._list[0], Function)
+    assert not isinstance(loaded_basis_functions_matrix["u"]._list[1], Function)
+    assert not isinstance(loaded_basis_functions_matrix["u"]._list[2], Function)
+    assert isclose(output, 2. * basis_functions_matrix[0].vector().get_local()).all()
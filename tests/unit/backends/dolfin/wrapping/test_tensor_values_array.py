@@ -0,0 +1,88 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import isclose, shares_memory
+from dolfin import (assemble, Constant, dx, Expression, FunctionSpace, grad, inner, TestFunction, TrialFunction,
+                    UnitSquareMesh)
+from dolfin_utils.test import fixture as module_fixture
+from rbnics.backends.dolfin.wrapping import TensorValuesArray, vectorized_matrix_inner_vectorized_matrix
+from rbnics.backends.online import OnlineFunction
+
+
+# Mesh
+@module_fixture
+def mesh():
+    return UnitSquareMesh(10, 10)
+
+
+# Matrices sharing the same sparsity pattern
+def Matrices(mesh):
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    u = TrialFunction(V)
+    v = TestFunction(V)
+    return [assemble(Constant(c) * u * v * dx + inner(grad(u), grad(v)) * dx) for c in (1., 2., 3.)]
+
+
+def test_tensor_values_array_matrix(mesh):
+    matrices = Matrices(mesh)
+    values = TensorValuesArray(mesh.mpi_comm())
+    for matrix in matrices:
+        assert values.append(matrix)
+    assert len(values) == 3
+    # Extraction of a single matrix
+    assert isclose(values[1].array(), matrices[1].array()).all()
+    # Linear combination
+    coefficients = OnlineFunction(3)
+    coefficients.vector()[:] = [1., -2., 0.5]
+    combination = values * coefficients
+    expected = matrices[0] - 2. * matrices[1] + 0.5 * matrices[2]
+    assert isclose(combination.array(), expected.array()).all()
+    # Inner products
+    inner_products = values.inner(values)
+    for i in range(3):
+        for j in range(3):
+            assert isclose(inner_products[i, j], vectorized_matrix_inner_vectorized_matrix(matrices[i], matrices[j]))
+
+
+def test_tensor_values_array_different_sparsity_pattern(mesh):
+    matrices = Matrices(mesh)
+    values = TensorValuesArray(mesh.mpi_comm())
+    assert values.append(matrices[0])
+    V = FunctionSpace(mesh, "Lagrange", 2)
+    assert not values.append(assemble(TrialFunction(V) * TestFunction(V) * dx))
+    assert len(values) == 1
+
+
+def test_tensor_values_array_matrix_evaluate_at_dofs(mesh):
+    matrices = Matrices(mesh)
+    values = TensorValuesArray(mesh.mpi_comm())
+    for matrix in matrices:
+        assert values.append(matrix)
+    # Diagonal entries, off diagonal entries in the sparsity pattern and entries outside of the sparsity pattern
+    dofs_list = [(0, 0), (5, 5), (0, 1), (1, 0), (0, matrices[0].size(1) - 1)]
+    values_at_dofs = values.evaluate_at_dofs(dofs_list)
+    assert values_at_dofs.shape == (len(dofs_list), len(matrices))
+    for (j, matrix) in enumerate(matrices):
+        for (i, dofs) in enumerate(dofs_list):
+            assert isclose(values_at_dofs[i, j], matrix.array()[dofs])
+    # Slices share the stored values, and are evaluated consistently
+    values_slice = values[1:]
+    assert shares_memory(values_slice._content, values._content)
+    assert isclose(values_slice.evaluate_at_dofs(dofs_list), values_at_dofs[:, 1:]).all()
+
+
+def test_tensor_values_array_vector_evaluate_at_dofs(mesh):
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    v = TestFunction(V)
+    vectors = [assemble(Expression("c*x[0] + x[1]", c=c, degree=1) * v * dx) for c in (1., 2., 3.)]
+    values = TensorValuesArray(mesh.mpi_comm())
+    for vector in vectors:
+        assert values.append(vector)
+    dofs_list = [(0, ), (7, ), (V.dim() - 1, )]
+    values_at_dofs = values.evaluate_at_dofs(dofs_list)
+    for (j, vector) in enumerate(vectors):
+        for (i, dofs) in enumerate(dofs_list):
+            assert isclose(values_at_dofs[i, j], vector.get_local()[dofs[0]])
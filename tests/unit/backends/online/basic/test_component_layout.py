@@ -0,0 +1,110 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pickle
+import pytest
+from rbnics.backends.online.basic.wrapping import component_layout, layouts_are_equal
+from rbnics.backends.online.numpy import Matrix, Vector
+from rbnics.utils.io import ComponentNameToBasisComponentIndexDict, OnlineSizeDict
+
+
+def _generate_N():
+    N = OnlineSizeDict()
+    N["u"] = 3
+    N["p"] = 2
+    return N
+
+
+def test_component_layout_interning():
+    layout = component_layout(_generate_N())
+    # Layouts with the same ordered (component, size) pairs are the same object
+    assert component_layout(_generate_N()) is layout
+    assert layouts_are_equal(layout, component_layout(_generate_N()))
+    # ... while a different ordering defines a different layout
+    N_reversed = OnlineSizeDict()
+    N_reversed["p"] = 2
+    N_reversed["u"] = 3
+    assert component_layout(N_reversed) is not layout
+    assert list(layout.component_name_to_basis_component_index.items()) == [("u", 0), ("p", 1)]
+    assert list(layout.component_name_to_basis_component_length.items()) == [("u", 3), ("p", 2)]
+
+
+def test_component_layout_identity_fast_path():
+    layout = component_layout(_generate_N())
+    # Constructing from an interned size dictionary returns its layout directly
+    assert component_layout(layout.component_name_to_basis_component_length) is layout
+    # ... hence tensors built from other tensors share the same dictionaries
+    vector = Vector(_generate_N())
+    other_vector = Vector(vector.N)
+    assert vector.N is layout.component_name_to_basis_component_length
+    assert other_vector.N is vector.N
+    assert other_vector._component_name_to_basis_component_index is vector._component_name_to_basis_component_index
+    matrix = Matrix(vector.N, _generate_N())
+    assert matrix.M is vector.N
+    assert matrix.N is vector.N
+    # Attributes which are not interned are still compared by value
+    assert layouts_are_equal(3, 3)
+    assert not layouts_are_equal(3, 2)
+
+
+@pytest.mark.parametrize("mutation", [
+    lambda d: d.__setitem__("u", 4),
+    lambda d: d.__setitem__("v", 1),
+    lambda d: d.__delitem__("u"),
+    lambda d: d.clear(),
+    lambda d: d.pop("u"),
+    lambda d: d.popitem(),
+    lambda d: d.setdefault("v", 1),
+    lambda d: d.update({"u": 4})
+])
+def test_component_layout_frozen(mutation):
+    layout = component_layout(_generate_N())
+    for frozen_dict in (layout.component_name_to_basis_component_index,
+                        layout.component_name_to_basis_component_length):
+        items = list(frozen_dict.items())
+        with pytest.raises(TypeError):
+            mutation(frozen_dict)
+        assert list(frozen_dict.items()) == items
+    # Interned layouts are unaffected by the rejected mutations
+    assert component_layout(_generate_N()) is layout
+
+
+def test_component_layout_pickle():
+    layout = component_layout(_generate_N())
+    index = pickle.loads(pickle.dumps(layout.component_name_to_basis_component_index))
+    length = pickle.loads(pickle.dumps(layout.component_name_to_basis_component_length))
+    # Frozen dictionaries are unpickled as their (mutable) base classes, preserving ordering
+    assert type(index) is ComponentNameToBasisComponentIndexDict
+    assert type(length) is OnlineSizeDict
+    assert list(index.items()) == [("u", 0), ("p", 1)]
+    assert list(length.items()) == [("u", 3), ("p", 2)]
+    length["u"] += 1
+    assert list(length.items()) == [("u", 4), ("p", 2)]
+    # An unpickled size dictionary is interned again to the original layout
+    assert component_layout(pickle.loads(pickle.dumps(layout.component_name_to_basis_component_length))) is layout
+
+
+def test_generate_from_N_and_kwargs_copy():
+    default = _generate_N()
+    N = _generate_N()
+    (generated_N, kwargs) = OnlineSizeDict.generate_from_N_and_kwargs(["u", "p"], default, N)
+    assert generated_N is not N
+    assert generated_N == N
+    # Incrementing the generated dictionary, as done to account for boundary conditions, leaves N unchanged
+    generated_N["u"] += 1
+    assert N["u"] == 3
+    # The same holds when N is an interned (and thus frozen) size dictionary
+    frozen_N = component_layout(_generate_N()).component_name_to_basis_component_length
+    (generated_N, kwargs) = OnlineSizeDict.generate_from_N_and_kwargs(["u", "p"], default, frozen_N)
+    assert type(generated_N) is OnlineSizeDict
+    generated_N["u"] += 1
+    assert list(generated_N.items()) == [("u", 4), ("p", 2)]
+    assert list(frozen_N.items()) == [("u", 3), ("p", 2)]
+    # Default dictionaries are copied as well
+    (generated_N, kwargs) = OnlineSizeDict.generate_from_N_and_kwargs(["u", "p"], default, None)
+    assert generated_N is not default
+    generated_N["p"] += 1
+    assert default["p"] == 2
@@ -0,0 +1,116 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import warnings
+import pytest
+from numpy import dot, eye, isclose, zeros
+from numpy.random import default_rng
+from rbnics.backends.abstract import LinearProblemWrapper
+from rbnics.backends.online.numpy import Function, KKTLinearSolver, LinearSolver, Matrix, Vector
+from rbnics.utils.io import OnlineSizeDict
+
+
+def _symmetric_positive_definite_matrix(N, rng):
+    A = rng.standard_normal((N, N))
+    return dot(A, A.T) + N * eye(N)
+
+
+def _transpose_state(K_py, rng):
+    # Transpose of the state block, up to round-off in entries which vanish
+    K_yp = K_py.T.copy()
+    K_yp[K_yp == 0.] = 1.e-18
+    return K_yp
+
+
+def _nonsymmetric_adjoint(K_py, rng):
+    return K_py.T + rng.standard_normal(K_py.T.shape)
+
+
+def _generate_optimality_system(Ny, Nu, generate_adjoint, state, rng):
+    # Optimality system
+    #     [K_yy    0   K_yp] [y]   [g_y]
+    #     [  0   K_uu  K_up] [u] = [g_u]
+    #     [K_py  K_pu    0 ] [p]   [g_p]
+    # with interlaced zero entries in the state block
+    K_py = _symmetric_positive_definite_matrix(Ny, rng)
+    for i in range(0, Ny, 2):
+        K_py[i, (i + 1) % Ny] = K_py[(i + 1) % Ny, i] = 0.
+    if state == "singular":
+        K_py[:, -1] = K_py[:, 0] + K_py[:, 1]
+    elif state == "nearly singular":
+        K_py[:, -1] = K_py[:, 0] + K_py[:, 1] + 1.e-12 * rng.standard_normal(Ny)
+    K_yp = generate_adjoint(K_py, rng)
+    K_pu = rng.standard_normal((Ny, Nu))
+    (y, u, p) = (slice(0, Ny), slice(Ny, Ny + Nu), slice(Ny + Nu, 2 * Ny + Nu))
+    A = zeros((2 * Ny + Nu, 2 * Ny + Nu))
+    A[y, y] = _symmetric_positive_definite_matrix(Ny, rng)
+    A[y, p] = K_yp
+    A[u, u] = _symmetric_positive_definite_matrix(Nu, rng)
+    A[u, p] = K_pu.T
+    A[p, y] = K_py
+    A[p, u] = K_pu
+    F = rng.standard_normal(2 * Ny + Nu)
+    return (A, F)
+
+
+@pytest.mark.parametrize("generate_adjoint", [_transpose_state, _nonsymmetric_adjoint])
+@pytest.mark.parametrize("state", ["nonsingular", "singular", "nearly singular"])
+@pytest.mark.parametrize("bcs", [None, {"y": (1., )}, {"y": (1., ), "p": (0., )}])
+def test_kkt_linear_solver(generate_adjoint, state, bcs):
+    (Ny, Nu) = (6, 3)
+    rng = default_rng(0)
+    (A_array, F_array) = _generate_optimality_system(Ny, Nu, generate_adjoint, state, rng)
+    N = OnlineSizeDict()
+    N["y"] = Ny
+    N["u"] = Nu
+    N["p"] = Ny
+
+    class ProblemWrapper(LinearProblemWrapper):
+        def matrix_eval(self):
+            A = Matrix(N, N)
+            A[:, :] = A_array
+            return A
+
+        def vector_eval(self):
+            F = Vector(N)
+            F[:] = F_array
+            return F
+
+        def bc_eval(self):
+            return bcs
+
+        def monitor(self, solution):
+            pass
+
+    factorizations = dict()
+    solution = Function(N)
+    with warnings.catch_warnings():
+        # Singular blocks must be detected without warnings
+        warnings.simplefilter("error")
+        solver = KKTLinearSolver(
+            ProblemWrapper(), solution, state_components=("y", ), control_components=("u", ),
+            adjoint_components=("p", ), factorizations=factorizations)
+        solver.solve()
+    # Compare to the monolithic solve of the standard linear solver
+    expected_solution = Function(N)
+    LinearSolver(ProblemWrapper(), expected_solution).solve()
+    assert isclose(solution.vector(), expected_solution.vector(), rtol=1.e-8, atol=1.e-10).all()
+    # Block elimination is carried out only when the system has the expected structure and the state block
+    # is not singular, and the adjoint block is factorized only when it is not the transpose of the state block
+    if bcs is None and state == "nonsingular":
+        assert "state" in factorizations
+        assert ("adjoint" in factorizations) is (generate_adjoint is _nonsymmetric_adjoint)
+        # Factorizations are reused by later solves with the same blocks
+        state_lu = factorizations["state"][1]
+        solver.solve()
+        assert factorizations["state"][1] is state_lu
+        assert isclose(solution.vector(), expected_solution.vector(), rtol=1.e-8, atol=1.e-10).all()
+    elif bcs is None and state == "nearly singular":
+        # The state block is factorized, but the solution by elimination is discarded because of its residual
+        assert "state" in factorizations
+    elif bcs is not None and "p" not in bcs:
+        # Boundary conditions on the state make the adjoint block singular
+        assert "adjoint" not in factorizations
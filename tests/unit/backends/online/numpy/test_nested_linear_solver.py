@@ -0,0 +1,65 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import dot, eye, isclose
+from numpy.linalg import solve
+from numpy.random import default_rng
+from rbnics.backends.abstract import LinearProblemWrapper
+from rbnics.backends.online.numpy import Function, Matrix, NestedLinearSolver, Vector
+
+
+def _symmetric_positive_definite_matrix(N, rng):
+    A = rng.standard_normal((N, N))
+    return dot(A, A.T) + N * eye(N)
+
+
+def _symmetric_indefinite_matrix(N, rng):
+    # Saddle point matrix, with interlaced primal and dual unknowns as in reduced Stokes problems
+    A = _symmetric_positive_definite_matrix(N, rng)
+    for i in range(1, N, 2):
+        A[i, i] = 0.
+    return A
+
+
+def _nonsymmetric_matrix(N, rng):
+    return _symmetric_positive_definite_matrix(N, rng) + rng.standard_normal((N, N))
+
+
+@pytest.mark.parametrize("generate_matrix", [
+    _symmetric_positive_definite_matrix, _symmetric_indefinite_matrix, _nonsymmetric_matrix])
+def test_nested_linear_solver(generate_matrix):
+    Nmax = 10
+    rng = default_rng(0)
+    A_array = generate_matrix(Nmax, rng)
+    F_array = rng.standard_normal(Nmax)
+
+    class ProblemWrapper(LinearProblemWrapper):
+        def matrix_eval(self):
+            A = Matrix(Nmax, Nmax)
+            A[:, :] = A_array
+            return A
+
+        def vector_eval(self):
+            F = Vector(Nmax)
+            F[:] = F_array
+            return F
+
+        def bc_eval(self):
+            return None
+
+        def monitor(self, solution):
+            pass
+
+    solution = Function(Nmax)
+    solver = NestedLinearSolver(ProblemWrapper(), solution)
+    solver.solve()
+    assert isclose(solution.vector(), solve(A_array, F_array)).all()
+    for N in range(1, Nmax):
+        nested_solution = Function(N)
+        solver.solve_nested(nested_solution)
+        expected_nested_solution = solve(A_array[:N, :N], F_array[:N])
+        assert isclose(nested_solution.vector(), expected_nested_solution).all()
@@ -0,0 +1,69 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import array, diag, dot, eye, isclose
+from numpy.random import default_rng
+from scipy.optimize._nonlin import nonlin_solve
+from rbnics.backends.abstract import NonlinearProblemWrapper
+from rbnics.backends.online.numpy import Function, Matrix, NonlinearSolver, Vector
+
+
+# Reduced residual A u + u^3 - f, as obtained by the reduction of a semilinear elliptic problem
+def _generate_problem(N, rng):
+    A = rng.standard_normal((N, N))
+    A = dot(A, A.T) + N * eye(N)
+    f = 10. * rng.standard_normal(N)
+
+    def residual(u):
+        return dot(A, u) + u**3 - f
+
+    def jacobian(u):
+        return A + diag(3. * u**2)
+
+    return (residual, jacobian)
+
+
+@pytest.mark.parametrize("parameters", [
+    {},
+    {"line_search": False},
+    {"jacobian_reuse": 2},
+    {"absolute_tolerance": 1e-12, "maximum_iterations": 50}
+])
+def test_nonlinear_solver(parameters):
+    N = 10
+    rng = default_rng(0)
+    (residual, jacobian) = _generate_problem(N, rng)
+    monitored_solutions = list()
+
+    class ProblemWrapper(NonlinearProblemWrapper):
+        def residual_eval(self, solution):
+            r = Vector(N)
+            r[:] = residual(array(solution.vector()))
+            return r
+
+        def jacobian_eval(self, solution):
+            J = Matrix(N, N)
+            J[:, :] = jacobian(array(solution.vector()))
+            return J
+
+        def bc_eval(self):
+            return None
+
+        def monitor(self, solution):
+            monitored_solutions.append(array(solution.vector()))
+
+    solution = Function(N)
+    solver = NonlinearSolver(ProblemWrapper(), solution)
+    solver.set_parameters(parameters)
+    solver.solve()
+    # Compare to scipy's nonlin_solve, which was employed before the native Newton solver
+    expected_solution = nonlin_solve(
+        residual, array(Function(N).vector()), jacobian=jacobian, f_tol=parameters.get("absolute_tolerance"),
+        line_search="armijo" if parameters.get("line_search", True) else None)
+    assert isclose(solution.vector(), expected_solution, rtol=1e-6, atol=1e-8).all()
+    assert len(monitored_solutions) == 1
+    assert isclose(monitored_solutions[0], solution.vector()).all()
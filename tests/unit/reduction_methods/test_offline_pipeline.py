@@ -0,0 +1,152 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import pytest
+from rbnics.reduction_methods.base import OfflinePipeline
+
+
+# Mock EIM approximation of a parametrized expression involving the solution of other problems
+class MockParametrizedExpression(object):
+    def __init__(self, auxiliary_problems):
+        self._auxiliary_problems = auxiliary_problems
+
+    def auxiliary_problems_and_components(self):
+        if len(self._auxiliary_problems) == 0:
+            return None
+        else:
+            return set((problem, None) for problem in self._auxiliary_problems)
+
+
+class MockEIMApproximation(object):
+    def __init__(self, auxiliary_problems):
+        self.parametrized_expression = MockParametrizedExpression(auxiliary_problems)
+
+
+class MockEIMReductionMethod(object):
+    def __init__(self, auxiliary_problems):
+        self.EIM_approximation = MockEIMApproximation(auxiliary_problems)
+
+
+# Mock reduction method, which records the order in which offline stages are carried out
+class MockReductionMethod(object):
+    def __init__(self, name, auxiliary_problems, offline_calls):
+        self.truth_problem = "truth problem " + name
+        self.reduced_problem = "reduced problem " + name
+        self.EIM_reductions = {0: MockEIMReductionMethod([
+            auxiliary_problem.truth_problem for auxiliary_problem in auxiliary_problems])}
+        self._offline_calls = offline_calls
+
+    def offline(self):
+        self._offline_calls.append(self)
+        return self.reduced_problem
+
+
+def test_offline_pipeline_stages():
+    offline_calls = list()
+    stokes = MockReductionMethod("stokes", [], offline_calls)
+    heat = MockReductionMethod("heat", [], offline_calls)
+    advection_diffusion = MockReductionMethod("advection diffusion", [stokes], offline_calls)
+    reaction = MockReductionMethod("reaction", [advection_diffusion, heat], offline_calls)
+    pipeline = OfflinePipeline(reaction, advection_diffusion, stokes, heat)
+    assert pipeline.stages() == [[stokes, heat], [advection_diffusion], [reaction]]
+    reduced_problems = pipeline.offline()
+    assert reduced_problems == [reaction.reduced_problem, advection_diffusion.reduced_problem,
+                                stokes.reduced_problem, heat.reduced_problem]
+    assert offline_calls == [stokes, heat, advection_diffusion, reaction]
+
+
+def test_offline_pipeline_additional_dependency():
+    offline_calls = list()
+    stokes = MockReductionMethod("stokes", [], offline_calls)
+    heat = MockReductionMethod("heat", [], offline_calls)
+    pipeline = OfflinePipeline(stokes, heat)
+    pipeline.add_dependency(stokes, heat)
+    assert pipeline.dependencies() == {stokes: [heat], heat: []}
+    assert pipeline.stages() == [[heat], [stokes]]
+    pipeline.add_dependency(heat, stokes)
+    with pytest.raises(RuntimeError):
+        pipeline.stages()
+
+
+# Mock truth problem, which appends the id of the exporting process to the exported files
+class MockTruthProblem(object):
+    def __init__(self, name, directory):
+        self._name = name
+        self._directory = directory
+
+    def name(self):
+        return self._name
+
+    def export_solution(self, folder=None, filename=None, solution=None, component=None, suffix=None):
+        with open(os.path.join(str(self._directory), self._name + "_" + filename), "a") as file_:
+            file_.write(str(os.getpid()) + "\n")
+
+    def export_output(self, folder=None, filename=None, output=None, suffix=None):
+        self.export_solution(folder, filename + "_output")
+
+    def exporting_processes(self, filename):
+        filename = os.path.join(str(self._directory), self._name + "_" + filename)
+        if not os.path.exists(filename):
+            return list()
+        with open(filename, "r") as file_:
+            return [int(pid) for pid in file_.read().split()]
+
+
+# Mock reduction method, which solves auxiliary problems (storing their solution in the cache) and then stores
+# its own offline data
+class MockReductionMethodWithFiles(MockReductionMethod):
+    def __init__(self, name, auxiliary_problems, directory, fail=False):
+        MockReductionMethod.__init__(self, name, auxiliary_problems, list())
+        self.truth_problem = MockTruthProblem(name, directory)
+        self._auxiliary_problems = [auxiliary_problem.truth_problem for auxiliary_problem in auxiliary_problems]
+        self._fail = fail
+
+    def offline(self):
+        if self._fail:
+            raise RuntimeError("Offline stage failed")
+        for auxiliary_problem in self._auxiliary_problems:
+            auxiliary_problem.export_solution(filename="cache")
+            auxiliary_problem.export_output(filename="cache")
+        self.truth_problem.export_solution(filename="offline")
+        return self.reduced_problem
+
+
+def test_offline_pipeline_processes(tempdir):
+    stokes = MockReductionMethodWithFiles("stokes", [], tempdir)
+    advection_diffusion = MockReductionMethodWithFiles("advection_diffusion", [stokes], tempdir)
+    heat = MockReductionMethodWithFiles("heat", [stokes], tempdir)
+    pipeline = OfflinePipeline(stokes, advection_diffusion, heat)
+    assert pipeline.stages() == [[stokes], [advection_diffusion, heat]]
+    reduced_problems = pipeline.offline(processes=2)
+    assert reduced_problems == [stokes.reduced_problem, advection_diffusion.reduced_problem, heat.reduced_problem]
+    # Reduction methods of the second stage carry out their offline stage in separate processes, and then
+    # in the current one
+    pid = os.getpid()
+    assert stokes.truth_problem.exporting_processes("offline") == [pid]
+    advection_diffusion_pids = advection_diffusion.truth_problem.exporting_processes("offline")
+    heat_pids = heat.truth_problem.exporting_processes("offline")
+    assert len(advection_diffusion_pids) == 2 and advection_diffusion_pids[1] == pid
+    assert len(heat_pids) == 2 and heat_pids[1] == pid
+    assert advection_diffusion_pids[0] not in (pid, heat_pids[0])
+    # Separate processes do not write the cache files of the shared auxiliary problem
+    assert stokes.truth_problem.exporting_processes("cache") == [pid, pid]
+    assert stokes.truth_problem.exporting_processes("cache_output") == [pid, pid]
+    # ... while the current process is not affected by the patches of separate processes
+    stokes.truth_problem.export_solution(filename="cache")
+    assert stokes.truth_problem.exporting_processes("cache") == [pid, pid, pid]
+
+
+def test_offline_pipeline_processes_failure(tempdir):
+    stokes = MockReductionMethodWithFiles("stokes", [], tempdir)
+    advection_diffusion = MockReductionMethodWithFiles("advection_diffusion", [stokes], tempdir, fail=True)
+    heat = MockReductionMethodWithFiles("heat", [stokes], tempdir)
+    pipeline = OfflinePipeline(stokes, advection_diffusion, heat)
+    with pytest.raises(RuntimeError) as excinfo:
+        pipeline.offline(processes=2)
+    assert "advection_diffusion" in str(excinfo.value)
+    # The other separate process of the same stage is still carried out
+    assert len(heat.truth_problem.exporting_processes("offline")) == 1
@@ -4,7 +4,9 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+import pytest
 from math import log
+from mpi4py.MPI import COMM_SELF, COMM_WORLD
 from numpy import linspace, random
 import scipy.stats as stats
 import matplotlib
@@ -12,6 +14,7 @@ import matplotlib.pyplot as plt
 from distutils.version import LooseVersion
 from rbnics.sampling import ParameterSpaceSubset
 from rbnics.sampling.distributions import DrawFrom, EquispacedDistribution, LogUniformDistribution, UniformDistribution
+from rbnics.utils.mpi import parallel_io
 
 # Common data
 box = [(2., 5.), (10., 1000.)]
@@ -186,3 +189,21 @@ def test_sampling_composite_log_uniform_and_beta():
     plot(0, box, parameter_space_subset, bins, stats_loguniform, loc=box[0][min], scale=box[0][max] - box[0][min])
     plot(1, box, parameter_space_subset, bins, stats.beta, a=2, b=5, loc=box[1][min], scale=box[1][max] - box[1][min])
     plt.show()
+
+
+# Test distribution of a parameter space subset among groups of processes
+def test_distribute_enumeration():
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.generate(box[:1], 11)
+    parameter_space_subset.distribute_enumeration(COMM_SELF)  # each process is a group
+    local_indices = [mu_index for (mu_index, _) in parameter_space_subset.enumerate_local()]
+    all_indices = sorted(sum(COMM_WORLD.allgather(local_indices), []))
+    assert all_indices == list(range(11))
+    for (mu_index, mu) in parameter_space_subset.enumerate_local():
+        assert mu == parameter_space_subset[mu_index]
+    # Parallel I/O is carried out on the group communicator only inside the with statement, even on errors
+    with pytest.raises(RuntimeError):
+        with parameter_space_subset.distributed_io():
+            assert parallel_io(lambda: COMM_WORLD.rank) == COMM_WORLD.rank
+            raise RuntimeError("Interrupt the loop over the testing set")
+    assert parallel_io(lambda: COMM_WORLD.rank) == 0
@@ -0,0 +1,59 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from rbnics.utils.cache import Cache
+
+
+def _generate_cache():
+    # Cache stored both in RAM and on disk, where the disk storage is mocked by a dict
+    disk = dict()
+
+    def import_(filename):
+        try:
+            return disk[filename]
+        except KeyError:
+            raise OSError
+
+    cache = Cache(
+        "problems",
+        key_generator=lambda mu: mu,
+        import_=import_,
+        export=lambda filename: disk.__setitem__(filename, "exported " + filename),
+        filename_generator=lambda mu: str(mu)
+    )
+    return (cache, disk)
+
+
+def test_cache_clear():
+    (cache, disk) = _generate_cache()
+    cache[1] = "value"
+    assert disk == {"1": "exported 1"}
+    cache.clear()
+    assert 1 not in cache
+    # Clearing only affects RAM storage, hence the key is still loaded from disk
+    assert cache[1] == "exported 1"
+
+
+def test_cache_bypass():
+    (cache, disk) = _generate_cache()
+    cache[1] = "value"
+    with cache.bypass():
+        # Keys are neither found in RAM nor on disk ...
+        assert 1 not in cache
+        with pytest.raises(KeyError):
+            cache[1]
+        # ... and keys set within the context are not exported
+        cache[2] = "other value"
+        with pytest.raises(KeyError):
+            cache[2]
+    assert disk == {"1": "exported 1"}
+    # Keys set within the context are stored in RAM when leaving the context
+    assert cache[1] == "value"
+    assert cache[2] == "other value"
+    cache.clear()
+    with pytest.raises(KeyError):
+        cache[2]
@@ -0,0 +1,81 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from rbnics.problems.base import ParametrizedProblem
+from rbnics.utils.decorators import sync_setters
+from rbnics.utils.decorators.sync_setters import sync_setters__eager
+
+
+class CountingProblem(ParametrizedProblem):
+    def __init__(self, folder_prefix):
+        ParametrizedProblem.__init__(self, folder_prefix)
+        self.set_mu_calls = 0
+
+    def set_mu(self, mu):
+        ParametrizedProblem.set_mu(self, mu)
+        self.set_mu_calls += 1
+
+
+class SyncedProblem(CountingProblem):
+    @sync_setters("truth_problem", "set_mu", "mu")
+    @sync_setters("truth_problem", "set_mu_range", "mu_range")
+    def __init__(self, truth_problem, folder_prefix):
+        CountingProblem.__init__(self, folder_prefix)
+        self.truth_problem = truth_problem
+
+
+def test_sync_setters_lazy_set_mu():
+    truth_problem = CountingProblem("truth")
+    truth_problem.set_mu_range([(0., 1.), (2., 3.)])
+    synced_problem_1 = SyncedProblem(truth_problem, "synced_1")
+    synced_problem_2 = SyncedProblem(truth_problem, "synced_2")
+    assert synced_problem_1.mu == synced_problem_2.mu == truth_problem.mu == (0., 2.)
+    set_mu_calls = (truth_problem.set_mu_calls, synced_problem_2.set_mu_calls)
+    for i in range(10):
+        synced_problem_1.set_mu((i / 10., 2.5))
+    # Other synced objects have not been updated yet, ...
+    assert (truth_problem.set_mu_calls, synced_problem_2.set_mu_calls) == set_mu_calls
+    # ... but they pull the latest value as soon as they access it
+    assert truth_problem.mu == synced_problem_2.mu == (0.9, 2.5)
+    assert (truth_problem.set_mu_calls, synced_problem_2.set_mu_calls) == (set_mu_calls[0] + 1, set_mu_calls[1] + 1)
+    # Changing the range also propagates the new mu
+    synced_problem_2.set_mu_range([(1., 2.)])
+    assert truth_problem.mu == synced_problem_1.mu == synced_problem_2.mu == (1., )
+    assert truth_problem.mu_range == synced_problem_1.mu_range == [(1., 2.)]
+
+
+def test_sync_setters_eager_set_mu():
+    truth_problem = CountingProblem("truth")
+    truth_problem.set_mu_range([(0., 1.)])
+    synced_problem = SyncedProblem(truth_problem, "synced")
+    sync_setters__eager(truth_problem, "set_mu")
+    set_mu_calls = truth_problem.set_mu_calls
+    synced_problem.set_mu((0.5, ))
+    assert truth_problem.set_mu_calls == set_mu_calls + 1
+    assert truth_problem.__dict__["mu"] == (0.5, )
+
+
+def test_sync_setters_lazy_attribute_scope():
+    truth_problem = CountingProblem("truth")
+    truth_problem.set_mu_range([(0., 1.)])
+    unsynced_problem = CountingProblem("unsynced")
+    unsynced_problem.set_mu_range([(0., 1.)])
+    synced_problem = SyncedProblem(truth_problem, "synced")
+    # Synced objects pull the latest value through a descriptor installed on a subclass of their class, ...
+    for (problem, ProblemClass) in ((truth_problem, CountingProblem), (synced_problem, SyncedProblem)):
+        assert type(problem) is not ProblemClass
+        assert isinstance(problem, ProblemClass)
+        assert type(problem).__name__ == ProblemClass.__name__
+        assert "mu" in vars(type(problem))
+    # Such subclass is shared by all synced objects of the same class
+    assert type(SyncedProblem(truth_problem, "other_synced")) is type(synced_problem)
+    # ... so that objects of the same classes which are not synced are not affected
+    assert type(unsynced_problem) is CountingProblem
+    assert not hasattr(CountingProblem, "mu")
+    assert not hasattr(SyncedProblem, "mu")
+    unsynced_problem.set_mu((0.5, ))
+    assert unsynced_problem.mu == (0.5, )
+    assert truth_problem.mu == synced_problem.mu == (0., )
@@ -0,0 +1,81 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from mpi4py.MPI import COMM_SELF
+from numpy import isclose, random
+from rbnics.sampling import ParameterSpaceSubset
+from rbnics.utils.io import PerformanceTable
+
+# Common data
+box = [(0., 1.)]
+ntest = 20
+Nmax = 4
+
+
+def fill_table(values, streaming):
+    testing_set = ParameterSpaceSubset()
+    testing_set.generate(box, ntest)
+    if streaming:
+        PerformanceTable.enable_streaming()
+    try:
+        table = PerformanceTable(testing_set)
+    finally:
+        PerformanceTable.disable_streaming()
+    table.set_Nmax(Nmax)
+    table.add_column("error", group_name="error", operations=("min", "mean", "max"))
+    table.add_column("estimator", group_name="estimator", operations=("min", "mean", "max"))
+    for (mu_index, _) in testing_set.enumerate_local():
+        table["error", range(1, Nmax + 1), mu_index] = values[:, mu_index]
+        for n in range(1, Nmax + 1):
+            table["estimator", n, mu_index] = NotImplemented if n == 2 else 2. * table["error", n, mu_index]
+    return table
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_performance_table_statistics(streaming):
+    values = random.rand(Nmax, ntest)
+    values[1, 0] = 0.
+    table = fill_table(values, streaming)
+    groups_content = table._process()
+    (_, _, error_content, _) = groups_content["error"]
+    assert isclose(error_content["min_error"], values.min(axis=1)).all()
+    assert isclose(error_content["max_error"], values.max(axis=1)).all()
+    values[1, 0] = 2.220446049250313e-16
+    assert isclose(error_content["gmean_error"], (values**(1. / ntest)).prod(axis=1)).all()
+    (table_index, _, estimator_content, _) = groups_content["estimator"]
+    assert isclose(estimator_content["max_estimator"][[0, 2, 3]], 2. * values[[0, 2, 3]].max(axis=1)).all()
+    assert all(estimator_content[index][1] != estimator_content[index][1] for index in table_index[1:])  # nan
+
+
+def test_performance_table_streaming_previous_parameters():
+    table = fill_table(random.rand(Nmax, ntest), True)
+    with pytest.raises(ValueError):
+        table["error", 1, 0]
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_performance_table_merge_partial_tables(streaming):
+    values = random.RandomState(0).rand(Nmax, ntest)  # same values on every process
+    testing_set = ParameterSpaceSubset()
+    testing_set.generate(box, ntest)
+    testing_set.distribute_enumeration(COMM_SELF)  # each process is a group
+    if streaming:
+        PerformanceTable.enable_streaming()
+    try:
+        table = PerformanceTable(testing_set)
+    finally:
+        PerformanceTable.disable_streaming()
+    table.set_Nmax(Nmax)
+    table.add_column("error", group_name="error", operations=("min", "mean", "max"))
+    for (mu_index, _) in testing_set.enumerate_local():
+        table["error", range(1, Nmax + 1), mu_index] = values[:, mu_index]
+    table.merge_partial_tables()
+    groups_content = table._process()
+    (_, _, error_content, _) = groups_content["error"]
+    assert isclose(error_content["min_error"], values.min(axis=1)).all()
+    assert isclose(error_content["gmean_error"], (values**(1. / ntest)).prod(axis=1)).all()
+    assert isclose(error_content["max_error"], values.max(axis=1)).all()
@@ -0,0 +1,53 @@
+# Copyright (C) 2015-2023 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import time
+from mpi4py.MPI import COMM_SELF
+from rbnics.utils.io import PhaseTimer, Timer
+
+
+def test_timer_repeat():
+    calls = list()
+
+    def setup():
+        calls.append("setup")
+
+    def function():
+        calls.append("function")
+        return len(calls)
+
+    timer = Timer("serial", COMM_SELF)
+    (output, elapsed) = timer.repeat(function, warm_up=2, repeats=3, statistic="median", setup=setup)
+    assert calls == ["setup", "function"] * 5
+    assert output == 10
+    assert elapsed >= 0.
+
+
+def test_timer_statistic():
+    assert Timer.statistic([3., 1., 2.], "min") == 1.
+    assert Timer.statistic([3., 1., 2.], "median") == 2.
+
+
+def test_phase_timer_nested_phases():
+    timer = PhaseTimer("serial", COMM_SELF)
+
+    def inner():
+        time.sleep(0.02)
+
+    timed_inner = timer.wrap("inner", inner)
+
+    def outer():
+        time.sleep(0.01)
+        timed_inner()
+
+    timed_outer = timer.wrap("outer", outer)
+    timer.start()
+    timed_outer()
+    elapsed = timer.stop()
+    assert timer.phase_elapsed("inner") >= 0.02
+    assert timer.phase_elapsed("outer") >= 0.01
+    assert elapsed >= timer.phase_elapsed("inner") + timer.phase_elapsed("outer")
+    assert timer.phase_elapsed("other") == 0.
@@ -5,8 +5,8 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 import pytest
-from mpi4py.MPI import COMM_WORLD
-from rbnics.utils.mpi import parallel_io
+from mpi4py.MPI import COMM_SELF, COMM_WORLD
+from rbnics.utils.mpi import parallel_io, parallel_io_default_mpi_comm
 
 
 def test_parallel_io_without_return_value():
@@ -23,6 +23,16 @@ def test_parallel_io_with_return_value():
     assert return_value == 0
 
 
+def test_parallel_io_with_default_mpi_comm():
+    def task():
+        return COMM_WORLD.rank
+    with parallel_io_default_mpi_comm(COMM_SELF):
+        return_value = parallel_io(task)
+    assert return_value == COMM_WORLD.rank
+    return_value = parallel_io(task)
+    assert return_value == 0
+
+
 def test_parallel_io_with_error_1():
     exception_message = "This test will fail"
 